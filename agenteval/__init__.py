@@ -6,10 +6,13 @@ from agenteval.models import (
     AgentResponse, Checkpoint, EvalResult, Run, Scenario, ToolCall, Turn,
 )
 from agenteval.runner import run_scenarios
-from agenteval.scenario import load_scenario, load_scenarios_from_dir, validate_dag
+from agenteval.scenario import (
+    ScenarioRef, iter_scenario_refs, iter_scenarios, load_scenario, load_scenarios_from_dir, validate_dag,
+)
 
 __all__ = [
     "AgentAdapter", "AgentResponse", "Checkpoint", "EvalResult",
-    "Run", "Scenario", "SessionContext", "ToolCall", "Turn",
-    "load_scenario", "load_scenarios_from_dir", "run_scenarios", "validate_dag",
+    "Run", "Scenario", "ScenarioRef", "SessionContext", "ToolCall", "Turn",
+    "iter_scenario_refs", "iter_scenarios", "load_scenario", "load_scenarios_from_dir",
+    "run_scenarios", "validate_dag",
 ]
@@ -28,3 +28,13 @@ class AgentAdapter(ABC):
     @abstractmethod
     async def reset(self) -> None:
         ...
+
+    def version(self) -> str | None:
+        """A string that changes whenever the agent's behaviour may change.
+
+        Used to fingerprint evaluations so ``agenteval run --incremental`` can
+        reuse results of unchanged scenarios. Override it (e.g. to return a
+        hash of your prompts and tool definitions); None means unknown, and
+        such an agent is always re-run.
+        """
+        return None
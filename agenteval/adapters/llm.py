@@ -1,6 +1,7 @@
 """LLM-based agent adapter with swappable providers (Anthropic, OpenAI)."""
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 from typing import Any, Callable
@@ -59,6 +60,11 @@ class LLMAdapter(AgentAdapter):
         self._history: list[dict] = []
         self._client: Any = None
 
+    def version(self) -> str:
+        """Hash of the provider, model, system prompt and tool definitions."""
+        config = [self.provider, self.model, self.system_prompt, self.tools_config]
+        return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
+
     def _get_client(self) -> Any:
         if self._client is not None:
             return self._client
@@ -97,13 +103,44 @@ class LLMAdapter(AgentAdapter):
 
     async def send_message(self, message: str, context: SessionContext) -> AgentResponse:
         self._history.append({"role": "user", "content": message})
+        return await self._send(self._history)
+
+    async def complete(self, message: str, system_prompt: str = "") -> AgentResponse:
+        """Send a one-off message outside the conversation history.
+
+        Only the provider and model are used: the request carries
+        ``system_prompt`` instead of the adapter's own and offers no tools, so
+        the tool handler is never called. Safe to call concurrently, e.g. to
+        use the adapter as a judge model.
+        """
+        client = self._get_client()
+        messages: list[dict] = [{"role": "user", "content": message}]
+        if self.provider == "anthropic":
+            kwargs: dict[str, Any] = {"model": self.model, "max_tokens": 4096, "messages": messages}
+            if system_prompt:
+                kwargs["system"] = system_prompt
+            response = await client.messages.create(**kwargs)
+            text = "\n".join(block.text for block in response.content if block.type == "text")
+            tokens = response.usage.input_tokens + response.usage.output_tokens
+        elif self.provider == "openai":
+            if system_prompt:
+                messages.insert(0, {"role": "system", "content": system_prompt})
+            response = await client.chat.completions.create(model=self.model, messages=messages)
+            text = response.choices[0].message.content or ""
+            usage = response.usage
+            tokens = usage.prompt_tokens + usage.completion_tokens if usage else 0
+        else:
+            raise ValueError(f"Unknown provider: {self.provider}")
+        return AgentResponse(message=text, metadata={"tokens": tokens})
+
+    async def _send(self, history: list[dict]) -> AgentResponse:
         if self.provider == "anthropic":
-            return await self._send_anthropic()
+            return await self._send_anthropic(history)
         if self.provider == "openai":
-            return await self._send_openai()
+            return await self._send_openai(history)
         raise ValueError(f"Unknown provider: {self.provider}")
 
-    async def _send_anthropic(self) -> AgentResponse:
+    async def _send_anthropic(self, history: list[dict]) -> AgentResponse:
         client = self._get_client()
         collected_tools: list[ToolCall] = []
         state_changes: dict[str, Any] = {}
@@ -114,7 +151,7 @@ class LLMAdapter(AgentAdapter):
             kwargs: dict[str, Any] = {
                 "model": self.model,
                 "max_tokens": 4096,
-                "messages": self._history,
+                "messages": history,
             }
             if self.system_prompt:
                 kwargs["system"] = self.system_prompt
@@ -132,7 +169,7 @@ class LLMAdapter(AgentAdapter):
                     tool_uses.append(block)
 
             # Store assistant response in history
-            self._history.append({"role": "assistant", "content": response.content})
+            history.append({"role": "assistant", "content": response.content})
 
             if tool_uses and self.tool_handler:
                 tool_results = []
@@ -148,7 +185,7 @@ class LLMAdapter(AgentAdapter):
                         "tool_use_id": tu.id,
                         "content": _serialize_tool_result(result),
                     })
-                self._history.append({"role": "user", "content": tool_results})
+                history.append({"role": "user", "content": tool_results})
                 continue
 
             return AgentResponse(
@@ -158,7 +195,7 @@ class LLMAdapter(AgentAdapter):
                 metadata={"tokens": total_tokens},
             )
 
-    async def _send_openai(self) -> AgentResponse:
+    async def _send_openai(self, history: list[dict]) -> AgentResponse:
         client = self._get_client()
         collected_tools: list[ToolCall] = []
         state_changes: dict[str, Any] = {}
@@ -169,7 +206,7 @@ class LLMAdapter(AgentAdapter):
         messages: list[dict] = []
         if self.system_prompt:
             messages.append({"role": "system", "content": self.system_prompt})
-        messages.extend(self._history)
+        messages.extend(history)
 
         while True:
             kwargs: dict[str, Any] = {"model": self.model, "messages": messages}
@@ -196,7 +233,7 @@ class LLMAdapter(AgentAdapter):
                     for tc in choice.message.tool_calls
                 ]
                 messages.append(assistant_msg)
-                self._history.append(assistant_msg)
+                history.append(assistant_msg)
 
                 if choice.message.content:
                     all_text.append(choice.message.content)
@@ -215,13 +252,13 @@ class LLMAdapter(AgentAdapter):
                         "content": _serialize_tool_result(result),
                     }
                     messages.append(tool_msg)
-                    self._history.append(tool_msg)
+                    history.append(tool_msg)
                 continue
 
             text = choice.message.content or ""
             if text:
                 all_text.append(text)
-            self._history.append({"role": "assistant", "content": text})
+            history.append({"role": "assistant", "content": text})
 
             return AgentResponse(
                 message="\n".join(all_text),
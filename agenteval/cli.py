@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import importlib
+import uuid
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 import yaml
@@ -12,8 +16,16 @@ from rich.console import Console
 
 from agenteval import __version__
 
+if TYPE_CHECKING:
+    from agenteval.adapters.base import AgentAdapter
+    from agenteval.models import EvalResult
+    from agenteval.scenario import ScenarioRef
+    from agenteval.storage.base import StorageBackend
+
 app = typer.Typer(name="agenteval", help="Agent testing framework")
 console = Console()
+# Progress goes to stderr so reports on stdout (``run --output json``) can be piped.
+err_console = Console(stderr=True)
 
 
 def _version_cb(value: bool) -> None:
@@ -38,6 +50,7 @@ def init(project_path: str) -> None:
         "project": project_dir.name,
         "agent": "agents.my_agent:MyAdapter",
         "scenarios": "scenarios/",
+        "scenario_cache": ".agenteval/scenarios.cache",
         "k": 3,
         "thresholds": {"min_pass_k": 0.8, "min_tool_accuracy": 0.9},
     }
@@ -55,6 +68,84 @@ def init(project_path: str) -> None:
     console.print(f"[green]Created agenteval project at {project_dir}[/green]")
 
 
+async def _run_all(
+    adapter: AgentAdapter,
+    scenarios: list[ScenarioRef],
+    k: int,
+    project: str,
+    store: StorageBackend | None,
+    incremental: bool = False,
+    agent_version: str | None = None,
+    shard: tuple[int, int] | None = None,
+    order: str = "file",
+    live: bool = False,
+    plan_as_of: datetime | None = None,
+) -> list[EvalResult]:
+    """Run every scenario, persisting runs as they finish and results as they complete.
+
+    Each result is fingerprinted from the scenario, ``agent_version`` and k. With
+    ``incremental``, a stored result with the same fingerprint is reused instead.
+    ``shard`` (1-based ``(i, n)``) is balanced on the durations of results stored
+    before ``plan_as_of``, or on scenario count without it, so every job gets the
+    same plan; ``order`` uses all stored durations. Only this shard's scenarios
+    are built and validated. ``live`` shows a ``Dashboard`` instead of a line
+    per scenario.
+    """
+    from agenteval.fingerprint import evaluation_fingerprint
+    from agenteval.runner import RunEvent, run_scenarios
+    from agenteval.scenario import validate_dag
+    from agenteval.selection import order_scenarios, shard_scenarios
+
+    if store is not None:
+        await store.init()
+    results = []
+    try:
+        if shard is not None:
+            pinned = {}
+            if store is not None and plan_as_of is not None:
+                pinned = await store.scenario_durations(project, until=plan_as_of)
+            scenarios = shard_scenarios(scenarios, *shard, durations=pinned)
+        if order != "file":
+            durations = await store.scenario_durations(project) if store is not None else {}
+            scenarios = order_scenarios(scenarios, order, durations)
+        scenarios = [ref.build() for ref in scenarios]
+        for sc in scenarios:
+            validate_dag(sc)
+        dashboard = None
+        if live:
+            from agenteval.dashboard import Dashboard
+            dashboard = Dashboard(len(scenarios), console=err_console)
+        on_event = dashboard.events.put if dashboard is not None else None
+        async with dashboard or contextlib.nullcontext():
+            for sc in scenarios:
+                fingerprint = evaluation_fingerprint(sc, agent_version, k)
+                if incremental and store is not None and fingerprint is not None:
+                    previous = await store.find_result(project, sc.name, fingerprint)
+                    if previous is not None:
+                        if on_event is not None:
+                            on_event(RunEvent("scenario_skipped", sc.name))
+                        else:
+                            err_console.print(f"Reusing [cyan]{sc.name}[/cyan] (unchanged)")
+                        results.append(previous)
+                        continue
+                if on_event is None:
+                    err_console.print(f"Running [cyan]{sc.name}[/cyan] (k={k})...")
+                on_run = partial(store.save_run, project=project, tags=sc.tags) if store else None
+                result = await run_scenarios(
+                    adapter, sc, k=k, project=project, on_run=on_run,
+                    run_id_prefix=f"{sc.name}-{uuid.uuid4().hex[:8]}", on_event=on_event,
+                )
+                result.fingerprint = fingerprint
+                result.agent_version = agent_version
+                if store is not None:
+                    await store.save_result(result)
+                results.append(result)
+    finally:
+        if store is not None:
+            await store.close()
+    return results
+
+
 @app.command()
 def run(
     scenario: Optional[str] = typer.Argument(None),
@@ -64,11 +155,56 @@ def run(
     project: str = typer.Option("default", "--project"),
     output: str = typer.Option("table", "--output"),
     ci: bool = typer.Option(False, "--ci"),
+    db: Optional[str] = typer.Option(None, "--db", help="SQLite file to persist runs and results in"),
+    log_dir: Optional[str] = typer.Option(
+        None, "--log-dir", help="Append runs to a segment log instead, for many concurrent workers",
+    ),
+    scenario_cache: Optional[str] = typer.Option(
+        None, "--scenario-cache", help="File caching parsed scenarios between invocations",
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", help="Processes for parsing large scenario directories (default: CPUs)",
+    ),
+    incremental: bool = typer.Option(
+        False, "--incremental", help="Reuse stored results of scenarios whose inputs are unchanged",
+    ),
+    agent_version: Optional[str] = typer.Option(
+        None, "--agent-version", help="Agent version for fingerprints, overriding the adapter's own",
+    ),
+    tags: str = typer.Option("", "--tags", help="Comma-separated; run only scenarios with any of these tags"),
+    exclude_tags: str = typer.Option(
+        "", "--exclude-tags", help="Comma-separated; skip scenarios with any of these",
+    ),
+    shard: Optional[str] = typer.Option(
+        None, "--shard", help="Run only shard i of n ('i/n'); balanced on durations with --plan-as-of",
+    ),
+    plan_as_of: Optional[str] = typer.Option(
+        None, "--plan-as-of",
+        help="ISO timestamp; balance shards on results stored before it, so every job plans alike",
+    ),
+    order: str = typer.Option("file", "--order", help="'file' or 'longest' (expected duration first)"),
+    live: Optional[bool] = typer.Option(
+        None, "--live/--no-live", help="Live progress dashboard (default: on in a terminal)",
+    ),
 ) -> None:
     """Run scenarios against an agent."""
-    from agenteval.report import generate_html_report, generate_json_report, generate_table_report
-    from agenteval.runner import run_scenarios
-    from agenteval.scenario import load_scenario, load_scenarios_from_dir, validate_dag
+    from agenteval.report import generate_json_report, generate_table_report, write_html_report
+    from agenteval.scenario import iter_scenario_refs
+    from agenteval.selection import ORDERS, filter_by_tags, parse_shard
+
+    try:
+        shard_spec = parse_shard(shard) if shard else None
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(1)
+    if order not in ORDERS:
+        console.print(f"[red]--order must be one of: {', '.join(ORDERS)}[/red]")
+        raise typer.Exit(1)
+    try:
+        plan_time = datetime.fromisoformat(plan_as_of) if plan_as_of else None
+    except ValueError:
+        console.print(f"[red]--plan-as-of must be an ISO 8601 timestamp, got {plan_as_of!r}[/red]")
+        raise typer.Exit(1)
 
     config_path = Path(config)
     cfg = yaml.safe_load(config_path.read_text()) if config_path.exists() else {}
@@ -80,23 +216,36 @@ def run(
     module_path, class_name = agent_path.rsplit(":", 1)
     adapter = getattr(importlib.import_module(module_path), class_name)()
     scenario_path = Path(scenario or cfg.get("scenarios", "scenarios/"))
-    scenarios = (
-        load_scenarios_from_dir(str(scenario_path))
-        if scenario_path.is_dir()
-        else [load_scenario(str(scenario_path))]
-    )
-
-    results = []
-    for sc in scenarios:
-        validate_dag(sc)
-        console.print(f"Running [cyan]{sc.name}[/cyan] (k={k})...")
-        results.append(asyncio.run(run_scenarios(adapter, sc, k=k, project=project)))
+    scenarios = list(filter_by_tags(
+        iter_scenario_refs(
+            str(scenario_path), cache=scenario_cache or cfg.get("scenario_cache"), workers=workers,
+        ),
+        tags=[t.strip() for t in tags.split(",") if t.strip()],
+        exclude_tags=[t.strip() for t in exclude_tags.split(",") if t.strip()],
+    ))
+    db = db or cfg.get("db")
+    store = None
+    if log_dir:
+        from agenteval.storage.log import SegmentLogBackend
+        store = SegmentLogBackend(log_dir)
+    elif db:
+        from agenteval.store import Store
+        store = Store(db)
+    if incremental and store is None:
+        console.print("[red]--incremental needs --db or --log-dir to find earlier results[/red]")
+        raise typer.Exit(1)
+    version_hook = getattr(adapter, "version", None)
+    agent_version = agent_version or cfg.get("agent_version") or (version_hook() if version_hook else None)
+    results = asyncio.run(_run_all(
+        adapter, scenarios, k, project, store, incremental, agent_version, shard_spec, order,
+        err_console.is_terminal if live is None else live, plan_time,
+    ))
 
     if output == "json":
-        console.print(generate_json_report(results))
+        typer.echo(generate_json_report(results))
     elif output == "html":
         output_path = Path(f"{project}_report.html")
-        output_path.write_text(generate_html_report(results))
+        write_html_report(results, output_path)
         console.print(f"[green]Saved: {output_path}[/green]")
     else:
         console.print(generate_table_report(results))
@@ -108,3 +257,236 @@ def run(
                     f"[red]FAIL: {r.scenario} pass^k {r.pass_k:.2f} < {thresholds['min_pass_k']}[/red]"
                 )
                 raise typer.Exit(1)
+
+
+@app.command()
+def export(
+    db: str = typer.Option("agenteval.db", "--db"),
+    project: str = typer.Option("default", "--project"),
+    fmt: str = typer.Option("parquet", "--format", help="parquet, arrow or csv"),
+    output: str = typer.Option("export", "--output", help="Directory to write the tables to"),
+    scenario: Optional[str] = typer.Option(None, "--scenario"),
+    chunk_size: int = typer.Option(10_000, "--chunk-size"),
+) -> None:
+    """Export stored runs, turns and tool calls as columnar files."""
+    from agenteval.export import export_store
+    from agenteval.store import Store
+
+    async def _export() -> dict[str, int]:
+        store = Store(db)
+        await store.init()
+        try:
+            return await export_store(store, project, output, fmt, scenario, chunk_size)
+        finally:
+            await store.close()
+
+    counts = asyncio.run(_export())
+    summary = ", ".join(f"{n} {table}" for table, n in counts.items())
+    console.print(f"[green]Exported {summary} to {output}[/green]")
+
+
+@app.command()
+def history(
+    db: str = typer.Option("agenteval.db", "--db"),
+    project: str = typer.Option("default", "--project"),
+    scenario: Optional[str] = typer.Option(None, "--scenario", help="Show the trend of one scenario"),
+    metric: str = typer.Option("pass_k", "--metric"),
+    last: int = typer.Option(30, "--last", help="Number of evaluations to look back over"),
+    window: int = typer.Option(5, "--window", help="Moving average / baseline window"),
+    regressions: bool = typer.Option(False, "--regressions", help="List scenarios worse than their baseline"),
+    threshold: float = typer.Option(0.0, "--threshold"),
+    ci: bool = typer.Option(False, "--ci", help="Exit non-zero when regressions are found"),
+) -> None:
+    """Show metric trends and regressions from stored results."""
+    from rich.table import Table
+
+    from agenteval.store import Store
+
+    async def _query() -> list[dict]:
+        store = Store(db)
+        await store.init()
+        try:
+            if regressions:
+                return await store.regressions(project, metric, baseline=window, threshold=threshold)
+            if scenario:
+                return await store.trend(project, scenario, metric, last=last, window=window)
+            return await store.trend_summary(project, metric, last=last)
+        finally:
+            await store.close()
+
+    rows = asyncio.run(_query())
+    if regressions:
+        table = Table(title=f"Regressions in {metric} (vs. mean of previous {window})")
+        columns = ["scenario", "value", "baseline", "delta", "created_at"]
+    elif scenario:
+        table = Table(title=f"{scenario}: {metric} over last {last} evaluations")
+        columns = ["created_at", "value", "moving_avg"]
+    else:
+        table = Table(title=f"{metric} over last {last} evaluations per scenario")
+        columns = ["scenario", "n", "latest", "mean", "min", "max"]
+    for col in columns:
+        table.add_column(col, justify="left" if col in ("scenario", "created_at") else "right")
+    for row in rows:
+        table.add_row(*(f"{row[c]:.4g}" if isinstance(row[c], float) else str(row[c]) for c in columns))
+    console.print(table)
+    if ci and regressions and rows:
+        raise typer.Exit(1)
+
+
+@app.command()
+def compare(
+    baseline: str = typer.Argument(..., help="JSON report, or agent version with --db"),
+    candidate: str = typer.Argument(..., help="JSON report, or agent version with --db"),
+    db: Optional[str] = typer.Option(None, "--db", help="Compare stored results of two agent versions"),
+    project: str = typer.Option("default", "--project"),
+    alpha: float = typer.Option(0.05, "--alpha", help="Significance level"),
+    adjust: str = typer.Option("none", "--adjust", help="'none' or 'holm' (correct for many scenarios)"),
+    show_all: bool = typer.Option(False, "--all", help="Also list differences that are not significant"),
+    ci: bool = typer.Option(False, "--ci", help="Exit non-zero on significant regressions"),
+) -> None:
+    """Compare pass rate, cost and latency of two evaluations with significance tests."""
+    from rich.table import Table
+
+    from agenteval.compare import compare as compare_samples
+    from agenteval.compare import load_report, load_stored
+
+    if adjust not in ("none", "holm"):
+        console.print("[red]--adjust must be 'none' or 'holm'[/red]")
+        raise typer.Exit(1)
+
+    if db:
+        from agenteval.store import Store
+
+        async def _load() -> tuple[dict, dict]:
+            store = Store(db)
+            await store.init()
+            try:
+                return (await load_stored(store, project, baseline),
+                        await load_stored(store, project, candidate))
+            finally:
+                await store.close()
+
+        base, cand = asyncio.run(_load())
+    else:
+        base, cand = load_report(baseline), load_report(candidate)
+    rows = compare_samples(base, cand, alpha=alpha, adjust=adjust)
+    only = len(base.keys() ^ cand.keys())
+    if only:
+        console.print(
+            f"[yellow]{only} scenarios are only in one of the evaluations and were skipped[/yellow]"
+        )
+
+    table = Table(title=f"{candidate} vs. {baseline} (alpha {alpha})")
+    columns = ["scenario", "metric", "baseline", "candidate", "delta", "p_value", "verdict"]
+    for col in columns:
+        table.add_column(col, justify="left" if col in ("scenario", "metric", "verdict") else "right")
+    style = {"regression": "red", "improvement": "green"}
+    for row in rows:
+        if row["verdict"] or show_all:
+            table.add_row(
+                *(f"{row[c]:+.4g}" if c == "delta" else f"{row[c]:.4g}" if isinstance(row[c], float)
+                  else str(row[c]) for c in columns),
+                style=style.get(row["verdict"]),
+            )
+    console.print(table)
+    regressions = sum(row["verdict"] == "regression" for row in rows)
+    console.print(f"{regressions} significant regressions, "
+                  f"{sum(row['verdict'] == 'improvement' for row in rows)} improvements "
+                  f"across {len(base.keys() & cand.keys())} scenarios")
+    if ci and regressions:
+        raise typer.Exit(1)
+
+
+store_app = typer.Typer(help="Maintain the run store")
+app.add_typer(store_app, name="store")
+
+
+@store_app.command("compact")
+def store_compact(
+    db: str = typer.Option("agenteval.db", "--db"),
+    project: Optional[str] = typer.Option(None, "--project"),
+    codec: str = typer.Option("zlib", "--codec", help="none, zlib or zstd"),
+) -> None:
+    """Rewrite stored run payloads in a compressed format."""
+    from agenteval.store import Store
+
+    async def _compact() -> int:
+        store = Store(db, compression=codec)
+        await store.init()
+        try:
+            return await store.compact(project=project)
+        finally:
+            await store.close()
+
+    rewritten = asyncio.run(_compact())
+    console.print(f"[green]Compacted {rewritten} runs in {db}[/green]")
+
+
+@store_app.command("gc")
+def store_gc(
+    db: str = typer.Option("agenteval.db", "--db"),
+    config: str = typer.Option("agenteval.yaml", "--config"),
+    project: Optional[str] = typer.Option(None, "--project"),
+    payload_days: Optional[int] = typer.Option(
+        None, "--payload-days", help="Keep full turn payloads this long",
+    ),
+    run_days: Optional[int] = typer.Option(None, "--run-days", help="Delete runs older than this"),
+    batch_size: int = typer.Option(500, "--batch-size"),
+    full_vacuum: bool = typer.Option(False, "--full-vacuum"),
+) -> None:
+    """Apply the retention policy and reclaim free space."""
+    from agenteval.store import Store
+
+    config_path = Path(config)
+    cfg = yaml.safe_load(config_path.read_text()) if config_path.exists() else {}
+    retention = cfg.get("retention", {})
+
+    async def _gc() -> dict[str, int]:
+        store = Store(db)
+        await store.init()
+        try:
+            return await store.gc(
+                payload_days=payload_days if payload_days is not None else retention.get("payload_days"),
+                run_days=run_days if run_days is not None else retention.get("run_days"),
+                project=project,
+                batch_size=batch_size,
+                full_vacuum=full_vacuum,
+            )
+        finally:
+            await store.close()
+
+    stats = asyncio.run(_gc())
+    console.print(
+        f"[green]Pruned {stats['pruned_payloads']} payloads, deleted {stats['deleted_runs']} runs, "
+        f"freed {stats['vacuumed_pages']} pages[/green]"
+    )
+
+
+@store_app.command("import-log")
+def store_import_log(
+    log_dir: str,
+    db: str = typer.Option("agenteval.db", "--db"),
+    keep: bool = typer.Option(False, "--keep", help="Keep segments after importing them"),
+    include_unsealed: bool = typer.Option(
+        False, "--include-unsealed", help="Also import segments of writers that did not close cleanly",
+    ),
+) -> None:
+    """Compact sealed segment-log files into the SQLite store."""
+    from agenteval.storage.log import SegmentLogBackend
+    from agenteval.store import Store
+
+    async def _import() -> dict:
+        store = Store(db)
+        await store.init()
+        try:
+            log = SegmentLogBackend(log_dir)
+            return await log.compact_into(store, delete=not keep, include_unsealed=include_unsealed)
+        finally:
+            await store.close()
+
+    counts = asyncio.run(_import())
+    console.print(
+        f"[green]Imported {counts['runs']} runs and {counts['results']} results "
+        f"from {counts['segments']} segments into {db}"
+        + (f", skipping {counts['skipped']} already imported" if counts["skipped"] else "") + "[/green]"
+    )
@@ -0,0 +1,209 @@
+"""Significance tests between two evaluations of the same scenarios."""
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from agenteval.storage.base import StorageBackend
+
+COMPARED_METRICS = ("pass_rate", "cost", "latency_ms")
+# Whether a higher value of the metric is worse.
+_HIGHER_IS_WORSE = {"pass_rate": False, "cost": True, "latency_ms": True}
+# Largest sample size for which Mann-Whitney p-values are computed exactly.
+_EXACT_MAX_N = 20
+_VERDICT_RANK = {"regression": 0, "improvement": 1, "": 2}
+
+
+def fisher_exact(a: int, b: int, c: int, d: int) -> float:
+    """Two-sided p-value of Fisher's exact test for the 2x2 table [[a, b], [c, d]].
+
+    Sums the hypergeometric probabilities of every table with the same
+    margins that is no more likely than the observed one.
+    """
+    row1, row2, col1 = a + b, c + d, a + c
+    n = row1 + row2
+    if row1 == 0 or row2 == 0 or col1 == 0 or col1 == n:
+        return 1.0
+    log_total = _log_comb(n, col1)
+
+    def pmf(x: int) -> float:
+        return math.exp(_log_comb(row1, x) + _log_comb(row2, col1 - x) - log_total)
+
+    observed = pmf(a)
+    p = sum(
+        prob
+        for x in range(max(0, col1 - row2), min(row1, col1) + 1)
+        if (prob := pmf(x)) <= observed * (1 + 1e-7)
+    )
+    return min(p, 1.0)
+
+
+def _log_comb(n: int, k: int) -> float:
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+
+def mann_whitney_u(x: list[float], y: list[float]) -> tuple[float, float]:
+    """Mann-Whitney U statistic of ``x`` and its two-sided p-value against ``y``.
+
+    The p-value is exact for small samples without ties, and otherwise from
+    the normal approximation with tie and continuity corrections.
+    """
+    n1, n2 = len(x), len(y)
+    if n1 == 0 or n2 == 0:
+        return (0.0, 1.0)
+    values = np.concatenate([np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)])
+    ranks = _average_ranks(values)
+    u = float(ranks[:n1].sum() - n1 * (n1 + 1) / 2)
+    _, counts = np.unique(values, return_counts=True)
+    ties = counts[counts > 1]
+    if not ties.size and max(n1, n2) <= _EXACT_MAX_N:
+        return (u, _exact_u_p_value(u, n1, n2))
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - float((ties ** 3 - ties).sum()) / (n * (n - 1)))
+    if variance <= 0:
+        return (u, 1.0)
+    z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+    return (u, min(math.erfc(max(z, 0.0) / math.sqrt(2)), 1.0))
+
+
+def _average_ranks(values: np.ndarray) -> np.ndarray:
+    """1-based ranks, with tied values sharing the mean of their ranks."""
+    order = np.argsort(values, kind="mergesort")
+    sorted_values = values[order]
+    ranks = np.empty(len(values), dtype=np.float64)
+    start = 0
+    for end in range(1, len(values) + 1):
+        if end == len(values) or sorted_values[end] != sorted_values[start]:
+            ranks[order[start:end]] = (start + end + 1) / 2
+            start = end
+    return ranks
+
+
+def _exact_u_p_value(u: float, n1: int, n2: int) -> float:
+    # counts[i][j][s]: arrangements of i x-values and j y-values with U = s,
+    # built up from f(i, j, s) = f(i - 1, j, s - j) + f(i, j - 1, s).
+    counts = [[np.zeros(1, dtype=np.float64)] * (n2 + 1) for _ in range(n1 + 1)]
+    for i in range(n1 + 1):
+        for j in range(n2 + 1):
+            if i == 0 or j == 0:
+                counts[i][j] = np.ones(1)
+                continue
+            dist = np.zeros(i * j + 1)
+            prev_x = counts[i - 1][j]
+            dist[j:j + len(prev_x)] += prev_x
+            prev_y = counts[i][j - 1]
+            dist[:len(prev_y)] += prev_y
+            counts[i][j] = dist
+    dist = counts[n1][n2] / counts[n1][n2].sum()
+    k = int(round(u))
+    tail = min(dist[: k + 1].sum(), dist[k:].sum())
+    return float(min(1.0, 2 * tail))
+
+
+def _samples(scenario: str, k: int, pass_rate: float, cost: list[float], latency_ms: list[float]) -> dict:
+    runs = len(cost) or k
+    return {
+        "scenario": scenario, "runs": runs, "passes": round(pass_rate * runs),
+        "cost": list(cost), "latency_ms": list(latency_ms),
+    }
+
+
+def load_report(path: str | Path) -> dict[str, dict]:
+    """Per-scenario samples from a JSON report (``agenteval run --output json``)."""
+    samples = {}
+    for record in json.loads(Path(path).read_text()):
+        run_metrics = record.get("run_metrics", {})
+        samples[record["scenario"]] = _samples(
+            record["scenario"], record["k"], record["pass_k"],
+            run_metrics.get("cost", []), run_metrics.get("latency_ms", []),
+        )
+    return samples
+
+
+async def load_stored(store: StorageBackend, project: str, agent_version: str) -> dict[str, dict]:
+    """Per-scenario samples from the latest stored result of each scenario for ``agent_version``."""
+    samples: dict[str, dict] = {}
+    for result in await store.latest_results(project, agent_version):
+        cost, latency = [], []
+        if result.get("result_id") is not None:
+            async for run in store.iter_runs(project, result["scenario"], result_id=result["result_id"]):
+                cost.append(run["total_cost"])
+                latency.append(run["total_latency_ms"])
+        samples[result["scenario"]] = _samples(
+            result["scenario"], result["k"], result["pass_k"], cost, latency,
+        )
+    return samples
+
+
+def holm_adjust(p_values: list[float]) -> list[float]:
+    """Holm-Bonferroni adjusted p-values, in the order given."""
+    m = len(p_values)
+    adjusted = [0.0] * m
+    running = 0.0
+    for rank, i in enumerate(sorted(range(m), key=lambda i: p_values[i])):
+        running = max(running, min(1.0, (m - rank) * p_values[i]))
+        adjusted[i] = running
+    return adjusted
+
+
+def compare(
+    baseline: dict[str, dict],
+    candidate: dict[str, dict],
+    alpha: float = 0.05,
+    adjust: str = "none",
+) -> list[dict[str, Any]]:
+    """Per-scenario, per-metric deltas between two sets of samples, most severe first.
+
+    Pass rates are compared with Fisher's exact test and cost and latency
+    (per-run values, summarised by their medians) with the Mann-Whitney U test.
+    A row's ``verdict`` is ``regression`` or ``improvement`` when its p-value is
+    below ``alpha`` (after Holm's correction across all rows with
+    ``adjust="holm"``), and empty otherwise. Regressions come first, then
+    improvements, each ordered by p-value.
+    """
+    if adjust not in ("none", "holm"):
+        raise ValueError(f"Unknown p-value adjustment {adjust!r}; expected 'none' or 'holm'")
+    rows = []
+    for scenario in sorted(baseline.keys() & candidate.keys()):
+        base, cand = baseline[scenario], candidate[scenario]
+        rows.append(_row(
+            scenario, "pass_rate",
+            base["passes"] / base["runs"] if base["runs"] else 0.0,
+            cand["passes"] / cand["runs"] if cand["runs"] else 0.0,
+            fisher_exact(base["passes"], base["runs"] - base["passes"],
+                         cand["passes"], cand["runs"] - cand["passes"]),
+        ))
+        for metric in ("cost", "latency_ms"):
+            if base[metric] and cand[metric]:
+                _, p = mann_whitney_u(base[metric], cand[metric])
+                rows.append(_row(
+                    scenario, metric, float(np.median(base[metric])), float(np.median(cand[metric])), p,
+                ))
+    if adjust == "holm":
+        for row, p in zip(rows, holm_adjust([r["p_value"] for r in rows])):
+            row["p_value"] = p
+    for row in rows:
+        row["significant"] = row["p_value"] < alpha
+        worse = row["delta"] > 0 if _HIGHER_IS_WORSE[row["metric"]] else row["delta"] < 0
+        row["verdict"] = (
+            ("regression" if worse else "improvement") if row["significant"] and row["delta"] else ""
+        )
+    rows.sort(key=lambda r: (_VERDICT_RANK[r["verdict"]], r["p_value"], -abs(r["relative_delta"])))
+    return rows
+
+
+def _row(scenario: str, metric: str, baseline: float, candidate: float, p_value: float) -> dict[str, Any]:
+    delta = candidate - baseline
+    return {
+        "scenario": scenario,
+        "metric": metric,
+        "baseline": baseline,
+        "candidate": candidate,
+        "delta": delta,
+        "relative_delta": delta / abs(baseline) if baseline else (math.inf if delta else 0.0),
+        "p_value": p_value,
+    }
@@ -0,0 +1,63 @@
+"""Payload compression for stored run histories."""
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+# Values of runs.payload_format. Rows written before compression existed are PLAIN.
+PLAIN = 0
+ZLIB = 1
+ZSTD = 2
+
+CODECS: dict[str, int] = {"none": PLAIN, "zlib": ZLIB, "zstd": ZSTD}
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd payload compression requires zstandard. "
+            "Install with: pip install agenteval[zstd]"
+        ) from e
+    return zstandard
+
+
+def train_dictionary(samples: list[bytes], size: int = 64 * 1024) -> bytes | None:
+    """Train a zstd dictionary from payload samples, or return None if there are too few."""
+    zstandard = _zstd()
+    try:
+        return zstandard.train_dictionary(size, samples).as_bytes()
+    except zstandard.ZstdError:
+        return None
+
+
+class PayloadCodec:
+    """Encodes JSON payload text for one payload format and optional zstd dictionary."""
+
+    def __init__(self, fmt: int, dictionary: bytes | None = None) -> None:
+        if fmt not in CODECS.values():
+            raise ValueError(f"Unknown payload format: {fmt}")
+        self.fmt = fmt
+        self._compressor: Any = None
+        self._decompressor: Any = None
+        if fmt == ZSTD:
+            zstandard = _zstd()
+            zdict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+            self._compressor = zstandard.ZstdCompressor(level=3, dict_data=zdict)
+            self._decompressor = zstandard.ZstdDecompressor(dict_data=zdict)
+
+    def encode(self, text: str | None) -> str | bytes | None:
+        if text is None or self.fmt == PLAIN:
+            return text
+        data = text.encode()
+        if self.fmt == ZLIB:
+            return zlib.compress(data)
+        return self._compressor.compress(data)
+
+    def decode(self, value: str | bytes | None) -> str | None:
+        if value is None or self.fmt == PLAIN:
+            return value
+        if self.fmt == ZLIB:
+            return zlib.decompress(value).decode()
+        return self._decompressor.decompress(value).decode()
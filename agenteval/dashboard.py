@@ -0,0 +1,235 @@
+"""Live terminal dashboard fed by runner events."""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable
+
+import numpy as np
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+
+from agenteval.evaluators.incremental import IncrementalPipeline
+from agenteval.models import Scenario
+from agenteval.runner import RunEvent
+
+
+class EventQueue:
+    """Bounded, non-blocking hand-off from the runner to a consumer.
+
+    ``put`` never waits: when the consumer falls ``maxsize`` events behind,
+    new events are counted in ``dropped`` and discarded, so a slow display
+    can never hold up the runs it is watching.
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self._events: deque[RunEvent] = deque()
+        self.maxsize = maxsize
+        self.dropped = 0
+
+    def put(self, event: RunEvent) -> None:
+        if len(self._events) >= self.maxsize:
+            self.dropped += 1
+        else:
+            self._events.append(event)
+
+    def drain(self) -> list[RunEvent]:
+        events = list(self._events)
+        self._events.clear()
+        return events
+
+
+class ScenarioProgress:
+    """Running totals for one scenario, folded from its events."""
+
+    def __init__(self, scenario: Scenario, k: int, started_at: float) -> None:
+        self.name = scenario.name
+        self.k = k
+        self.started_at = started_at
+        self.finished_at: float | None = None
+        self.pipeline = IncrementalPipeline(scenario)
+        self.in_flight: set[str] = set()
+        self.durations_ms: list[float] = []
+        self.cost = 0.0
+
+    @property
+    def completed(self) -> int:
+        return self.pipeline.runs
+
+    @property
+    def failed(self) -> int:
+        passed = round(self.pipeline.evaluators["pass"].snapshot() * self.completed)
+        return self.completed - passed
+
+    def eta(self, fallback_ms: float | None) -> float | None:
+        """Seconds until the remaining runs finish, from the mean run duration so far."""
+        remaining = self.k - self.completed
+        if remaining <= 0:
+            return 0.0
+        mean_ms = np.mean(self.durations_ms) if self.durations_ms else fallback_ms
+        return None if mean_ms is None else remaining * float(mean_ms) / 1000
+
+
+class Dashboard:
+    """Rich Live view of a suite run; pass ``dash.events.put`` as the runner's ``on_event``."""
+
+    def __init__(
+        self,
+        total_scenarios: int,
+        console: Console | None = None,
+        refresh_per_second: float = 4.0,
+        queue_size: int = 10_000,
+        recent: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.total_scenarios = total_scenarios
+        self.console = console
+        self.refresh_per_second = refresh_per_second
+        self.events = EventQueue(queue_size)
+        self.recent = recent
+        self._clock = clock
+        self.started_at = clock()
+        self.scenarios: dict[str, ScenarioProgress] = {}
+        self.skipped = 0
+        self.tokens = 0
+        self.cost = 0.0
+        self.durations_ms: list[float] = []
+        self._live: Live | None = None
+        self._task: asyncio.Task | None = None
+
+    def apply(self, event: RunEvent) -> None:
+        """Fold one event into the totals."""
+        if event.kind == "scenario_started":
+            self.scenarios[event.scenario] = ScenarioProgress(event.definition, event.k, self._clock())
+            return
+        if event.kind == "scenario_skipped":
+            self.skipped += 1
+            return
+        progress = self.scenarios.get(event.scenario)
+        if progress is None:
+            return
+        if event.kind == "run_started":
+            progress.in_flight.add(event.run_id)
+        elif event.kind == "turn":
+            self.tokens += event.tokens
+            self.cost += event.cost
+            progress.cost += event.cost
+        elif event.kind == "run_finished":
+            progress.in_flight.discard(event.run_id)
+            progress.pipeline.update(event.run)
+            progress.durations_ms.append(event.run.duration_ms)
+            self.durations_ms.append(event.run.duration_ms)
+            if progress.completed >= progress.k:
+                progress.finished_at = self._clock()
+
+    def update(self) -> None:
+        """Drain pending events and redraw."""
+        for event in self.events.drain():
+            self.apply(event)
+        if self._live is not None:
+            self._live.update(self.render(), refresh=True)
+
+    def summary(self) -> dict[str, Any]:
+        """Suite-wide totals and rates, as shown in the dashboard header."""
+        elapsed = max(self._clock() - self.started_at, 1e-9)
+        completed = sum(p.completed for p in self.scenarios.values())
+        failed = sum(p.failed for p in self.scenarios.values())
+        in_flight = sum(len(p.in_flight) for p in self.scenarios.values())
+        latency = (
+            dict(zip(("p50", "p90", "p99"), np.percentile(self.durations_ms, (50, 90, 99)).tolist()))
+            if self.durations_ms else {}
+        )
+        k = max((p.k for p in self.scenarios.values()), default=0)
+        unstarted = self.total_scenarios - len(self.scenarios) - self.skipped
+        remaining = sum(max(p.k - p.completed, 0) for p in self.scenarios.values()) + unstarted * k
+        mean_ms = float(np.mean(self.durations_ms)) if self.durations_ms else None
+        return {
+            "elapsed_s": elapsed,
+            "completed": completed,
+            "failed": failed,
+            "in_flight": in_flight,
+            "runs_per_minute": completed / elapsed * 60,
+            "tokens_per_second": self.tokens / elapsed,
+            "cost": self.cost,
+            "latency_ms": latency,
+            "eta_s": None if mean_ms is None else remaining * mean_ms / 1000,
+            "dropped_events": self.events.dropped,
+        }
+
+    def render(self) -> Group:
+        s = self.summary()
+        latency = s["latency_ms"]
+        header = Text.assemble(
+            (f"{len(self.scenarios) + self.skipped}/{self.total_scenarios} scenarios  ", "bold"),
+            f"runs {s['completed']} done, ", (f"{s['failed']} failed", "red" if s["failed"] else ""),
+            f", {s['in_flight']} in flight  |  {s['runs_per_minute']:.1f} runs/min  ",
+            f"{s['tokens_per_second']:.0f} tok/s  ${s['cost']:.4f}  |  latency ",
+            " ".join(f"{q} {_duration(v / 1000)}" for q, v in latency.items()) or "-",
+            f"  |  ETA {_duration(s['eta_s'])}",
+            (f"  ({s['dropped_events']} events dropped)", "yellow") if s["dropped_events"] else "",
+        )
+        table = Table(expand=True)
+        for col in ("Scenario", "Runs", "Failed", "In flight", "pass", "p50", "p90", "Spend", "ETA"):
+            table.add_column(col, justify="left" if col == "Scenario" else "right")
+        fallback_ms = float(np.mean(self.durations_ms)) if self.durations_ms else None
+        for progress in self._shown():
+            durations = progress.durations_ms
+            p50, p90 = np.percentile(durations, (50, 90)).tolist() if durations else (None, None)
+            passed = progress.pipeline.evaluators["pass"].snapshot()
+            table.add_row(
+                progress.name,
+                f"{progress.completed}/{progress.k}",
+                str(progress.failed),
+                str(len(progress.in_flight)),
+                f"{passed * 100:.0f}%" if progress.completed else "-",
+                _duration(None if p50 is None else p50 / 1000),
+                _duration(None if p90 is None else p90 / 1000),
+                f"${progress.cost:.4f}",
+                "done" if progress.finished_at is not None else _duration(progress.eta(fallback_ms)),
+            )
+        return Group(header, table)
+
+    def _shown(self) -> list[ScenarioProgress]:
+        """Scenarios still running, then the most recently finished ones."""
+        active = [p for p in self.scenarios.values() if p.finished_at is None]
+        done = sorted(
+            (p for p in self.scenarios.values() if p.finished_at is not None),
+            key=lambda p: p.finished_at, reverse=True,
+        )
+        return active + done[: self.recent]
+
+    async def _refresh(self) -> None:
+        while True:
+            await asyncio.sleep(1 / self.refresh_per_second)
+            self.update()
+
+    async def __aenter__(self) -> Dashboard:
+        self._live = Live(self.render(), console=self.console, auto_refresh=False, transient=False)
+        self._live.start()
+        self._task = asyncio.create_task(self._refresh())
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self.update()
+        self._live.refresh()
+        self._live.stop()
+        self._live = None
+
+
+def _duration(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(seconds), 60)
+    if minutes < 60:
+        return f"{minutes}m{secs:02d}s"
+    return f"{minutes // 60}h{minutes % 60:02d}m"
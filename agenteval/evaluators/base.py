@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from agenteval.models import Run, Scenario
 
+if TYPE_CHECKING:
+    from agenteval.evaluators.pipeline import RunFacts
+
 
 class BaseEvaluator(ABC):
     """Abstract base class for scenario evaluators."""
@@ -13,3 +16,36 @@ class BaseEvaluator(ABC):
     @abstractmethod
     def evaluate(self, runs: list[Run], scenario: Scenario) -> Any:
         ...
+
+    def evaluate_facts(self, facts: list[RunFacts], scenario: Scenario) -> Any:
+        """Evaluate from per-run facts shared with other evaluators in a pipeline.
+
+        Override to reuse intermediate results such as the state comparison
+        instead of recomputing them; the default simply calls ``evaluate``.
+        """
+        return self.evaluate([f.run for f in facts], scenario)
+
+    async def aevaluate_facts(self, facts: list[RunFacts], scenario: Scenario) -> Any:
+        """Async form of ``evaluate_facts`` used by the runner; override for I/O-bound evaluators."""
+        return self.evaluate_facts(facts, scenario)
+
+
+class IncrementalEvaluator(ABC):
+    """Evaluator that folds in one run at a time and can report at any point.
+
+    Each ``update`` costs O(1) in the number of runs seen so far and runs need
+    not be kept once folded in. ``snapshot`` returns the same shape of result as
+    the matching ``BaseEvaluator`` would for all runs seen so far.
+    """
+
+    @abstractmethod
+    def update(self, run: Run) -> None:
+        ...
+
+    @abstractmethod
+    def snapshot(self) -> Any:
+        ...
+
+    def update_facts(self, facts: RunFacts) -> None:
+        """Fold in a run from facts shared with other evaluators; defaults to ``update``."""
+        self.update(facts.run)
@@ -0,0 +1,35 @@
+"""Distribution and confidence interval evaluator."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from agenteval.evaluators.base import BaseEvaluator
+from agenteval.metrics import pass_hat_k_curve, percentiles, proportion_ci
+from agenteval.models import Run, Scenario
+
+if TYPE_CHECKING:
+    from agenteval.evaluators.pipeline import RunFacts
+
+
+class DistributionEvaluator(BaseEvaluator):
+    """Percentiles of per-run cost measures, bootstrap CIs of the pass and state
+    rates, and the pass^k curve for every k up to the number of runs."""
+
+    def __init__(self, confidence: float = 0.95, n_resamples: int = 10_000) -> None:
+        self.confidence = confidence
+        self.n_resamples = n_resamples
+
+    def evaluate(self, runs: list[Run], scenario: Scenario) -> dict[str, Any]:
+        from agenteval.evaluators.pipeline import RunFacts
+        return self.evaluate_facts([RunFacts(r, scenario) for r in runs], scenario)
+
+    def evaluate_facts(self, facts: list[RunFacts], scenario: Scenario) -> dict[str, Any]:
+        n = len(facts)
+        passed = sum(f.passed for f in facts)
+        matched = sum(f.state.match for f in facts)
+        return {
+            "percentiles": percentiles([f.run for f in facts]),
+            "pass_k_ci": proportion_ci(passed, n, self.confidence, self.n_resamples),
+            "state_correctness_ci": proportion_ci(matched, n, self.confidence, self.n_resamples),
+            "pass_k_curve": pass_hat_k_curve(passed, n),
+        }
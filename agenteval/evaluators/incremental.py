@@ -0,0 +1,200 @@
+"""Streaming evaluators that update as runs arrive."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from agenteval.evaluators.base import IncrementalEvaluator
+from agenteval.evaluators.efficiency import _CONSTRAINT_CHECKS, _EMPTY_RESULT
+from agenteval.evaluators.pipeline import RunFacts
+from agenteval.evaluators.state import compile_state
+from agenteval.evaluators.tool_accuracy import _collect_tool_names
+from agenteval.models import Run, Scenario
+
+
+class RunningStats:
+    """Count, mean and variance of a stream of values (Welford's algorithm)."""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: RunningStats) -> None:
+        """Combine with stats gathered over a disjoint stream (Chan et al.)."""
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance; 0.0 with fewer than two values."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class IncrementalStateEvaluator(IncrementalEvaluator):
+    def __init__(self, scenario: Scenario) -> None:
+        self._matcher = compile_state(scenario.expected_final_state)
+        self._runs = 0
+        self._matched = 0
+
+    def update(self, run: Run) -> None:
+        self._runs += 1
+        self._matched += self._matcher.compare(run.final_state).match
+
+    def update_facts(self, facts: RunFacts) -> None:
+        self._runs += 1
+        self._matched += facts.state.match
+
+    def snapshot(self) -> float:
+        return self._matched / self._runs if self._runs else 0.0
+
+
+class IncrementalPassRateEvaluator(IncrementalStateEvaluator):
+    def update(self, run: Run) -> None:
+        self._runs += 1
+        self._matched += run.success and self._matcher.compare(run.final_state).match
+
+    def update_facts(self, facts: RunFacts) -> None:
+        self._runs += 1
+        self._matched += facts.passed
+
+
+class IncrementalDagEvaluator(IncrementalEvaluator):
+    def __init__(self, scenario: Scenario) -> None:
+        self._total = len(scenario.checkpoints)
+        self.stats = RunningStats()
+
+    def update(self, run: Run) -> None:
+        if self._total:
+            self.stats.update(len(run.checkpoints_reached) / self._total)
+
+    def snapshot(self) -> float:
+        return self.stats.mean if self.stats.count else 0.0
+
+
+class IncrementalToolAccuracyEvaluator(IncrementalEvaluator):
+    def __init__(self, scenario: Scenario) -> None:
+        self._required = scenario.expected_tools.get("required", [])
+        self._forbidden = set(scenario.expected_tools.get("forbidden", []))
+        self._runs = 0
+        self._req_score = 0.0
+        self._violations = 0
+
+    def update(self, run: Run) -> None:
+        self._add(_collect_tool_names(run))
+
+    def update_facts(self, facts: RunFacts) -> None:
+        self._add(facts.tool_names)
+
+    def _add(self, called: set[str]) -> None:
+        self._runs += 1
+        if self._required:
+            self._req_score += sum(1 for t in self._required if t in called) / len(self._required)
+        else:
+            self._req_score += 1.0
+        self._violations += len(called & self._forbidden)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "required_tools_score": self._req_score / (self._runs or 1),
+            "forbidden_violations": self._violations,
+        }
+
+
+class IncrementalEfficiencyEvaluator(IncrementalEvaluator):
+    """Running turns, tokens, cost and latency; ``stats`` also holds their spread."""
+
+    def __init__(self, scenario: Scenario) -> None:
+        self._constraints = scenario.constraints
+        self.stats = {
+            "turns": RunningStats(), "tokens": RunningStats(),
+            "cost": RunningStats(), "latency_ms": RunningStats(),
+        }
+
+    def update(self, run: Run) -> None:
+        self.stats["turns"].update(len(run.turns))
+        self.stats["tokens"].update(run.total_tokens)
+        self.stats["cost"].update(run.total_cost)
+        self.stats["latency_ms"].update(run.total_latency_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        if not self.stats["turns"].count:
+            return dict(_EMPTY_RESULT)
+        metrics = {
+            "avg_turns": self.stats["turns"].mean,
+            "avg_tokens": int(self.stats["tokens"].mean),
+            "avg_cost": self.stats["cost"].mean,
+            "avg_latency_ms": self.stats["latency_ms"].mean,
+        }
+        metrics["constraint_violations"] = [
+            constraint_key
+            for constraint_key, metric_key in _CONSTRAINT_CHECKS
+            if self._constraints.get(constraint_key)
+            and metrics[metric_key] > self._constraints[constraint_key]
+        ]
+        return metrics
+
+
+def incremental_evaluators(scenario: Scenario) -> dict[str, IncrementalEvaluator]:
+    """Streaming counterparts of the default pipeline's per-run evaluators."""
+    return {
+        "pass": IncrementalPassRateEvaluator(scenario),
+        "state": IncrementalStateEvaluator(scenario),
+        "dag": IncrementalDagEvaluator(scenario),
+        "tools": IncrementalToolAccuracyEvaluator(scenario),
+        "efficiency": IncrementalEfficiencyEvaluator(scenario),
+    }
+
+
+class IncrementalPipeline:
+    """Feeds each arriving run to several incremental evaluators.
+
+    Like ``EvaluationPipeline`` it wraps the run in ``RunFacts`` so the state
+    comparison and tool set are computed once per run. The run is not retained.
+    """
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        plugins: dict[str, IncrementalEvaluator] | None = None,
+    ) -> None:
+        self.scenario = scenario
+        self._matcher = compile_state(scenario.expected_final_state)
+        self.evaluators = incremental_evaluators(scenario)
+        clashes = set(plugins or {}) & set(self.evaluators)
+        if clashes:
+            raise ValueError(f"Plugin names clash with built-in evaluators: {sorted(clashes)}")
+        self.evaluators.update(plugins or {})
+        self.runs = 0
+
+    def update(self, run: Run) -> None:
+        facts = RunFacts(run, self.scenario, self._matcher)
+        for evaluator in self.evaluators.values():
+            evaluator.update_facts(facts)
+        self.runs += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {name: ev.snapshot() for name, ev in self.evaluators.items()}
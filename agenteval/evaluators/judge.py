@@ -0,0 +1,143 @@
+"""LLM-as-judge evaluator for agent message quality."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from agenteval.adapters.llm import LLMAdapter
+from agenteval.evaluators.base import BaseEvaluator
+from agenteval.models import Run, Scenario
+
+if TYPE_CHECKING:
+    from agenteval.evaluators.pipeline import RunFacts
+
+_SYSTEM_PROMPT = "You are an impartial grader. Follow the grading instructions exactly."
+
+_PROMPT_HEADER = """You are grading replies of a customer-facing agent.
+For each numbered item, judge the agent reply against that item's rubric and give
+a score from 0.0 (fails the rubric) to 1.0 (fully meets it).
+Answer with only a JSON array, one object per item:
+[{"id": <item id>, "score": <0.0-1.0>, "reason": "<one sentence>"}]
+"""
+
+
+def _item_key(model: str, rubric: str, user_message: str, agent_message: str) -> str:
+    """Content hash identifying one verdict; any change to its inputs misses the cache.
+
+    The judge's system prompt and grading instructions are part of the
+    inputs, so editing them invalidates earlier verdicts too.
+    """
+    payload = json.dumps(
+        [model, _SYSTEM_PROMPT, _PROMPT_HEADER, rubric, user_message, agent_message], ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _build_prompt(items: list[dict]) -> str:
+    parts = [_PROMPT_HEADER]
+    for i, item in enumerate(items):
+        parts.append(
+            f"\n### Item {i}\nRubric: {item['rubric']}\n"
+            f"User: {item['user_message']}\nAgent: {item['agent_message']}\n"
+        )
+    return "".join(parts)
+
+
+def _parse_verdicts(text: str, count: int) -> dict[int, dict]:
+    """Read ``{id: {"score", "reason"}}`` from a judge reply, skipping malformed entries."""
+    start, end = text.find("["), text.rfind("]")
+    if start < 0 or end < start:
+        return {}
+    try:
+        entries = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+    verdicts = {}
+    for entry in entries:
+        try:
+            i, score = int(entry["id"]), float(entry["score"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 0 <= i < count:
+            verdicts[i] = {"score": min(max(score, 0.0), 1.0), "reason": str(entry.get("reason", ""))}
+    return verdicts
+
+
+class JudgeEvaluator(BaseEvaluator):
+    """Scores every agent message against the scenario rubric with a judge model, in cached batches.
+
+    Pass a persistent mapping such as ``shelve.open(path)`` as ``cache`` to keep verdicts across sessions.
+    """
+
+    def __init__(
+        self,
+        judge: LLMAdapter | dict | str | Path,
+        rubric: str = "",
+        batch_size: int = 10,
+        concurrency: int = 4,
+        cache: MutableMapping[str, Any] | None = None,
+    ) -> None:
+        self.judge = judge if isinstance(judge, LLMAdapter) else LLMAdapter(judge)
+        self.rubric = rubric
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.cache: MutableMapping[str, Any] = {} if cache is None else cache
+
+    def evaluate(self, runs: list[Run], scenario: Scenario) -> dict[str, Any]:
+        """Synchronous entry point; must not be called from a running event loop."""
+        return asyncio.run(self.ajudge(runs, scenario))
+
+    async def aevaluate_facts(self, facts: list[RunFacts], scenario: Scenario) -> dict[str, Any]:
+        return await self.ajudge([f.run for f in facts], scenario)
+
+    async def ajudge(self, runs: list[Run], scenario: Scenario) -> dict[str, Any]:
+        rubric = scenario.rubric or self.rubric
+        if not rubric:
+            return {"score": None, "judged": 0, "cached": 0, "verdicts": []}
+        items = [
+            {
+                "run_id": run.run_id, "turn_id": turn.turn_id, "rubric": rubric,
+                "user_message": turn.user_message, "agent_message": turn.agent_response.message,
+            }
+            for run in runs for turn in run.turns
+        ]
+        for item in items:
+            item["key"] = _item_key(
+                self.judge.model, rubric, item["user_message"], item["agent_message"],
+            )
+        cached = sum(1 for item in items if item["key"] in self.cache)
+
+        pending: dict[str, dict] = {}
+        for item in items:
+            if item["key"] not in self.cache:
+                pending.setdefault(item["key"], item)  # identical turns are judged once
+        todo = list(pending.values())
+        batches = [todo[i:i + self.batch_size] for i in range(0, len(todo), self.batch_size)]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        # A failed call leaves its batch unscored rather than failing the evaluation.
+        await asyncio.gather(
+            *(self._judge_batch(batch, semaphore) for batch in batches), return_exceptions=True,
+        )
+
+        verdicts = []
+        for item in items:
+            verdict = self.cache.get(item["key"])
+            if verdict is not None:
+                verdicts.append({"run_id": item["run_id"], "turn_id": item["turn_id"], **verdict})
+        scores = [v["score"] for v in verdicts]
+        return {
+            "score": sum(scores) / len(scores) if scores else None,
+            "judged": len(verdicts),
+            "cached": cached,
+            "verdicts": verdicts,
+        }
+
+    async def _judge_batch(self, batch: list[dict], semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            response = await self.judge.complete(_build_prompt(batch), system_prompt=_SYSTEM_PROMPT)
+        for i, verdict in _parse_verdicts(response.message, len(batch)).items():
+            self.cache[batch[i]["key"]] = verdict
@@ -0,0 +1,98 @@
+"""Single-pass evaluation pipeline sharing per-run work between evaluators."""
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Any
+
+from agenteval.evaluators.base import BaseEvaluator
+from agenteval.evaluators.dag import DagProgressEvaluator
+from agenteval.evaluators.distribution import DistributionEvaluator
+from agenteval.evaluators.efficiency import EfficiencyEvaluator
+from agenteval.evaluators.progress import CheckpointTimingEvaluator
+from agenteval.evaluators.state import StateCompareResult, StateEvaluator, StateMatcher, compile_state
+from agenteval.evaluators.tool_accuracy import ToolAccuracyEvaluator
+from agenteval.evaluators.trajectory import TrajectoryEvaluator, _collect_tool_calls
+from agenteval.models import Run, Scenario, ToolCall
+
+
+class RunFacts:
+    """Intermediate results for one run, each computed at most once on first use."""
+
+    def __init__(self, run: Run, scenario: Scenario, state_matcher: StateMatcher | None = None) -> None:
+        self.run = run
+        self.scenario = scenario
+        self._state_matcher = state_matcher
+
+    @cached_property
+    def state(self) -> StateCompareResult:
+        if self._state_matcher is None:
+            self._state_matcher = compile_state(self.scenario.expected_final_state)
+        return self._state_matcher.compare(self.run.final_state)
+
+    @cached_property
+    def tool_calls(self) -> list[ToolCall]:
+        return _collect_tool_calls(self.run)
+
+    @cached_property
+    def tool_names(self) -> set[str]:
+        return {tc.name for tc in self.tool_calls}
+
+    @cached_property
+    def passed(self) -> bool:
+        """Whether the run reached the success checkpoint with the expected final state."""
+        return self.run.success and self.state.match
+
+
+class PassRateEvaluator(BaseEvaluator):
+    """Fraction of runs that both succeeded and ended in the expected state."""
+
+    def evaluate(self, runs: list[Run], scenario: Scenario) -> float:
+        return self.evaluate_facts([RunFacts(r, scenario) for r in runs], scenario)
+
+    def evaluate_facts(self, facts: list[RunFacts], scenario: Scenario) -> float:
+        if not facts:
+            return 0.0
+        return sum(f.passed for f in facts) / len(facts)
+
+
+def default_evaluators() -> dict[str, BaseEvaluator]:
+    """The evaluators whose results fill the standard EvalResult fields."""
+    return {
+        "pass": PassRateEvaluator(),
+        "state": StateEvaluator(),
+        "dag": DagProgressEvaluator(),
+        "tools": ToolAccuracyEvaluator(),
+        "efficiency": EfficiencyEvaluator(),
+        "distribution": DistributionEvaluator(),
+        "trajectory": TrajectoryEvaluator(),
+        "checkpoint_timing": CheckpointTimingEvaluator(),
+    }
+
+
+class EvaluationPipeline:
+    """Runs several evaluators over the same runs, sharing per-run work through ``RunFacts``.
+
+    Each evaluator still loops over the runs itself; what is shared (the state
+    comparison, the set of tools called) is computed once per run. ``plugins``
+    are extra ``BaseEvaluator`` instances evaluated alongside the defaults.
+    """
+
+    def __init__(self, plugins: dict[str, BaseEvaluator] | None = None) -> None:
+        self.evaluators = default_evaluators()
+        clashes = set(plugins or {}) & set(self.evaluators)
+        if clashes:
+            raise ValueError(f"Plugin names clash with built-in evaluators: {sorted(clashes)}")
+        self.evaluators.update(plugins or {})
+
+    def _facts(self, runs: list[Run], scenario: Scenario) -> list[RunFacts]:
+        matcher = compile_state(scenario.expected_final_state)
+        return [RunFacts(run, scenario, matcher) for run in runs]
+
+    def evaluate(self, runs: list[Run], scenario: Scenario) -> dict[str, Any]:
+        facts = self._facts(runs, scenario)
+        return {name: ev.evaluate_facts(facts, scenario) for name, ev in self.evaluators.items()}
+
+    async def aevaluate(self, runs: list[Run], scenario: Scenario) -> dict[str, Any]:
+        """Like ``evaluate``, awaiting evaluators that do I/O such as model calls."""
+        facts = self._facts(runs, scenario)
+        return {name: await ev.aevaluate_facts(facts, scenario) for name, ev in self.evaluators.items()}
@@ -0,0 +1,85 @@
+"""Time-to-checkpoint and stall evaluator."""
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from agenteval.evaluators.base import BaseEvaluator
+from agenteval.evaluators.dag import get_blocking_info
+from agenteval.metrics import PERCENTILES
+from agenteval.models import Run, Scenario
+
+_COSTS = ("turns", "tokens", "latency_ms")
+
+
+def checkpoint_timings(run: Run) -> dict[str, dict[str, float]]:
+    """Turns, tokens and tool latency spent until each checkpoint of a run was reached."""
+    timings = {}
+    tokens = 0.0
+    latency = 0.0
+    for n, turn in enumerate(run.turns, 1):
+        response = turn.agent_response
+        tokens += response.metadata.get("tokens", 0)
+        latency += sum(tc.latency_ms for tc in response.tool_calls)
+        for cp in turn.elapsed_checkpoints:
+            timings[cp] = {"turns": n, "tokens": tokens, "latency_ms": latency}
+    return timings
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    data = np.asarray(values, dtype=np.float64)
+    stats = {"mean": float(data.mean())}
+    stats.update({f"p{q}": float(v) for q, v in zip(PERCENTILES, np.percentile(data, PERCENTILES))})
+    return stats
+
+
+class CheckpointTimingEvaluator(BaseEvaluator):
+    """How long runs take to reach each checkpoint, and where they stall.
+
+    For every checkpoint, the turns, tokens and milliseconds of tool latency
+    spent until it was reached are aggregated over the runs that reached it.
+    The stall report uses ``get_blocking_info`` after each turn: a turn that
+    reaches nothing new counts as stalled against every checkpoint that was
+    unblocked (all dependencies met) at the time. Runs that end with a
+    checkpoint unblocked but unreached count as ``stuck`` on it; runs that end
+    with it still waiting on dependencies count as ``blocked``.
+    """
+
+    def evaluate(self, runs: list[Run], scenario: Scenario) -> dict[str, Any]:
+        ids = [cp.id for cp in scenario.checkpoints]
+        reached_costs = {cp: {cost: [] for cost in _COSTS} for cp in ids}
+        stalls = {cp: {"stalled_turns": 0, "stuck": 0, "blocked": 0} for cp in ids}
+
+        for run in runs:
+            for cp, timing in checkpoint_timings(run).items():
+                if cp in reached_costs:
+                    for cost in _COSTS:
+                        reached_costs[cp][cost].append(timing[cost])
+            reached: list[str] = []
+            for turn in run.turns:
+                if not turn.elapsed_checkpoints:
+                    for cp in get_blocking_info(scenario, reached)["unblocked"]:
+                        stalls[cp]["stalled_turns"] += 1
+                reached.extend(turn.elapsed_checkpoints)
+            final = get_blocking_info(scenario, reached)
+            for cp in final["unblocked"]:
+                stalls[cp]["stuck"] += 1
+            for cp in final["blocked"]:
+                stalls[cp]["blocked"] += 1
+
+        n = len(runs)
+        checkpoints = {
+            cp: {
+                "reach_rate": len(costs["turns"]) / n if n else 0.0,
+                **{cost: _distribution(values) for cost, values in costs.items()},
+            }
+            for cp, costs in reached_costs.items()
+        }
+        return {
+            "checkpoints": checkpoints,
+            "success": checkpoints.get(scenario.success, {}),
+            "stalls": stalls,
+        }
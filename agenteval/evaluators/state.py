@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from agenteval.evaluators.base import BaseEvaluator
 from agenteval.models import Run, Scenario
 
+if TYPE_CHECKING:
+    from agenteval.evaluators.pipeline import RunFacts
+
 
 @dataclass
 class StateCompareResult:
@@ -16,47 +20,260 @@ class StateCompareResult:
     field_results: dict[str, bool] = field(default_factory=dict)
 
 
-def compare_field(expected: Any, actual: Any) -> bool:
-    if isinstance(expected, dict):
-        if "exact" in expected:
-            return actual == expected["exact"]
-        if "exists" in expected:
-            return (actual is not None) == expected["exists"]
-        if "contains" in expected:
-            return isinstance(actual, str) and expected["contains"] in actual
-        if "regex" in expected:
-            return isinstance(actual, str) and bool(re.search(expected["regex"], actual))
+class Matcher:
+    """A compiled expected-state spec; ``match`` tests one actual value against it."""
+
+    __slots__ = ()
+
+    def match(self, actual: Any) -> bool:
+        raise NotImplementedError
+
+
+class _Equals(Matcher):
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def match(self, actual: Any) -> bool:
+        return self.value == actual
+
+
+class _Exists(Matcher):
+    __slots__ = ("exists",)
+
+    def __init__(self, exists: Any) -> None:
+        self.exists = exists
+
+    def match(self, actual: Any) -> bool:
+        return (actual is not None) == self.exists
+
+
+class _Contains(Matcher):
+    __slots__ = ("needle",)
+
+    def __init__(self, needle: Any) -> None:
+        self.needle = needle
+
+    def match(self, actual: Any) -> bool:
+        return isinstance(actual, str) and self.needle in actual
+
+
+class _Regex(Matcher):
+    __slots__ = ("search",)
+
+    def __init__(self, pattern: str) -> None:
+        self.search = re.compile(pattern).search
+
+    def match(self, actual: Any) -> bool:
+        return isinstance(actual, str) and self.search(actual) is not None
+
+
+class _Range(Matcher):
+    __slots__ = ("low", "high")
+
+    def __init__(self, bounds: Any) -> None:
+        if not isinstance(bounds, (list, tuple)) or len(bounds) != 2:
+            raise ValueError(f"range expects [min, max], got {bounds!r}")
+        self.low, self.high = bounds
+
+    def match(self, actual: Any) -> bool:
+        if isinstance(actual, bool) or not isinstance(actual, (int, float)):
+            return False
+        return (self.low is None or actual >= self.low) and (self.high is None or actual <= self.high)
+
+
+class _In(Matcher):
+    __slots__ = ("hashable", "others")
+
+    def __init__(self, options: Any) -> None:
+        if not isinstance(options, list):
+            raise ValueError(f"in expects a list of allowed values, got {options!r}")
+        hashable, others = set(), []
+        for option in options:
+            try:
+                hashable.add(option)
+            except TypeError:
+                others.append(option)
+        self.hashable = frozenset(hashable)
+        self.others = others
+
+    def match(self, actual: Any) -> bool:
+        try:
+            if actual in self.hashable:
+                return True
+        except TypeError:
+            pass
+        return actual in self.others
+
+
+def _max_assignment(matchers: list[Matcher], items: list[Any]) -> int:
+    """Size of the largest pairing of matchers with distinct items they match."""
+    candidates = [[j for j, item in enumerate(items) if m.match(item)] for m in matchers]
+    owner: dict[int, int] = {}
+
+    def assign(i: int, seen: set[int]) -> bool:
+        for j in candidates[i]:
+            if j not in seen:
+                seen.add(j)
+                if j not in owner or assign(owner[j], seen):
+                    owner[j] = i
+                    return True
+        return False
+
+    return sum(assign(i, set()) for i in range(len(matchers)))
+
+
+class _Items(Matcher):
+    """Matches list items regardless of order: all of them, or at least the expected ones."""
+
+    __slots__ = ("matchers", "exact_size", "counts")
+
+    def __init__(self, expected: Any, exact_size: bool) -> None:
+        if not isinstance(expected, list):
+            raise ValueError(f"expected a list of items, got {expected!r}")
+        self.matchers = [compile_matcher(e) for e in expected]
+        self.exact_size = exact_size
+        self.counts: Counter | None = None
+        if all(type(m) is _Equals for m in self.matchers):
+            try:
+                self.counts = Counter(expected)
+            except TypeError:
+                pass
+
+    def match(self, actual: Any) -> bool:
+        if not isinstance(actual, list):
+            return False
+        if self.exact_size and len(actual) != len(self.matchers):
+            return False
+        if self.counts is not None:
+            try:
+                found = Counter(actual)
+            except TypeError:
+                pass
+            else:
+                return all(found[value] >= n for value, n in self.counts.items())
+        return _max_assignment(self.matchers, actual) == len(self.matchers)
+
+
+class _Fields(Matcher):
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: dict[str, Matcher]) -> None:
+        self.fields = tuple(fields.items())
+
+    def match(self, actual: Any) -> bool:
         if actual is None or not isinstance(actual, dict):
             return False
-        return all(compare_field(v, actual.get(k)) for k, v in expected.items())
-    if isinstance(expected, list) and isinstance(actual, list):
-        if len(expected) != len(actual):
+        return all(m.match(actual.get(k)) for k, m in self.fields)
+
+
+class _Sequence(Matcher):
+    __slots__ = ("items",)
+
+    def __init__(self, items: list[Matcher]) -> None:
+        self.items = items
+
+    def match(self, actual: Any) -> bool:
+        if not isinstance(actual, list) or len(actual) != len(self.items):
             return False
-        return all(compare_field(e, a) for e, a in zip(expected, actual))
-    return expected == actual
+        return all(m.match(a) for m, a in zip(self.items, actual))
 
 
-def compare_state(expected: dict[str, Any], actual: dict[str, Any]) -> StateCompareResult:
-    if not expected:
-        return StateCompareResult(match=True, correctness=1.0)
-    field_results = {}
-    for key, exp in expected.items():
-        field_results[key] = compare_field(exp, actual.get(key))
-    matched = sum(field_results.values())
-    total = len(field_results)
-    return StateCompareResult(
-        match=all(field_results.values()),
-        correctness=matched / total if total else 1.0,
-        field_results=field_results,
+def _is_bounds(value: Any) -> bool:
+    return isinstance(value, (list, tuple)) and len(value) == 2 and all(
+        bound is None or (isinstance(bound, (int, float)) and not isinstance(bound, bool)) for bound in value
     )
 
 
+# Operator key -> matcher factory, checked in this order. These keys always
+# select their operator, as they have since state comparison was introduced.
+_OPERATORS = {
+    "exact": _Equals,
+    "exists": _Exists,
+    "contains": _Contains,
+    "regex": _Regex,
+}
+# Later operators -> (shape check, factory). Their keys are plausible state
+# field names, so a dict selects one only when that key is its only key and the
+# value has the operator's shape; anything else is matched field by field.
+_SHAPED_OPERATORS = {
+    "range": (_is_bounds, _Range),
+    "in": (lambda v: isinstance(v, list), _In),
+    "any_order": (lambda v: isinstance(v, list), lambda items: _Items(items, exact_size=True)),
+    "includes": (lambda v: isinstance(v, list), lambda items: _Items(items, exact_size=False)),
+}
+
+
+def _operator(expected: dict[str, Any]) -> Matcher | None:
+    """The operator matcher a dict spec selects, or None if it is matched field by field."""
+    for op, factory in _OPERATORS.items():
+        if op in expected:
+            return factory(expected[op])
+    if len(expected) == 1:
+        ((key, value),) = expected.items()
+        if key in _SHAPED_OPERATORS:
+            has_shape, factory = _SHAPED_OPERATORS[key]
+            if has_shape(value):
+                return factory(value)
+    return None
+
+
+def is_operator_spec(expected: Any) -> bool:
+    """Whether ``expected`` is an operator spec such as ``{regex: ...}`` rather than a literal."""
+    return isinstance(expected, dict) and _operator(expected) is not None
+
+
+def compile_matcher(expected: Any) -> Matcher:
+    """Compile an expected-state spec into a reusable matcher."""
+    if isinstance(expected, dict):
+        operator = _operator(expected)
+        if operator is not None:
+            return operator
+        return _Fields({k: compile_matcher(v) for k, v in expected.items()})
+    if isinstance(expected, list):
+        return _Sequence([compile_matcher(e) for e in expected])
+    return _Equals(expected)
+
+
+class StateMatcher:
+    """An ``expected_final_state`` compiled once and compared against many final states."""
+
+    def __init__(self, expected: dict[str, Any]) -> None:
+        self.fields = {key: compile_matcher(spec) for key, spec in (expected or {}).items()}
+
+    def compare(self, actual: dict[str, Any]) -> StateCompareResult:
+        if not self.fields:
+            return StateCompareResult(match=True, correctness=1.0)
+        field_results = {key: m.match(actual.get(key)) for key, m in self.fields.items()}
+        matched = sum(field_results.values())
+        return StateCompareResult(
+            match=matched == len(field_results),
+            correctness=matched / len(field_results),
+            field_results=field_results,
+        )
+
+
+def compile_state(expected: dict[str, Any]) -> StateMatcher:
+    return StateMatcher(expected)
+
+
+def compare_field(expected: Any, actual: Any) -> bool:
+    return compile_matcher(expected).match(actual)
+
+
+def compare_state(expected: dict[str, Any], actual: dict[str, Any]) -> StateCompareResult:
+    return compile_state(expected).compare(actual)
+
+
 class StateEvaluator(BaseEvaluator):
     def evaluate(self, runs: list[Run], scenario: Scenario) -> float:
         if not runs:
             return 0.0
-        scores = []
-        for run in runs:
-            result = compare_state(scenario.expected_final_state, run.final_state)
-            scores.append(1.0 if result.match else 0.0)
-        return sum(scores) / len(scores)
+        matcher = compile_state(scenario.expected_final_state)
+        return sum(1.0 for run in runs if matcher.compare(run.final_state).match) / len(runs)
+
+    def evaluate_facts(self, facts: list[RunFacts], scenario: Scenario) -> float:
+        if not facts:
+            return 0.0
+        return sum(1.0 for f in facts if f.state.match) / len(facts)
@@ -1,11 +1,14 @@
 """Tool usage accuracy evaluator."""
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from agenteval.evaluators.base import BaseEvaluator
 from agenteval.models import Run, Scenario
 
+if TYPE_CHECKING:
+    from agenteval.evaluators.pipeline import RunFacts
+
 
 def _collect_tool_names(run: Run) -> set[str]:
     """Collect all unique tool names called across all turns in a run."""
@@ -14,18 +17,24 @@ def _collect_tool_names(run: Run) -> set[str]:
 
 class ToolAccuracyEvaluator(BaseEvaluator):
     def evaluate(self, runs: list[Run], scenario: Scenario) -> dict[str, Any]:
+        return self._score([_collect_tool_names(run) for run in runs], scenario)
+
+    def evaluate_facts(self, facts: list[RunFacts], scenario: Scenario) -> dict[str, Any]:
+        return self._score([f.tool_names for f in facts], scenario)
+
+    @staticmethod
+    def _score(called_per_run: list[set[str]], scenario: Scenario) -> dict[str, Any]:
         required = scenario.expected_tools.get("required", [])
         forbidden = set(scenario.expected_tools.get("forbidden", []))
         total_req_score = 0.0
         total_violations = 0
 
-        for run in runs:
-            called = _collect_tool_names(run)
+        for called in called_per_run:
             if required:
                 total_req_score += sum(1 for t in required if t in called) / len(required)
             else:
                 total_req_score += 1.0
             total_violations += len(called & forbidden)
 
-        n = len(runs) or 1
+        n = len(called_per_run) or 1
         return {"required_tools_score": total_req_score / n, "forbidden_violations": total_violations}
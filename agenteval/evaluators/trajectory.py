@@ -0,0 +1,126 @@
+"""Tool-call trajectory evaluator."""
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from agenteval.evaluators.base import BaseEvaluator
+from agenteval.models import Run, Scenario, ToolCall
+
+if TYPE_CHECKING:
+    from agenteval.evaluators.pipeline import RunFacts
+
+
+def _collect_tool_calls(run: Run) -> list[ToolCall]:
+    """All tool calls of a run in the order they were made."""
+    return [tc for turn in run.turns for tc in turn.agent_response.tool_calls]
+
+
+def lcs_length(expected: list[str], actual: list[str]) -> int:
+    """Length of the longest common subsequence of two name sequences.
+
+    Bit-parallel (Allison-Dix): each row of the DP table is one integer whose
+    bits cover ``expected``, so the cost is O(len(actual)) big-int operations
+    rather than O(len(expected) * len(actual)) Python steps.
+    """
+    m = len(expected)
+    if not m or not actual:
+        return 0
+    masks: dict[str, int] = {}
+    for i, name in enumerate(expected):
+        masks[name] = masks.get(name, 0) | (1 << i)
+    full = (1 << m) - 1
+    row = full
+    for name in actual:
+        match = row & masks.get(name, 0)
+        row = ((row + match) | (row - match)) & full
+    return m - bin(row).count("1")
+
+
+def count_loops(names: list[str], max_period: int = 3) -> int:
+    """Count blocks of up to ``max_period`` calls that immediately repeat the block before them."""
+    loops = 0
+    i = 1
+    while i < len(names):
+        for period in range(1, max_period + 1):
+            if i >= period and names[i:i + period] == names[i - period:i]:
+                loops += 1
+                i += period
+                break
+        else:
+            i += 1
+    return loops
+
+
+def count_order_violations(expected: list[str], actual: list[str]) -> int:
+    """Pairs of expected tools, both called, whose first calls are in the wrong order."""
+    first: dict[str, int] = {}
+    for i, name in enumerate(actual):
+        first.setdefault(name, i)
+    positions = [first[name] for name in dict.fromkeys(expected) if name in first]
+    return sum(
+        1
+        for i, earlier in enumerate(positions)
+        for later in positions[i + 1:]
+        if later < earlier
+    )
+
+
+def _call_key(tc: ToolCall) -> str:
+    return tc.name + json.dumps(tc.arguments, sort_keys=True, default=str)
+
+
+def score_trajectory(expected: list[str], calls: list[ToolCall], max_period: int = 3) -> dict[str, Any]:
+    """Align one run's tool calls to the expected sequence."""
+    names = [tc.name for tc in calls]
+    lcs = lcs_length(expected, names)
+    seen: set[str] = set()
+    redundant = 0
+    for tc in calls:
+        key = _call_key(tc)
+        redundant += key in seen
+        seen.add(key)
+    return {
+        "sequence_score": lcs / len(expected) if expected else 1.0,
+        "alignment_distance": len(expected) + len(names) - 2 * lcs,
+        "redundant_calls": redundant,
+        "loops": count_loops(names, max_period),
+        "order_violations": count_order_violations(expected, names),
+    }
+
+
+class TrajectoryEvaluator(BaseEvaluator):
+    """Aligns each run's tool-call sequence with ``expected_tools["sequence"]``.
+
+    ``sequence_score`` is the fraction of expected calls made in order (LCS),
+    and ``alignment_distance`` the number of calls to insert or delete to turn
+    the actual sequence into the expected one. Redundant calls repeat an earlier
+    call with identical arguments; loops are immediately repeated blocks of up
+    to ``max_period`` calls. Without a sequence the required tools are used in
+    the order they are listed.
+    """
+
+    def __init__(self, max_period: int = 3) -> None:
+        self.max_period = max_period
+
+    def evaluate(self, runs: list[Run], scenario: Scenario) -> dict[str, Any]:
+        return self._aggregate([(r.run_id, _collect_tool_calls(r)) for r in runs], scenario)
+
+    def evaluate_facts(self, facts: list[RunFacts], scenario: Scenario) -> dict[str, Any]:
+        return self._aggregate([(f.run.run_id, f.tool_calls) for f in facts], scenario)
+
+    def _aggregate(self, runs: list[tuple[str, list[ToolCall]]], scenario: Scenario) -> dict[str, Any]:
+        expected = scenario.expected_tools.get("sequence") or scenario.expected_tools.get("required", [])
+        per_run = [
+            {"run_id": run_id, **score_trajectory(expected, calls, self.max_period)}
+            for run_id, calls in runs
+        ]
+        n = len(per_run) or 1
+        return {
+            "sequence_score": sum(r["sequence_score"] for r in per_run) / n,
+            "alignment_distance": sum(r["alignment_distance"] for r in per_run) / n,
+            "redundant_calls": sum(r["redundant_calls"] for r in per_run),
+            "loops": sum(r["loops"] for r in per_run),
+            "order_violations": sum(r["order_violations"] for r in per_run),
+            "runs": per_run,
+        }
@@ -0,0 +1,162 @@
+"""Columnar export of stored runs, turns and tool calls."""
+from __future__ import annotations
+
+import csv
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from agenteval.store import Store
+
+FORMATS = ("parquet", "arrow", "csv")
+_EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+
+# Column name -> logical type. The order and types are the export contract:
+# new columns are only ever appended.
+RUN_SCHEMA: dict[str, str] = {
+    "run_id": "string", "project": "string", "scenario": "string", "result_id": "int64",
+    "success": "bool", "total_tokens": "int64", "total_cost": "float64",
+    "total_latency_ms": "float64", "checkpoints_reached": "list<string>",
+    "created_at": "timestamp",
+}
+TURN_SCHEMA: dict[str, str] = {
+    "run_id": "string", "turn_id": "int64", "user_message": "string", "agent_message": "string",
+    "tokens": "int64", "cost": "float64", "latency_ms": "float64",
+}
+TOOL_CALL_SCHEMA: dict[str, str] = {
+    "run_id": "string", "turn_id": "int64", "seq": "int64", "name": "string",
+    "arguments_json": "string", "result_json": "string", "failed": "bool", "latency_ms": "float64",
+}
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Arrow export require pyarrow. Install with: pip install agenteval[export]"
+        ) from e
+    return pyarrow
+
+
+def _arrow_schema(schema: dict[str, str]) -> Any:
+    pa = _pyarrow()
+    types = {
+        "string": pa.string(), "int64": pa.int64(), "float64": pa.float64(), "bool": pa.bool_(),
+        "list<string>": pa.list_(pa.string()), "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in schema.items()])
+
+
+def _parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class _ArrowSink:
+    """Writes row chunks as record batches to a Parquet or Arrow IPC file."""
+
+    def __init__(self, path: Path, schema: dict[str, str], fmt: str) -> None:
+        pa = _pyarrow()
+        self._schema = _arrow_schema(schema)
+        self._timestamps = [name for name, kind in schema.items() if kind == "timestamp"]
+        self._bools = [name for name, kind in schema.items() if kind == "bool"]
+        if fmt == "parquet":
+            self._writer = pa.parquet.ParquetWriter(str(path), self._schema)
+        else:
+            self._writer = pa.ipc.new_file(str(path), self._schema)
+
+    def write(self, rows: list[dict]) -> None:
+        pa = _pyarrow()
+        columns = {name: [row.get(name) for row in rows] for name in self._schema.names}
+        for name in self._timestamps:
+            columns[name] = [_parse_timestamp(v) for v in columns[name]]
+        for name in self._bools:
+            columns[name] = [bool(v) for v in columns[name]]
+        batch = pa.RecordBatch.from_pydict(columns, schema=self._schema)
+        if hasattr(self._writer, "write_batch"):
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class _CsvSink:
+    """Writes row chunks to a CSV file, with list columns encoded as JSON."""
+
+    def __init__(self, path: Path, schema: dict[str, str], fmt: str) -> None:
+        self._file = open(path, "w", newline="")
+        self._lists = [name for name, kind in schema.items() if kind.startswith("list")]
+        self._writer = csv.DictWriter(self._file, fieldnames=list(schema), extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, rows: list[dict]) -> None:
+        for row in rows:
+            for name in self._lists:
+                row[name] = json.dumps(row[name])
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def _write_table(
+    rows: AsyncIterator[dict],
+    path: Path,
+    schema: dict[str, str],
+    fmt: str,
+    chunk_size: int,
+) -> int:
+    """Drain ``rows`` into ``path`` one chunk at a time and return the row count."""
+    sink = _CsvSink(path, schema, fmt) if fmt == "csv" else _ArrowSink(path, schema, fmt)
+    total = 0
+    chunk: list[dict] = []
+    try:
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                sink.write(chunk)
+                total += len(chunk)
+                chunk = []
+        if chunk or not total:
+            sink.write(chunk)
+            total += len(chunk)
+    finally:
+        sink.close()
+    return total
+
+
+async def export_store(
+    store: Store,
+    project: str,
+    output_dir: str | Path,
+    fmt: str = "parquet",
+    scenario: str | None = None,
+    chunk_size: int = 10_000,
+) -> dict[str, int]:
+    """Export runs, turns and tool calls of a project into ``output_dir``.
+
+    Each table is streamed out of the store in chunks of ``chunk_size`` rows, so
+    memory use does not grow with history size. Returns the row count per table.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}. Use one of {', '.join(FORMATS)}.")
+    if fmt != "csv":
+        _pyarrow()
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    ext = _EXTENSIONS[fmt]
+    tables = {
+        "runs": (store.iter_runs(project, scenario, page_size=chunk_size), RUN_SCHEMA),
+        "turns": (store.iter_turns(project, scenario, page_size=chunk_size), TURN_SCHEMA),
+        "tool_calls": (store.iter_tool_calls(project, scenario, page_size=chunk_size), TOOL_CALL_SCHEMA),
+    }
+    counts = {}
+    for name, (rows, schema) in tables.items():
+        counts[name] = await _write_table(rows, out / f"{name}{ext}", schema, fmt, chunk_size)
+    return counts
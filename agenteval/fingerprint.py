@@ -0,0 +1,29 @@
+"""Fingerprints of evaluation inputs, for skipping unchanged scenarios."""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from agenteval.models import Scenario
+
+
+def _digest(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def scenario_fingerprint(scenario: Scenario) -> str:
+    """Hash of everything in a scenario that can affect its results."""
+    return _digest(scenario.model_dump(mode="json"))
+
+
+def evaluation_fingerprint(scenario: Scenario, agent_version: str | None, k: int) -> str | None:
+    """Hash of a scenario, the agent's version and k, or None if the agent version is unknown.
+
+    Two evaluations with the same fingerprint are expected to produce
+    equivalent results, so a stored result can stand in for a new run.
+    """
+    if agent_version is None:
+        return None
+    return _digest([scenario_fingerprint(scenario), agent_version, k])
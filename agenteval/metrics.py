@@ -0,0 +1,114 @@
+"""Distributional metrics and bootstrap confidence intervals over run arrays."""
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from agenteval.models import Run
+
+PERCENTILES = (50, 90, 99)
+
+# Run measure -> how to read it from a Run. Order fixes the row order of run_arrays.
+RUN_MEASURES: dict[str, Callable[[Run], float]] = {
+    "turns": lambda r: len(r.turns),
+    "tokens": lambda r: r.total_tokens,
+    "cost": lambda r: r.total_cost,
+    "latency_ms": lambda r: r.total_latency_ms,
+}
+
+# Upper bound on resampled values held in memory at once by bootstrap_ci.
+_BOOTSTRAP_CHUNK_VALUES = 4_000_000
+
+
+def run_arrays(runs: list[Run]) -> np.ndarray:
+    """Stack the run measures into a (len(RUN_MEASURES), len(runs)) float array."""
+    n = len(runs)
+    out = np.empty((len(RUN_MEASURES), n), dtype=np.float64)
+    for row, measure in enumerate(RUN_MEASURES.values()):
+        out[row] = np.fromiter((measure(r) for r in runs), dtype=np.float64, count=n)
+    return out
+
+
+def percentiles(
+    runs: list[Run],
+    qs: tuple[int, ...] = PERCENTILES,
+) -> dict[str, dict[str, float]]:
+    """Percentiles of every run measure, e.g. ``{"cost": {"p50": ..., "p90": ...}}``."""
+    if not runs:
+        return {}
+    values = np.percentile(run_arrays(runs), qs, axis=1)  # shape (len(qs), measures)
+    return {
+        name: {f"p{q}": float(values[i, row]) for i, q in enumerate(qs)}
+        for row, name in enumerate(RUN_MEASURES)
+    }
+
+
+def pass_hat_k_curve(successes: int, n: int) -> list[float]:
+    """Unbiased pass^k estimates for k = 1..n from ``successes`` passing runs out of ``n``.
+
+    pass^k = C(c, k) / C(n, k), the probability that k runs drawn without
+    replacement from the n all pass. It is evaluated as the running product of
+    (c - i) / (n - i), which never forms the binomial coefficients themselves
+    and so cannot overflow or lose precision for large n. Element ``k - 1`` holds pass^k.
+    """
+    if n <= 0:
+        return []
+    i = np.arange(n, dtype=np.float64)
+    factors = np.clip(successes - i, 0, None) / (n - i)
+    return np.cumprod(factors).tolist()
+
+
+def proportion_ci(
+    successes: int,
+    n: int,
+    confidence: float = 0.95,
+    n_resamples: int = 10_000,
+    seed: int | None = 0,
+) -> tuple[float, float]:
+    """Percentile bootstrap interval for a proportion of ``successes`` out of ``n``.
+
+    Resampling n binary outcomes with replacement is a Binomial(n, successes/n)
+    draw, so the resampled proportions are drawn directly in O(n_resamples)
+    without materialising any resample.
+    """
+    if n <= 0:
+        return (0.0, 0.0)
+    rng = np.random.default_rng(seed)
+    stats = rng.binomial(n, successes / n, size=n_resamples) / n
+    return _interval(stats, confidence)
+
+
+def bootstrap_ci(
+    values: np.ndarray | list[float],
+    statistic: Callable[..., np.ndarray] = np.mean,
+    confidence: float = 0.95,
+    n_resamples: int = 2_000,
+    seed: int | None = 0,
+) -> tuple[float, float]:
+    """Percentile bootstrap interval for ``statistic`` of ``values``.
+
+    ``statistic`` is applied along ``axis=1`` of a block of resamples at once
+    (``np.mean``, ``np.median``, ...). Blocks are sized so that memory stays
+    bounded however many values there are.
+    """
+    data = np.asarray(values, dtype=np.float64)
+    n = data.size
+    if n == 0:
+        return (0.0, 0.0)
+    rng = np.random.default_rng(seed)
+    block = max(1, _BOOTSTRAP_CHUNK_VALUES // n)
+    stats = np.empty(n_resamples, dtype=np.float64)
+    for start in range(0, n_resamples, block):
+        stop = min(start + block, n_resamples)
+        idx = rng.integers(0, n, size=(stop - start, n))
+        stats[start:stop] = statistic(data[idx], axis=1)
+    return _interval(stats, confidence)
+
+
+def _interval(stats: np.ndarray, confidence: float) -> tuple[float, float]:
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(stats, [tail, 100 - tail])
+    return (float(low), float(high))
@@ -42,6 +42,7 @@ class Run(BaseModel):
     total_tokens: int = 0
     total_cost: float = 0.0
     total_latency_ms: float = 0.0
+    duration_ms: float = 0.0  # wall-clock time of the whole run
 
 
 class EvalResult(BaseModel):
@@ -59,6 +60,16 @@ class EvalResult(BaseModel):
     avg_tokens: int = 0
     avg_cost: float = 0.0
     avg_latency_ms: float = 0.0
+    pass_k_ci: tuple[float, float] | None = None
+    state_correctness_ci: tuple[float, float] | None = None
+    percentiles: dict[str, dict[str, float]] = Field(default_factory=dict)
+    pass_k_curve: list[float] = Field(default_factory=list)  # [k - 1] -> pass^k
+    trajectory: dict[str, Any] = Field(default_factory=dict)
+    checkpoint_timing: dict[str, Any] = Field(default_factory=dict)
+    duration_ms: float = 0.0  # wall-clock time of all k runs
+    agent_version: str | None = None
+    fingerprint: str | None = None  # of the scenario, agent version and k; see agenteval.fingerprint
+    metrics: dict[str, Any] = Field(default_factory=dict)
 
 
 class Checkpoint(BaseModel):
@@ -80,3 +91,5 @@ class Scenario(BaseModel):
     tags: list[str] = Field(default_factory=list)
     expected_tools: dict[str, list[str]] = Field(default_factory=dict)
     constraints: dict[str, Any] = Field(default_factory=dict)
+    rubric: str = ""  # criteria for judging agent messages, used by JudgeEvaluator
+    params: dict[str, Any] = Field(default_factory=dict)  # matrix values of a generated variant
@@ -1,20 +1,83 @@
 """Report generation."""
 from __future__ import annotations
 
+import base64
+import gzip
 import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator
 
 from rich.console import Console
 from rich.table import Table
 
-from agenteval.models import EvalResult
+from agenteval.metrics import RUN_MEASURES
+from agenteval.models import EvalResult, Run
 
 _REPORT_EXCLUDE = {"runs"}
 
+# Runs per embedded data chunk of the streamed HTML report.
+RUN_CHUNK_SIZE = 500
+
+
+def _rate(value: float, ci: tuple[float, float] | None) -> str:
+    """Format a rate as a percentage, followed by its confidence interval when known."""
+    text = f"{value * 100:.1f}%"
+    if ci is not None:
+        text += f" [{ci[0] * 100:.1f}-{ci[1] * 100:.1f}]"
+    return text
+
+
+def _p90(result: EvalResult, measure: str, fmt: str) -> str:
+    value = result.percentiles.get(measure, {}).get("p90")
+    return "-" if value is None else fmt.format(value)
+
+
+# pass^k values shown in the table and HTML reports, where k <= n.
+_CURVE_KS = (1, 3, 8)
+
+
+def _curve(result: EvalResult) -> str:
+    """Summarise the pass^k curve at a few k, plus k = n."""
+    curve = result.pass_k_curve
+    ks = sorted({k for k in _CURVE_KS if k <= len(curve)} | ({len(curve)} if curve else set()))
+    return " ".join(f"{k}:{curve[k - 1] * 100:.0f}%" for k in ks) or "-"
+
+
+_SUMMARY_COLUMNS = (
+    "Scenario", "k", "pass^k", "State", "Checkpoints", "Tool Acc", "Turns", "Cost",
+    "p90 Cost", "p90 Latency", "pass^k curve",
+)
+
+
+def _summary_cells(r: EvalResult) -> list[str]:
+    """The formatted per-scenario cells shared by the table and HTML reports."""
+    return [
+        r.scenario,
+        str(r.k),
+        _rate(r.pass_k, r.pass_k_ci),
+        _rate(r.state_correctness, r.state_correctness_ci),
+        f"{r.checkpoint_completion * 100:.1f}%",
+        f"{r.tool_accuracy * 100:.1f}%",
+        f"{r.avg_turns:.1f}",
+        f"${r.avg_cost:.4f}",
+        _p90(r, "cost", "${:.4f}"),
+        _p90(r, "latency_ms", "{:.0f}ms"),
+        _curve(r),
+    ]
+
+
+def _run_metrics(result: EvalResult) -> dict[str, list[float]]:
+    return {name: [measure(run) for run in result.runs] for name, measure in RUN_MEASURES.items()}
+
 
 def generate_json_report(results: list[EvalResult]) -> str:
-    """Generate a JSON report from evaluation results."""
+    """Generate a JSON report from evaluation results.
+
+    Transcripts are left out, but ``run_metrics`` keeps each run's turns,
+    tokens, cost and latency so reports can be compared run by run.
+    """
     return json.dumps(
-        [r.model_dump(exclude=_REPORT_EXCLUDE) for r in results],
+        [{**r.model_dump(exclude=_REPORT_EXCLUDE), "run_metrics": _run_metrics(r)} for r in results],
         indent=2,
         ensure_ascii=False,
     )
@@ -23,20 +86,11 @@ def generate_json_report(results: list[EvalResult]) -> str:
 def generate_table_report(results: list[EvalResult]) -> str:
     """Generate a Rich table report from evaluation results."""
     table = Table(title="agenteval Results")
-    for col in ["Scenario", "k", "pass^k", "State", "Checkpoints", "Tool Acc", "Turns", "Cost"]:
+    for col in _SUMMARY_COLUMNS:
         table.add_column(col, justify="left" if col == "Scenario" else "right")
     for r in results:
-        table.add_row(
-            r.scenario,
-            str(r.k),
-            f"{r.pass_k * 100:.1f}%",
-            f"{r.state_correctness * 100:.1f}%",
-            f"{r.checkpoint_completion * 100:.1f}%",
-            f"{r.tool_accuracy * 100:.1f}%",
-            f"{r.avg_turns:.1f}",
-            f"${r.avg_cost:.4f}",
-        )
-    console = Console(record=True, width=120)
+        table.add_row(*_summary_cells(r))
+    console = Console(record=True, width=180)
     console.print(table)
     return console.export_text()
 
@@ -44,10 +98,7 @@ def generate_table_report(results: list[EvalResult]) -> str:
 def generate_html_report(results: list[EvalResult]) -> str:
     """Generate an HTML report from evaluation results."""
     rows = "".join(
-        f"<tr><td>{r.scenario}</td><td>{r.k}</td><td>{r.pass_k * 100:.1f}%</td>"
-        f"<td>{r.state_correctness * 100:.1f}%</td><td>{r.checkpoint_completion * 100:.1f}%</td>"
-        f"<td>{r.tool_accuracy * 100:.1f}%</td><td>{r.avg_turns:.1f}</td>"
-        f"<td>${r.avg_cost:.4f}</td></tr>"
+        "<tr>" + "".join(f"<td>{cell}</td>" for cell in _summary_cells(r)) + "</tr>"
         for r in results
     )
     return (
@@ -56,6 +107,87 @@ def generate_html_report(results: list[EvalResult]) -> str:
         'table{border-collapse:collapse;width:100%}th,td{border:1px solid #ddd;padding:8px}'
         'th{background:#1a1a2e;color:#fff}</style></head><body><h1>agenteval Report</h1>'
         '<table><thead><tr><th>Scenario</th><th>k</th><th>pass^k</th><th>State</th>'
-        '<th>Checkpoints</th><th>Tool</th><th>Turns</th><th>Cost</th></tr></thead>'
+        '<th>Checkpoints</th><th>Tool</th><th>Turns</th><th>Cost</th><th>p90 Cost</th>'
+        '<th>p90 Latency</th><th>pass^k curve</th></tr></thead>'
         f'<tbody>{rows}</tbody></table></body></html>'
     )
+
+
+def _pack(records: list[Any]) -> str:
+    """gzip then base64 a JSON list, for embedding in a ``<script>`` element."""
+    payload = json.dumps(records, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+    return base64.b64encode(gzip.compress(payload, mtime=0)).decode("ascii")
+
+
+def _run_row(scenario: int, run: Run) -> list[Any]:
+    """One row of the run index; the column order is fixed by RUN_FIELDS in the template."""
+    return [
+        scenario, run.run_id, run.success, len(run.turns), run.total_tokens,
+        round(run.total_cost, 6), round(run.total_latency_ms, 1), len(run.checkpoints_reached),
+    ]
+
+
+def _transcript(run: Run) -> dict[str, Any]:
+    return {
+        "turns": [
+            {
+                "user": t.user_message,
+                "agent": t.agent_response.message,
+                "tools": [
+                    {"name": tc.name, "arguments": tc.arguments, "result": tc.result}
+                    for tc in t.agent_response.tool_calls
+                ],
+                "checkpoints": t.elapsed_checkpoints,
+            }
+            for t in run.turns
+        ],
+        "checkpoints": run.checkpoints_reached,
+        "final_state": run.final_state,
+    }
+
+
+def _run_chunks(results: Iterable[EvalResult], size: int) -> Iterator[dict[str, Any]]:
+    """Pack the runs of all results, ``size`` at a time, into index and transcript chunks."""
+    rows: list[list[Any]] = []
+    transcripts: list[dict[str, Any]] = []
+    start = 0
+    for scenario, result in enumerate(results):
+        for run in result.runs:
+            rows.append(_run_row(scenario, run))
+            transcripts.append(_transcript(run))
+            if len(rows) == size:
+                yield {"start": start, "count": size, "index": _pack(rows), "transcripts": _pack(transcripts)}
+                start += size
+                rows, transcripts = [], []
+    if rows:
+        yield {"start": start, "count": len(rows), "index": _pack(rows), "transcripts": _pack(transcripts)}
+
+
+def write_html_report(
+    results: list[EvalResult],
+    path: str | Path,
+    chunk_size: int = RUN_CHUNK_SIZE,
+) -> None:
+    """Stream an HTML report with every run and transcript to ``path``.
+
+    The summary table is rendered up front. Runs are embedded as gzip-compressed
+    chunks that the page decodes in the browser: the run index fills a virtual
+    table that only renders the visible rows, and a transcript chunk is only
+    decoded when one of its runs is opened. The file is written as it is
+    rendered, so only one chunk of runs is ever packed in memory.
+    """
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
+    env = Environment(
+        loader=PackageLoader("agenteval", "templates"),
+        autoescape=select_autoescape(["html", "j2"]),
+    )
+    template = env.get_template("report.html.j2")
+    with open(path, "w", encoding="utf-8") as f:
+        template.stream(
+            columns=_SUMMARY_COLUMNS,
+            summaries=(_summary_cells(r) for r in results),
+            scenarios=[r.scenario for r in results],
+            total_runs=sum(len(r.runs) for r in results),
+            chunks=_run_chunks(results, chunk_size),
+        ).dump(f)
@@ -0,0 +1,105 @@
+"""Checkpoint requirement language, compiled into predicates over a turn."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from agenteval.evaluators.state import Matcher, _Equals, compile_matcher, compile_state, is_operator_spec
+from agenteval.models import AgentResponse, Scenario
+
+
+@dataclass
+class TurnView:
+    """What a requirement can look at: the turn's response and the state after it."""
+    response: AgentResponse
+    state: dict[str, Any]
+    tool_names: set[str] = field(init=False)
+    tool_args_by_name: dict[str, dict[str, Any]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.tool_names = {tc.name for tc in self.response.tool_calls}
+        self.tool_args_by_name = {tc.name: tc.arguments for tc in self.response.tool_calls}
+
+
+Predicate = Callable[[TurnView], bool]
+
+REQUIREMENT_KEYS = ("tool_called", "tool_args", "response", "state", "all_of", "any_of", "not")
+
+
+def _arg_matcher(spec: Any) -> Matcher:
+    """Operator specs such as ``{regex: ...}`` match; any other value must be equal."""
+    if is_operator_spec(spec):
+        return compile_matcher(spec)
+    return _Equals(spec)
+
+
+def compile_requirement(require: dict[str, Any]) -> Predicate:
+    """Compile a checkpoint ``require`` mapping into a predicate over a ``TurnView``.
+
+    All keys of one mapping must hold:
+
+    - ``tool_called``: a tool of that name was called in the turn
+    - ``tool_args``: the last call to ``tool_called`` has these arguments; a
+      value may be a state operator spec (``regex``, ``range``, ``exists``, ...)
+    - ``response``: the agent message matches a state operator spec
+    - ``state``: the state after the turn matches, like ``expected_final_state``
+    - ``all_of`` / ``any_of``: lists of nested requirements
+    - ``not``: a nested requirement that must not hold
+
+    An empty mapping always holds.
+    """
+    if not isinstance(require, dict):
+        raise ValueError(f"A checkpoint requirement must be a mapping, got {require!r}")
+    unknown = set(require) - set(REQUIREMENT_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown requirement keys: {sorted(unknown)}")
+
+    checks: list[Predicate] = []
+    if "tool_called" in require:
+        name = require["tool_called"]
+        checks.append(lambda turn: name in turn.tool_names)
+    if "tool_args" in require:
+        tool = require.get("tool_called", "")
+        args = [(key, _arg_matcher(spec)) for key, spec in require["tool_args"].items()]
+
+        def args_match(turn: TurnView) -> bool:
+            actual = turn.tool_args_by_name.get(tool, {})
+            return all(m.match(actual.get(key)) for key, m in args)
+        checks.append(args_match)
+    if "response" in require:
+        response = compile_matcher(require["response"])
+        checks.append(lambda turn: response.match(turn.response.message))
+    if "state" in require:
+        state = compile_state(require["state"])
+        checks.append(lambda turn: state.compare(turn.state).match)
+    if "all_of" in require:
+        parts = [compile_requirement(r) for r in require["all_of"]]
+        checks.append(lambda turn: all(p(turn) for p in parts))
+    if "any_of" in require:
+        options = [compile_requirement(r) for r in require["any_of"]]
+        checks.append(lambda turn: any(p(turn) for p in options))
+    if "not" in require:
+        negated = compile_requirement(require["not"])
+        checks.append(lambda turn: not negated(turn))
+
+    if len(checks) == 1:
+        return checks[0]
+    return lambda turn: all(check(turn) for check in checks)
+
+
+class CompiledCheckpoints:
+    """A scenario's checkpoint DAG with every requirement compiled once."""
+
+    def __init__(self, scenario: Scenario) -> None:
+        self.checkpoints = [
+            (cp.id, tuple(cp.depends_on), compile_requirement(cp.require))
+            for cp in scenario.checkpoints
+        ]
+
+    def newly_reached(self, reached: set[str], turn: TurnView) -> list[str]:
+        """Checkpoint IDs whose dependencies are reached and whose requirement this turn meets."""
+        return [
+            cp_id
+            for cp_id, depends_on, predicate in self.checkpoints
+            if cp_id not in reached and all(dep in reached for dep in depends_on) and predicate(turn)
+        ]
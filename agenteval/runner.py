@@ -2,58 +2,56 @@
 from __future__ import annotations
 
 import copy
+import time
 import uuid
-from typing import Any
+from dataclasses import dataclass
+from typing import Awaitable, Callable
 
 from agenteval.adapters.base import AgentAdapter, SessionContext
-from agenteval.evaluators.dag import DagProgressEvaluator
-from agenteval.evaluators.efficiency import EfficiencyEvaluator
-from agenteval.evaluators.state import StateEvaluator, compare_state
-from agenteval.evaluators.tool_accuracy import ToolAccuracyEvaluator
-from agenteval.models import Checkpoint, EvalResult, Run, Scenario, Turn
-
-
-def _checkpoint_satisfied(
-    checkpoint: Checkpoint,
-    tool_names: list[str],
-    tool_args_by_name: dict[str, dict[str, Any]],
-) -> bool:
-    """Check whether a checkpoint's requirements are met by the current turn's tool calls."""
-    require = checkpoint.require
-    if "tool_called" in require and require["tool_called"] not in tool_names:
-        return False
-    if "tool_args" in require:
-        args = tool_args_by_name.get(require.get("tool_called", ""), {})
-        if any(args.get(k) != v for k, v in require["tool_args"].items()):
-            return False
-    return True
-
-
-def _newly_reachable(
-    scenario: Scenario,
-    reached: set[str],
-    tool_names: list[str],
-    tool_args_by_name: dict[str, dict[str, Any]],
-) -> list[str]:
-    """Return checkpoint IDs that are newly reachable after this turn."""
-    newly_reached = []
-    for cp in scenario.checkpoints:
-        if cp.id in reached:
-            continue
-        if not all(dep in reached for dep in cp.depends_on):
-            continue
-        if _checkpoint_satisfied(cp, tool_names, tool_args_by_name):
-            newly_reached.append(cp.id)
-    return newly_reached
+from agenteval.evaluators.base import BaseEvaluator
+from agenteval.evaluators.pipeline import EvaluationPipeline
+from agenteval.models import EvalResult, Run, Scenario, Turn
+from agenteval.requirements import CompiledCheckpoints, TurnView
+
+
+@dataclass(frozen=True, slots=True)
+class RunEvent:
+    """Progress of a suite run, as reported to an ``on_event`` callback.
+
+    ``kind`` is ``scenario_started`` (with the scenario ``definition`` and k),
+    ``run_started``, ``turn`` (with the turn's tokens, cost and tool latency),
+    ``run_finished`` (with the ``run``) or ``scenario_skipped``.
+    """
+    kind: str
+    scenario: str
+    run_id: str = ""
+    tokens: int = 0
+    cost: float = 0.0
+    latency_ms: float = 0.0
+    k: int = 0
+    run: Run | None = None
+    definition: Scenario | None = None
+
+
+EventCallback = Callable[[RunEvent], None]
 
 
 async def execute_run(
     adapter: AgentAdapter,
     scenario: Scenario,
     run_id: str | None = None,
+    checkpoints: CompiledCheckpoints | None = None,
+    on_event: EventCallback | None = None,
 ) -> Run:
-    """Execute a single run of a scenario against an adapter."""
+    """Execute a single run of a scenario against an adapter.
+
+    ``checkpoints`` is the scenario's compiled checkpoint DAG; pass it when
+    running a scenario repeatedly to compile the requirements only once.
+    ``on_event`` is called with a ``turn`` event after every turn; it must not block.
+    """
+    started = time.perf_counter()
     run_id = run_id or str(uuid.uuid4())[:8]
+    checkpoints = checkpoints or CompiledCheckpoints(scenario)
     state = copy.deepcopy(scenario.initial_state)
     turns: list[Turn] = []
     reached: set[str] = set()
@@ -74,14 +72,18 @@ async def execute_run(
         if response.state_changes:
             state.update(response.state_changes)
 
-        tool_names = [tc.name for tc in response.tool_calls]
-        tool_args_by_name = {tc.name: tc.arguments for tc in response.tool_calls}
-        new_checkpoints = _newly_reachable(scenario, reached, tool_names, tool_args_by_name)
+        new_checkpoints = checkpoints.newly_reached(reached, TurnView(response, state))
         reached.update(new_checkpoints)
 
         total_latency_ms += sum(tc.latency_ms for tc in response.tool_calls)
         total_tokens += response.metadata.get("tokens", 0)
         total_cost += response.metadata.get("cost", 0.0)
+        if on_event is not None:
+            on_event(RunEvent(
+                "turn", scenario.name, run_id, tokens=response.metadata.get("tokens", 0),
+                cost=response.metadata.get("cost", 0.0),
+                latency_ms=sum(tc.latency_ms for tc in response.tool_calls),
+            ))
 
         turns.append(Turn(
             turn_id=i,
@@ -104,6 +106,7 @@ async def execute_run(
         total_tokens=total_tokens,
         total_cost=total_cost,
         total_latency_ms=total_latency_ms,
+        duration_ms=(time.perf_counter() - started) * 1000,
     )
 
 
@@ -112,34 +115,62 @@ async def run_scenarios(
     scenario: Scenario,
     k: int = 3,
     project: str = "default",
+    on_run: Callable[[Run], Awaitable[None]] | None = None,
+    run_id_prefix: str | None = None,
+    evaluators: dict[str, BaseEvaluator] | None = None,
+    on_event: EventCallback | None = None,
 ) -> EvalResult:
-    """Run a scenario k times and aggregate evaluation results."""
+    """Run a scenario k times and aggregate evaluation results.
+
+    ``on_run`` is awaited with each run as soon as it finishes, e.g. to persist it.
+    Run IDs are ``{run_id_prefix}-{i}``, with the prefix defaulting to the scenario name.
+    ``evaluators`` are extra evaluators whose results land in ``EvalResult.metrics``.
+    ``on_event`` receives ``RunEvent``s as the scenario progresses, e.g. a dashboard's
+    ``EventQueue.put``; it is called synchronously and must not block.
+    """
+    prefix = run_id_prefix or scenario.name
+    checkpoints = CompiledCheckpoints(scenario)
     runs: list[Run] = []
+    if on_event is not None:
+        on_event(RunEvent("scenario_started", scenario.name, k=k, definition=scenario))
     for i in range(k):
         await adapter.reset()
-        runs.append(await execute_run(adapter, scenario, run_id=f"{scenario.name}-{i}"))
-
-    state_score = StateEvaluator().evaluate(runs, scenario)
-    dag_score = DagProgressEvaluator().evaluate(runs, scenario)
-    tool_result = ToolAccuracyEvaluator().evaluate(runs, scenario)
-    efficiency = EfficiencyEvaluator().evaluate(runs, scenario)
-    pass_count = sum(
-        1 for r in runs
-        if r.success and compare_state(scenario.expected_final_state, r.final_state).match
-    )
+        run_id = f"{prefix}-{i}"
+        if on_event is not None:
+            on_event(RunEvent("run_started", scenario.name, run_id))
+        run = await execute_run(adapter, scenario, run_id=run_id, checkpoints=checkpoints, on_event=on_event)
+        if on_event is not None:
+            on_event(RunEvent("run_finished", scenario.name, run_id, run=run))
+        if on_run is not None:
+            await on_run(run)
+        runs.append(run)
+
+    pipeline = EvaluationPipeline(plugins=evaluators)
+    scores = await pipeline.aevaluate(runs, scenario)
+    tool_result = scores.pop("tools")
+    efficiency = scores.pop("efficiency")
+    distribution = scores.pop("distribution")
 
     return EvalResult(
         project=project,
         scenario=scenario.name,
         k=k,
         runs=runs,
-        pass_k=pass_count / k if k else 0.0,
-        state_correctness=state_score,
-        checkpoint_completion=dag_score,
+        pass_k=scores.pop("pass"),
+        state_correctness=scores.pop("state"),
+        checkpoint_completion=scores.pop("dag"),
         tool_accuracy=tool_result["required_tools_score"],
         forbidden_tool_violations=tool_result["forbidden_violations"],
         avg_turns=efficiency["avg_turns"],
         avg_tokens=efficiency["avg_tokens"],
         avg_cost=efficiency["avg_cost"],
         avg_latency_ms=efficiency["avg_latency_ms"],
+        pass_k_ci=distribution["pass_k_ci"],
+        state_correctness_ci=distribution["state_correctness_ci"],
+        percentiles=distribution["percentiles"],
+        pass_k_curve=distribution["pass_k_curve"],
+        trajectory=scores.pop("trajectory"),
+        checkpoint_timing=scores.pop("checkpoint_timing"),
+        duration_ms=sum(r.duration_ms for r in runs),
+        metrics=scores,
     )
@@ -1,18 +1,44 @@
 """Scenario loading, validation, and DAG parsing."""
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import math
+import os
+import pickle
+import re
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Iterator
 
+import jinja2
 import yaml
 
+from agenteval import __version__
 from agenteval.models import Checkpoint, Scenario
+from agenteval.requirements import compile_requirement
 
+try:  # LibYAML's C parser is several times faster when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
 
-def load_scenario(path: str) -> Scenario:
-    """Load a single scenario from a YAML file."""
-    with open(path) as f:
-        data = yaml.safe_load(f)
+# Below this many files to parse, worker start-up costs more than it saves.
+PARALLEL_MIN_FILES = 200
+
+
+# Scenario fields whose strings are rendered as Jinja2 templates in matrix scenarios.
+TEMPLATED_FIELDS = (
+    "name", "description", "conversation_script", "initial_state", "checkpoints",
+    "expected_final_state",
+)
+
+_SINGLE_EXPRESSION = re.compile(r"^\s*\{\{(.*?)\}\}\s*$", re.S)
+
+
+def _build_scenario(data: dict) -> Scenario:
     if "checkpoints" in data:
         data["checkpoints"] = [
             Checkpoint(**cp) if isinstance(cp, dict) else cp
@@ -21,15 +47,324 @@ def load_scenario(path: str) -> Scenario:
     return Scenario(**data)
 
 
-def load_scenarios_from_dir(directory: str) -> list[Scenario]:
-    """Load all scenarios from .yaml and .yml files in a directory."""
-    dir_path = Path(directory)
+def _compile_templates(node: Any, env: jinja2.Environment) -> Any:
+    """Replace every templated string in ``node`` with a render function.
+
+    A string that is a single ``{{ expression }}`` renders to the expression's
+    native value, so ``amount: "{{ amount }}"`` stays a number.
+    """
+    if isinstance(node, dict):
+        return {k: _compile_templates(v, env) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_compile_templates(v, env) for v in node]
+    if isinstance(node, str) and ("{{" in node or "{%" in node):
+        single = _SINGLE_EXPRESSION.match(node)
+        if single and "}}" not in single.group(1):
+            expression = env.compile_expression(single.group(1))
+            return lambda params: expression(**params)
+        return env.from_string(node).render
+    return node
+
+
+def _render(node: Any, params: dict[str, Any]) -> Any:
+    if isinstance(node, dict):
+        return {k: _render(v, params) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_render(v, params) for v in node]
+    if callable(node):
+        return node(params)
+    return node
+
+
+class ScenarioTemplate:
+    """A scenario with a ``matrix`` of parameter axes, expanded one variant at a time.
+
+    Every combination of axis values is a variant; variants are numbered in
+    ``itertools.product`` order and built only when indexed or iterated, so a
+    10k-variant suite can be sampled (``template[i]`` for a few ``i``) or
+    sharded (``range(shard, len(template), shards)``) without building the
+    rest. Strings in ``TEMPLATED_FIELDS`` are Jinja2 templates over the axis
+    names; undefined names are an error. A name without a template gets the
+    variant's parameters appended, and ``Scenario.params`` records them.
+    """
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        data = dict(data)
+        matrix = data.pop("matrix")
+        if not isinstance(matrix, dict) or not matrix:
+            raise ValueError("matrix must map parameter names to lists of values")
+        for axis, values in matrix.items():
+            if not isinstance(values, list) or not values:
+                raise ValueError(f"matrix axis '{axis}' must be a non-empty list")
+        self.axes: list[tuple[str, list[Any]]] = list(matrix.items())
+        self.data = data
+        self._compiled: dict[str, Any] | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Compiled templates cannot be pickled (e.g. into the scenario cache).
+        return {**self.__dict__, "_compiled": None}
+
+    def __len__(self) -> int:
+        return math.prod(len(values) for _, values in self.axes)
+
+    def params(self, index: int) -> dict[str, Any]:
+        """Axis values of variant ``index``; the last axis varies fastest."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"variant {index} out of range for {len(self)} variants")
+        params = {}
+        for axis, values in reversed(self.axes):
+            index, position = divmod(index, len(values))
+            params[axis] = values[position]
+        return {axis: params[axis] for axis, _ in self.axes}
+
+    @property
+    def tags(self) -> list[str]:
+        """Tags shared by every variant; tags are not templated."""
+        return list(self.data.get("tags", []))
+
+    def _compile(self) -> dict[str, Any]:
+        if self._compiled is None:
+            env = jinja2.Environment(undefined=jinja2.StrictUndefined, keep_trailing_newline=True)
+            self._compiled = {
+                k: _compile_templates(v, env) if k in TEMPLATED_FIELDS else v
+                for k, v in self.data.items()
+            }
+        return self._compiled
+
+    def _variant_name(self, rendered: Any, params: dict[str, Any]) -> str:
+        if rendered == self.data.get("name"):
+            return f"{rendered or ''}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+        return rendered
+
+    def name(self, index: int) -> str:
+        """Name of variant ``index``, rendering only the name rather than the whole scenario."""
+        params = self.params(index)
+        return self._variant_name(_render(self._compile().get("name", ""), params), params)
+
+    def __getitem__(self, index: int) -> Scenario:
+        if index < 0:
+            index += len(self)
+        params = self.params(index)
+        data = _render(self._compile(), params)
+        data["name"] = self._variant_name(data.get("name"), params)
+        data["params"] = params
+        return _build_scenario(data)
+
+    def __iter__(self) -> Iterator[Scenario]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def _parse_scenario(content: bytes | str) -> Scenario | ScenarioTemplate:
+    data = yaml.load(content, Loader=_SafeLoader)
+    if "matrix" in data:
+        return ScenarioTemplate(data)
+    return _build_scenario(data)
+
+
+def load_scenario(path: str) -> Scenario:
+    """Load a single scenario from a YAML file."""
+    with open(path, "rb") as f:
+        parsed = _parse_scenario(f.read())
+    if isinstance(parsed, ScenarioTemplate):
+        raise ValueError(f"{path} defines a matrix; load its variants with iter_scenarios()")
+    return parsed
+
+
+def load_scenario_file(path: str) -> Scenario | ScenarioTemplate:
+    """Load a YAML file as a scenario, or as a template if it defines a matrix."""
+    with open(path, "rb") as f:
+        return _parse_scenario(f.read())
+
+
+@functools.cache
+def _schema_digest() -> str:
+    """Hash of the Scenario model's schema, which changes whenever a field is added or changed."""
+    schema = json.dumps(Scenario.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode()).hexdigest()
+
+
+def _cache_version() -> tuple[str, str]:
+    return (__version__, _schema_digest())
+
+
+class ScenarioCache:
+    """On-disk cache of validated scenarios keyed by path, mtime and content hash.
+
+    A file whose mtime and size are unchanged is served without being read. If
+    they changed but the content hash did not (e.g. after a checkout), the
+    entry is still reused. The cache is invalidated wholesale when the
+    agenteval version or the Scenario model's schema changes, so entries never
+    load without fields added since they were written. It is a pickle, so only
+    point it at a file you trust.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.entries: dict[str, tuple[int, int, str, Scenario | ScenarioTemplate]] = {}
+        self.dirty = False
+        try:
+            with open(self.path, "rb") as f:
+                version, entries = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError):
+            return
+        if version == _cache_version():
+            self.entries = entries
+
+    def get(
+        self, path: Path, stat: os.stat_result, digest: str | None = None,
+    ) -> Scenario | ScenarioTemplate | None:
+        entry = self.entries.get(str(path))
+        if entry is None:
+            return None
+        mtime_ns, size, cached_digest, scenario = entry
+        if (mtime_ns, size) == (stat.st_mtime_ns, stat.st_size):
+            return scenario
+        if digest == cached_digest:
+            self.put(path, stat, digest, scenario)
+            return scenario
+        return None
+
+    def put(
+        self, path: Path, stat: os.stat_result, digest: str, scenario: Scenario | ScenarioTemplate,
+    ) -> None:
+        self.entries[str(path)] = (stat.st_mtime_ns, stat.st_size, digest, scenario)
+        self.dirty = True
+
+    def prune(self, directory: Path, keep: set[str]) -> None:
+        """Forget cached files of ``directory`` that are no longer in it."""
+        for key in [k for k in self.entries if Path(k).parent == directory and k not in keep]:
+            del self.entries[key]
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((_cache_version(), self.entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def _parse_all(contents: list[bytes], workers: int | None) -> list[Scenario | ScenarioTemplate]:
+    """Parse scenario files, across processes when there are enough of them."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(contents) < PARALLEL_MIN_FILES:
+        return [_parse_scenario(c) for c in contents]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(contents) // (workers * 4))
+        return list(pool.map(_parse_scenario, contents, chunksize=chunksize))
+
+
+def _load_dir(
+    directory: str,
+    cache: str | Path | ScenarioCache | None = None,
+    workers: int | None = None,
+) -> list[Scenario | ScenarioTemplate]:
+    """Parse every .yaml and .yml file in a directory, leaving matrices unexpanded."""
+    dir_path = Path(directory).resolve()
     paths = sorted(dir_path.glob("*.yaml")) + sorted(dir_path.glob("*.yml"))
-    return [load_scenario(str(p)) for p in paths]
+    if cache is not None and not isinstance(cache, ScenarioCache):
+        cache = ScenarioCache(cache)
+
+    scenarios: list[Scenario | ScenarioTemplate | None] = [None] * len(paths)
+    misses: list[tuple[int, os.stat_result, bytes, str]] = []
+    for i, path in enumerate(paths):
+        stat = path.stat()
+        if cache is not None and (hit := cache.get(path, stat)) is not None:
+            scenarios[i] = hit
+            continue
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest() if cache is not None else ""
+        if cache is not None and (hit := cache.get(path, stat, digest)) is not None:
+            scenarios[i] = hit
+            continue
+        misses.append((i, stat, content, digest))
+
+    parsed = _parse_all([content for _, _, content, _ in misses], workers)
+    for (i, stat, _, digest), scenario in zip(misses, parsed):
+        scenarios[i] = scenario
+        if cache is not None:
+            cache.put(paths[i], stat, digest, scenario)
+    if cache is not None:
+        cache.prune(dir_path, {str(p) for p in paths})
+        cache.save()
+    return scenarios  # type: ignore[return-value]
+
+
+class ScenarioRef:
+    """One scenario of a suite, known by name and tags before it is built.
+
+    Selecting, sharding and ordering refs costs no variant builds; ``build``
+    only the scenarios that will run.
+    """
+
+    __slots__ = ("entry", "index")
+
+    def __init__(self, entry: Scenario | ScenarioTemplate, index: int | None = None) -> None:
+        self.entry = entry
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self.entry.name if self.index is None else self.entry.name(self.index)
+
+    @property
+    def tags(self) -> list[str]:
+        return self.entry.tags
+
+    def build(self) -> Scenario:
+        return self.entry if self.index is None else self.entry[self.index]
+
+
+def iter_scenario_refs(
+    path: str,
+    cache: str | Path | ScenarioCache | None = None,
+    workers: int | None = None,
+) -> Iterator[ScenarioRef]:
+    """Yield a ``ScenarioRef`` for every scenario of a file or directory, one per matrix variant."""
+    entries = _load_dir(path, cache, workers) if Path(path).is_dir() else [load_scenario_file(path)]
+    for entry in entries:
+        if isinstance(entry, ScenarioTemplate):
+            for index in range(len(entry)):
+                yield ScenarioRef(entry, index)
+        else:
+            yield ScenarioRef(entry)
+
+
+def iter_scenarios(
+    path: str,
+    cache: str | Path | ScenarioCache | None = None,
+    workers: int | None = None,
+) -> Iterator[Scenario]:
+    """Yield the scenarios of a file or directory, expanding matrix files lazily.
+
+    Files are parsed up front (see ``load_scenarios_from_dir`` for ``cache``
+    and ``workers``); matrix variants are only built as they are consumed.
+    """
+    for ref in iter_scenario_refs(path, cache, workers):
+        yield ref.build()
+
+
+def load_scenarios_from_dir(
+    directory: str,
+    cache: str | Path | ScenarioCache | None = None,
+    workers: int | None = None,
+) -> list[Scenario]:
+    """Load all scenarios from .yaml and .yml files in a directory, with matrices expanded.
+
+    With ``cache`` (a file path or ``ScenarioCache``), unchanged files are
+    served from the cache. Files that do need parsing are spread over
+    ``workers`` processes (default: one per CPU) once there are at least
+    ``PARALLEL_MIN_FILES`` of them; ``workers=1`` always parses in-process.
+    """
+    return list(iter_scenarios(directory, cache, workers))
 
 
 def validate_dag(scenario: Scenario) -> None:
-    """Validate that the checkpoint DAG is acyclic and well-formed."""
+    """Validate that the checkpoint DAG is acyclic and well-formed and its requirements compile."""
     checkpoint_ids = {cp.id for cp in scenario.checkpoints}
 
     if scenario.success not in checkpoint_ids:
@@ -43,6 +378,10 @@ def validate_dag(scenario: Scenario) -> None:
                 raise ValueError(
                     f"Checkpoint '{cp.id}' depends on '{dep}' which does not exist"
                 )
+        try:
+            compile_requirement(cp.require)
+        except ValueError as e:
+            raise ValueError(f"Checkpoint '{cp.id}' has an invalid requirement: {e}") from e
 
     # Topological sort to detect cycles
     in_degree: dict[str, int] = {cp.id: 0 for cp in scenario.checkpoints}
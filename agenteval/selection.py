@@ -0,0 +1,101 @@
+"""Selecting, sharding and ordering the scenarios of a suite.
+
+Only ``name`` and ``tags`` are read, so these work on ``ScenarioRef``s too:
+a suite can be planned before any of its matrix variants are built.
+"""
+from __future__ import annotations
+
+import heapq
+import statistics
+from typing import Iterable, Iterator
+
+from agenteval.models import Scenario
+
+ORDERS = ("file", "longest")
+
+
+def filter_by_tags(
+    scenarios: Iterable[Scenario],
+    tags: Iterable[str] = (),
+    exclude_tags: Iterable[str] = (),
+) -> Iterator[Scenario]:
+    """Scenarios with any of ``tags`` (all if none are given) and none of ``exclude_tags``."""
+    wanted, unwanted = set(tags), set(exclude_tags)
+    for sc in scenarios:
+        if wanted and wanted.isdisjoint(sc.tags):
+            continue
+        if not unwanted.isdisjoint(sc.tags):
+            continue
+        yield sc
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse ``"i/n"`` (1-based, as CI matrices number jobs) into ``(i, n)``."""
+    index, sep, count = spec.partition("/")
+    try:
+        i, n = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"Shard must look like 'i/n', got {spec!r}") from None
+    if not sep or n < 1 or not 1 <= i <= n:
+        raise ValueError(f"Shard must look like 'i/n' with 1 <= i <= n, got {spec!r}")
+    return i, n
+
+
+def estimate_durations(scenarios: list[Scenario], durations: dict[str, float]) -> list[float]:
+    """Expected duration of each scenario, from ``durations`` keyed by scenario name.
+
+    Scenarios without history are assumed to take the median of those with
+    history, or 1.0 when there is none, so new scenarios still spread evenly.
+    """
+    known = [durations[sc.name] for sc in scenarios if durations.get(sc.name, 0) > 0]
+    default = statistics.median(known) if known else 1.0
+    return [durations[sc.name] if durations.get(sc.name, 0) > 0 else default for sc in scenarios]
+
+
+def _longest_first(scenarios: list[Scenario], estimates: list[float]) -> list[int]:
+    # Name and position break ties, so every process computes the same order.
+    return sorted(range(len(scenarios)), key=lambda i: (-estimates[i], scenarios[i].name, i))
+
+
+def shard_scenarios(
+    scenarios: list[Scenario],
+    index: int,
+    count: int,
+    durations: dict[str, float] | None = None,
+) -> list[Scenario]:
+    """The scenarios of shard ``index`` of ``count`` (1-based), in their original order.
+
+    Shards are balanced on expected duration with the longest-processing-time
+    rule: longest scenarios first, each to the shard with the least work so
+    far. The plan depends only on the scenarios and ``durations``, so parallel
+    jobs given the same inputs agree on it without coordinating.
+    """
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and {count}, got {index}")
+    estimates = estimate_durations(scenarios, durations or {})
+    loads = [(0.0, shard) for shard in range(count)]
+    mine = []
+    for i in _longest_first(scenarios, estimates):
+        load, shard = heapq.heappop(loads)
+        if shard == index - 1:
+            mine.append(i)
+        heapq.heappush(loads, (load + estimates[i], shard))
+    return [scenarios[i] for i in sorted(mine)]
+
+
+def order_scenarios(
+    scenarios: list[Scenario],
+    order: str = "file",
+    durations: dict[str, float] | None = None,
+) -> list[Scenario]:
+    """Scenarios in ``file`` order (unchanged) or ``longest`` expected duration first.
+
+    Starting the longest scenarios first keeps one slow scenario from
+    becoming the tail of a run.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order {order!r}; expected one of {', '.join(ORDERS)}")
+    if order == "file":
+        return list(scenarios)
+    estimates = estimate_durations(scenarios, durations or {})
+    return [scenarios[i] for i in _longest_first(scenarios, estimates)]
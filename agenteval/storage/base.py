@@ -0,0 +1,74 @@
+"""Base storage backend interface."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator
+
+from agenteval.models import EvalResult, Run
+
+
+class StorageBackend(ABC):
+    """Abstract base class for run and result storage."""
+
+    @abstractmethod
+    async def init(self) -> None:
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        ...
+
+    @abstractmethod
+    async def save_run(
+        self,
+        run: Run,
+        project: str,
+        tags: list[str] | None = None,
+        created_at: str | None = None,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    async def save_result(self, result: EvalResult, created_at: str | None = None) -> int | None:
+        ...
+
+    async def find_result(self, project: str, scenario: str, fingerprint: str) -> EvalResult | None:
+        """Latest stored result of a scenario with this input fingerprint, if supported."""
+        return None
+
+    async def latest_results(self, project: str, agent_version: str) -> list[dict]:
+        """The newest result of each scenario evaluated with ``agent_version``."""
+        latest: dict[str, dict] = {}
+        for result in await self.load_results(project):  # newest first
+            if result.get("agent_version") == agent_version:
+                latest.setdefault(result["scenario"], result)
+        return list(latest.values())
+
+    async def scenario_durations(
+        self, project: str, last: int = 5, until: str | datetime | None = None,
+    ) -> dict[str, float]:
+        """Mean wall-clock milliseconds per run of each scenario, from results created before ``until``."""
+        return {}
+
+    @abstractmethod
+    async def load_runs(self, project: str, scenario: str | None = None) -> list[dict]:
+        ...
+
+    @abstractmethod
+    async def load_results(self, project: str, scenario: str | None = None) -> list[dict]:
+        ...
+
+    @abstractmethod
+    def iter_runs(
+        self,
+        project: str,
+        scenario: str | None = None,
+        *,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+        success: bool | None = None,
+        tag: str | None = None,
+        result_id: int | str | None = None,
+    ) -> AsyncIterator[dict]:
+        ...
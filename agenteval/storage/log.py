@@ -0,0 +1,342 @@
+"""Append-only segmented log storage backend."""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator
+
+from agenteval.models import EvalResult, Run
+from agenteval.storage.base import StorageBackend
+from agenteval.store import Store, _iso, _utc_now_iso
+
+_SEGMENT_GLOB = "*.jsonl"
+_INDEX_SUFFIX = ".idx"
+
+# Summary fields copied into each run's index entry so queries never read the segment.
+_RUN_SUMMARY_FIELDS = (
+    "run_id", "scenario", "success", "total_tokens", "total_cost", "total_latency_ms",
+    "checkpoints_reached",
+)
+
+
+def _index_path(segment: Path) -> Path:
+    return segment.with_name(segment.name + _INDEX_SUFFIX)
+
+
+def _entry_for(record: dict, offset: int, length: int) -> dict:
+    """Build the index entry describing one log record."""
+    entry = {
+        "type": record["type"], "project": record["project"], "created_at": record["created_at"],
+        "offset": offset, "length": length,
+    }
+    if record["type"] == "run":
+        entry.update({f: record["run"][f] for f in _RUN_SUMMARY_FIELDS})
+        entry["tags"] = record["tags"]
+    else:
+        entry["scenario"] = record["result"]["scenario"]
+        entry["fingerprint"] = record["result"].get("fingerprint")
+        entry["per_run_ms"] = record["result"].get("duration_ms", 0.0) / max(record["result"]["k"], 1)
+    return entry
+
+
+def _result_id(segment: Path, entry: dict) -> str:
+    """Identify a result record by its position in the log."""
+    return f"{segment.name}:{entry['offset']}"
+
+
+def _records(segment: Path) -> Iterator[dict]:
+    """The complete records of a segment, in order."""
+    with open(segment, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            yield json.loads(line)
+
+
+def _read_entries(segment: Path, offset: int = 0) -> tuple[list[dict], int]:
+    """Index entries of the complete records of an unindexed segment from ``offset``, and where they end."""
+    entries = []
+    with open(segment, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # a writer is midway through appending this record
+            entries.append(_entry_for(json.loads(line), offset, len(line)))
+            offset += len(line)
+    return entries, offset
+
+
+class SegmentLogBackend(StorageBackend):
+    """Stores runs and results in append-only JSON-lines segments, one writer per process.
+
+    Sealed segments get an offset index; ``compact_into`` moves them into a SQLite ``Store``.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_bytes: int = 64 * 1024 * 1024,
+        sync_every: int = 100,
+        sync_interval: float = 1.0,
+    ) -> None:
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._writer_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._seq = 0
+        self._fd: int | None = None
+        self._segment: Path | None = None
+        self._offset = 0
+        self._index: list[dict] = []
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        # Parsed entries by segment: (index mtime, entries) once sealed, else (scanned bytes, entries).
+        self._sealed: dict[Path, tuple[int, list[dict]]] = {}
+        self._scanned: dict[Path, tuple[int, list[dict]]] = {}
+
+    async def init(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    async def close(self) -> None:
+        await self._seal()
+
+    async def _append(self, record: dict) -> None:
+        if self._fd is None:
+            self._seq += 1
+            self._segment = self.directory / f"{self._writer_id}-{self._seq:06d}.jsonl"
+            self._fd = os.open(self._segment, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._offset = 0
+            self._index = []
+        line = (json.dumps(record) + "\n").encode()
+        os.write(self._fd, line)
+        self._index.append(_entry_for(record, self._offset, len(line)))
+        self._offset += len(line)
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            await self._sync()
+        if self._offset >= self.segment_bytes:
+            await self._seal()
+
+    async def _sync(self) -> None:
+        if self._fd is not None and self._unsynced:
+            await asyncio.to_thread(os.fsync, self._fd)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    async def _seal(self) -> None:
+        """Flush the active segment, write its index and start a new segment on next write."""
+        if self._fd is None:
+            return
+        await self._sync()
+        os.close(self._fd)
+        self._fd = None
+        index = _index_path(self._segment)
+        tmp = index.with_name(index.name + ".tmp")
+        tmp.write_text(json.dumps(self._index))
+        os.replace(tmp, index)
+
+    async def save_run(
+        self,
+        run: Run,
+        project: str,
+        tags: list[str] | None = None,
+        created_at: str | None = None,
+    ) -> None:
+        await self._append({
+            "type": "run", "project": project, "tags": list(tags or []),
+            "created_at": created_at or _utc_now_iso(), "run": run.model_dump(mode="json"),
+        })
+
+    async def save_result(self, result: EvalResult, created_at: str | None = None) -> None:
+        await self._append({
+            "type": "result", "project": result.project,
+            "created_at": created_at or _utc_now_iso(),
+            "result": result.model_dump(mode="json", exclude={"runs"}),
+            "run_ids": [r.run_id for r in result.runs],
+        })
+
+    def _segments(self) -> list[tuple[Path, list[dict], bool]]:
+        """Return every segment with its index entries and whether it is sealed."""
+        segments = []
+        paths = sorted(self.directory.glob(_SEGMENT_GLOB))
+        for path in paths:
+            index = _index_path(path)
+            try:
+                mtime = index.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            if mtime is not None:
+                cached = self._sealed.get(path)
+                if cached is None or cached[0] != mtime:
+                    cached = self._sealed[path] = (mtime, json.loads(index.read_text()))
+                self._scanned.pop(path, None)
+                segments.append((path, cached[1], True))
+            elif path == self._segment and self._fd is not None:
+                segments.append((path, list(self._index), False))
+            else:
+                scanned, entries = self._scanned.get(path, (0, []))
+                new, scanned = _read_entries(path, scanned)
+                if new:
+                    entries = entries + new
+                self._scanned[path] = (scanned, entries)
+                segments.append((path, entries, False))
+        for stale in (self._sealed.keys() | self._scanned.keys()) - set(paths):
+            self._sealed.pop(stale, None)
+            self._scanned.pop(stale, None)
+        return segments
+
+    def _matching(self, kind: str, project: str, scenario: str | None) -> list[tuple[Path, dict]]:
+        matches = [
+            (path, entry)
+            for path, entries, _ in self._segments()
+            for entry in entries
+            if entry["type"] == kind and entry["project"] == project
+            and (not scenario or entry["scenario"] == scenario)
+        ]
+        matches.sort(key=lambda m: m[1]["created_at"])
+        return matches
+
+    @staticmethod
+    def _read(path: Path, entry: dict) -> dict:
+        with open(path, "rb") as f:
+            f.seek(entry["offset"])
+            return json.loads(f.read(entry["length"]))
+
+    async def load_runs(self, project: str, scenario: str | None = None) -> list[dict]:
+        records = []
+        for path, entry in self._matching("run", project, scenario):
+            run = self._read(path, entry)["run"]
+            records.append({
+                **{f: entry[f] for f in _RUN_SUMMARY_FIELDS}, "project": project,
+                "created_at": entry["created_at"], "result_id": None,
+                "turns_json": json.dumps(run["turns"]), "final_state_json": json.dumps(run["final_state"]),
+            })
+        return records
+
+    async def load_results(self, project: str, scenario: str | None = None) -> list[dict]:
+        records = []
+        for path, entry in reversed(self._matching("result", project, scenario)):
+            result = self._read(path, entry)["result"]
+            result["forbidden_violations"] = result.pop("forbidden_tool_violations")
+            records.append({
+                "result_id": _result_id(path, entry), **result, "created_at": entry["created_at"],
+            })
+        return records
+
+    async def find_result(self, project: str, scenario: str, fingerprint: str) -> EvalResult | None:
+        for path, entry in reversed(self._matching("result", project, scenario)):
+            if entry.get("fingerprint") == fingerprint:
+                return EvalResult.model_validate(self._read(path, entry)["result"])
+        return None
+
+    async def scenario_durations(
+        self, project: str, last: int = 5, until: str | datetime | None = None,
+    ) -> dict[str, float]:
+        recent: dict[str, list[float]] = {}
+        for _, entry in reversed(self._matching("result", project, None)):
+            if until is not None and entry["created_at"] >= _iso(until):
+                continue
+            per_run = entry.get("per_run_ms", 0.0)
+            if per_run > 0 and len(times := recent.setdefault(entry["scenario"], [])) < last:
+                times.append(per_run)
+        return {scenario: sum(times) / len(times) for scenario, times in recent.items() if times}
+
+    async def iter_runs(
+        self,
+        project: str,
+        scenario: str | None = None,
+        *,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+        success: bool | None = None,
+        tag: str | None = None,
+        result_id: int | str | None = None,
+    ) -> AsyncIterator[dict]:
+        """Stream run summaries from the segment indexes, ordered by created_at.
+
+        ``result_id`` (as returned by ``load_results``) selects the runs of one result.
+        """
+        run_ids = None
+        if result_id is not None:
+            run_ids = set()
+            for path, entry in self._matching("result", project, scenario):
+                if _result_id(path, entry) == result_id:
+                    run_ids = set(self._read(path, entry)["run_ids"])
+                    break
+        for _, entry in self._matching("run", project, scenario):
+            if run_ids is not None and entry["run_id"] not in run_ids:
+                continue
+            if since is not None and entry["created_at"] < _iso(since):
+                continue
+            if until is not None and entry["created_at"] >= _iso(until):
+                continue
+            if success is not None and entry["success"] != success:
+                continue
+            if tag is not None and tag not in entry["tags"]:
+                continue
+            yield {
+                **{f: entry[f] for f in _RUN_SUMMARY_FIELDS}, "project": project,
+                "created_at": entry["created_at"], "result_id": result_id,
+            }
+
+    async def compact_into(
+        self,
+        store: Store,
+        delete: bool = True,
+        include_unsealed: bool = False,
+    ) -> dict[str, Any]:
+        """Copy every sealed segment into ``store`` and, by default, delete it.
+
+        Segments still being written are left for a later compaction unless
+        ``include_unsealed`` is set, which recovers segments left behind by
+        writers that exited without closing (only complete lines are copied).
+        Original timestamps and tags are preserved. Runs are copied before
+        results, so each result is linked to its runs in any segment of the same
+        compaction. Records already in ``store`` (runs by id, results by project,
+        scenario and timestamp) are skipped, and a skipped result is linked to
+        its runs again, so an interrupted or ``delete=False`` compaction can
+        simply be run again.
+        """
+        counts = {"segments": 0, "runs": 0, "results": 0, "skipped": 0}
+        paths = [
+            path for path, _, sealed in self._segments()
+            if not (path == self._segment and self._fd is not None) and (sealed or include_unsealed)
+        ]
+        for kind in ("run", "result"):
+            for path in paths:
+                for record in _records(path):
+                    if record["type"] != kind:
+                        continue
+                    if kind == "run":
+                        if await store.has_run(record["run"]["run_id"]):
+                            counts["skipped"] += 1
+                            continue
+                        await store.save_run(
+                            Run.model_validate(record["run"]), record["project"],
+                            tags=record["tags"], created_at=record["created_at"],
+                        )
+                        counts["runs"] += 1
+                        continue
+                    scenario = record["result"]["scenario"]
+                    result_id = await store.find_result_id(record["project"], scenario, record["created_at"])
+                    if result_id is not None:
+                        await store.link_runs(result_id, record["run_ids"])
+                        counts["skipped"] += 1
+                        continue
+                    runs = [{"run_id": run_id, "scenario": scenario} for run_id in record["run_ids"]]
+                    result = EvalResult.model_validate({**record["result"], "runs": runs})
+                    await store.save_result(result, created_at=record["created_at"])
+                    counts["results"] += 1
+        if delete:
+            for path in paths:
+                path.unlink()
+                _index_path(path).unlink(missing_ok=True)
+        counts["segments"] = len(paths)
+        return counts
@@ -1,12 +1,16 @@
 """SQLite persistence layer."""
 from __future__ import annotations
 
+import hashlib
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import aiosqlite
 
-from agenteval.models import EvalResult, Run
+from agenteval.compression import CODECS, PLAIN, ZSTD, PayloadCodec, train_dictionary
+from agenteval.models import EvalResult, Run, Turn
+from agenteval.storage.base import StorageBackend
 
 
 def _utc_now_iso() -> str:
@@ -14,35 +18,397 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-class Store:
-    def __init__(self, db_path: str) -> None:
+def _iso(value: str | datetime) -> str:
+    """Normalize a timestamp filter to the ISO 8601 UTC form used in created_at."""
+    if isinstance(value, str):
+        return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _state_hash(state: dict[str, Any]) -> tuple[str, str]:
+    """Return the content hash and canonical JSON of a state dict."""
+    text = json.dumps(state, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest(), text
+
+
+def _state_delta(base: dict[str, Any], state: dict[str, Any]) -> dict[str, Any]:
+    """Describe ``state`` as top-level key changes relative to ``base``."""
+    return {
+        "set": {k: v for k, v in state.items() if k not in base or base[k] != v},
+        "unset": [k for k in base if k not in state],
+    }
+
+
+def _apply_delta(base: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    state = {k: v for k, v in base.items() if k not in delta["unset"]}
+    state.update(delta["set"])
+    return state
+
+
+def _tool_call_failed(result: Any) -> bool:
+    """Heuristically decide whether a tool result reports a failure."""
+    if not isinstance(result, dict):
+        return False
+    return bool(result.get("error")) or result.get("success") is False
+
+
+async def _create_base_tables(db: aiosqlite.Connection) -> None:
+    await db.executescript("""
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY, project TEXT NOT NULL, scenario TEXT NOT NULL,
+            success INTEGER NOT NULL, total_tokens INTEGER DEFAULT 0,
+            total_cost REAL DEFAULT 0.0, total_latency_ms REAL DEFAULT 0.0,
+            checkpoints_reached TEXT DEFAULT '[]', turns_json TEXT DEFAULT '[]',
+            final_state_json TEXT DEFAULT '{}', created_at TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS results (
+            result_id INTEGER PRIMARY KEY AUTOINCREMENT, project TEXT NOT NULL,
+            scenario TEXT NOT NULL, k INTEGER NOT NULL, pass_k REAL DEFAULT 0.0,
+            state_correctness REAL DEFAULT 0.0, checkpoint_completion REAL DEFAULT 0.0,
+            tool_accuracy REAL DEFAULT 0.0, forbidden_violations INTEGER DEFAULT 0,
+            avg_turns REAL DEFAULT 0.0, avg_tokens INTEGER DEFAULT 0,
+            avg_cost REAL DEFAULT 0.0, avg_latency_ms REAL DEFAULT 0.0,
+            created_at TEXT NOT NULL);
+    """)
+
+
+async def _normalize_turns(db: aiosqlite.Connection) -> None:
+    """Add per-turn, per-tool-call and checkpoint tables and backfill them from turns_json."""
+    await db.executescript("""
+        CREATE TABLE IF NOT EXISTS turns (
+            run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+            turn_id INTEGER NOT NULL, user_message TEXT NOT NULL,
+            agent_message TEXT NOT NULL, tokens INTEGER DEFAULT 0, cost REAL DEFAULT 0.0,
+            latency_ms REAL DEFAULT 0.0, PRIMARY KEY (run_id, turn_id));
+        CREATE TABLE IF NOT EXISTS tool_calls (
+            run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+            turn_id INTEGER NOT NULL, seq INTEGER NOT NULL, name TEXT NOT NULL,
+            arguments_json TEXT DEFAULT '{}', result_json TEXT DEFAULT 'null',
+            failed INTEGER NOT NULL DEFAULT 0, latency_ms REAL DEFAULT 0.0,
+            PRIMARY KEY (run_id, turn_id, seq));
+        CREATE TABLE IF NOT EXISTS checkpoint_events (
+            run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+            turn_id INTEGER NOT NULL, checkpoint_id TEXT NOT NULL,
+            PRIMARY KEY (run_id, checkpoint_id));
+        CREATE INDEX IF NOT EXISTS idx_runs_project_scenario_created
+            ON runs (project, scenario, created_at);
+        CREATE INDEX IF NOT EXISTS idx_runs_project_created ON runs (project, created_at);
+        CREATE INDEX IF NOT EXISTS idx_results_project_scenario_created
+            ON results (project, scenario, created_at);
+        CREATE INDEX IF NOT EXISTS idx_tool_calls_name ON tool_calls (name, failed);
+        CREATE INDEX IF NOT EXISTS idx_checkpoint_events_checkpoint
+            ON checkpoint_events (checkpoint_id);
+    """)
+    cursor = await db.execute("SELECT run_id, turns_json FROM runs")
+    async for run_id, turns_json in cursor:
+        turns = [Turn.model_validate(t) for t in json.loads(turns_json or "[]")]
+        await _insert_run_children(db, run_id, turns)
+    await db.commit()
+
+
+async def _add_run_tags(db: aiosqlite.Connection) -> None:
+    await db.executescript("""
+        CREATE TABLE IF NOT EXISTS run_tags (
+            run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+            tag TEXT NOT NULL, PRIMARY KEY (run_id, tag));
+        CREATE INDEX IF NOT EXISTS idx_run_tags_tag ON run_tags (tag, run_id);
+    """)
+
+
+async def _add_payload_format(db: aiosqlite.Connection) -> None:
+    await db.executescript("""
+        ALTER TABLE runs ADD COLUMN payload_format INTEGER NOT NULL DEFAULT 0;
+        ALTER TABLE runs ADD COLUMN dict_id INTEGER REFERENCES compression_dicts(dict_id);
+        CREATE TABLE IF NOT EXISTS compression_dicts (
+            dict_id INTEGER PRIMARY KEY AUTOINCREMENT, project TEXT NOT NULL,
+            data BLOB NOT NULL, created_at TEXT NOT NULL);
+    """)
+
+
+async def _link_runs_to_results(db: aiosqlite.Connection) -> None:
+    await db.executescript("""
+        ALTER TABLE runs ADD COLUMN result_id INTEGER
+            REFERENCES results(result_id) ON DELETE SET NULL;
+        CREATE INDEX IF NOT EXISTS idx_runs_result ON runs (result_id);
+    """)
+
+
+async def _index_runs_created_at(db: aiosqlite.Connection) -> None:
+    await db.execute("CREATE INDEX IF NOT EXISTS idx_runs_created ON runs (created_at)")
+
+
+async def _add_snapshots(db: aiosqlite.Connection) -> None:
+    """Store turn and final states once per distinct content, optionally as deltas."""
+    await db.executescript("""
+        CREATE TABLE IF NOT EXISTS snapshots (
+            hash TEXT PRIMARY KEY, base_hash TEXT, fmt INTEGER NOT NULL DEFAULT 0,
+            data BLOB NOT NULL);
+        CREATE INDEX IF NOT EXISTS idx_snapshots_base ON snapshots (base_hash);
+        CREATE TABLE IF NOT EXISTS run_snapshots (
+            run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+            hash TEXT NOT NULL, PRIMARY KEY (run_id, hash));
+        CREATE INDEX IF NOT EXISTS idx_run_snapshots_hash ON run_snapshots (hash);
+        ALTER TABLE runs ADD COLUMN final_state_hash TEXT;
+    """)
+
+
+async def _add_result_fingerprints(db: aiosqlite.Connection) -> None:
+    """Keep each result's input fingerprint and full details so it can be reused."""
+    await db.executescript("""
+        ALTER TABLE results ADD COLUMN fingerprint TEXT;
+        ALTER TABLE results ADD COLUMN details_json TEXT;
+        CREATE INDEX IF NOT EXISTS idx_results_fingerprint
+            ON results (project, scenario, fingerprint);
+    """)
+
+
+async def _add_result_durations(db: aiosqlite.Connection) -> None:
+    """Record how long each result took, for duration-balanced sharding."""
+    await db.execute("ALTER TABLE results ADD COLUMN duration_ms REAL DEFAULT 0.0")
+
+
+async def _add_result_agent_versions(db: aiosqlite.Connection) -> None:
+    """Record which agent version produced each result, for comparing versions."""
+    await db.executescript("""
+        ALTER TABLE results ADD COLUMN agent_version TEXT;
+        CREATE INDEX IF NOT EXISTS idx_results_agent_version
+            ON results (project, agent_version, created_at);
+    """)
+
+
+# Each entry upgrades the schema by one version; PRAGMA user_version records the last one applied.
+_MIGRATIONS: list[Callable[[aiosqlite.Connection], Awaitable[None]]] = [
+    _create_base_tables,
+    _normalize_turns,
+    _add_run_tags,
+    _add_payload_format,
+    _link_runs_to_results,
+    _index_runs_created_at,
+    _add_snapshots,
+    _add_result_fingerprints,
+    _add_result_durations,
+    _add_result_agent_versions,
+]
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+RUN_SUMMARY_COLUMNS = (
+    "run_id", "project", "scenario", "success", "total_tokens", "total_cost",
+    "total_latency_ms", "checkpoints_reached", "created_at", "result_id",
+)
+RUN_PAYLOAD_COLUMNS = ("turns_json", "final_state_json")
+_PAYLOAD_CODEC_COLUMNS = ("payload_format", "dict_id", "final_state_hash")
+TURN_COLUMNS = (
+    "run_id", "turn_id", "user_message", "agent_message", "tokens", "cost", "latency_ms",
+)
+TOOL_CALL_COLUMNS = (
+    "run_id", "turn_id", "seq", "name", "arguments_json", "result_json", "failed", "latency_ms",
+)
+RESULT_COLUMNS = (
+    "result_id", "project", "scenario", "k", "pass_k", "state_correctness",
+    "checkpoint_completion", "tool_accuracy", "forbidden_violations", "avg_turns",
+    "avg_tokens", "avg_cost", "avg_latency_ms", "created_at", "fingerprint", "duration_ms",
+    "agent_version",
+)
+
+# Result metrics usable in trend queries, mapped to whether a higher value is better.
+TREND_METRICS: dict[str, bool] = {
+    "pass_k": True, "state_correctness": True, "checkpoint_completion": True,
+    "tool_accuracy": True, "forbidden_violations": False, "avg_turns": False,
+    "avg_tokens": False, "avg_cost": False, "avg_latency_ms": False,
+}
+
+
+def _trend_metric(metric: str) -> str:
+    """Validate a metric name before it is interpolated into SQL."""
+    if metric not in TREND_METRICS:
+        raise ValueError(f"Unknown metric: {metric}. Use one of {', '.join(TREND_METRICS)}.")
+    return metric
+
+
+async def _insert_run_children(db: aiosqlite.Connection, run_id: str, turns: list[Turn]) -> None:
+    """Write the normalized turn, tool call and checkpoint rows for one run."""
+    turn_rows = []
+    tool_rows = []
+    checkpoint_rows = []
+    for turn in turns:
+        response = turn.agent_response
+        turn_rows.append((
+            run_id, turn.turn_id, turn.user_message, response.message,
+            response.metadata.get("tokens", 0), response.metadata.get("cost", 0.0),
+            sum(tc.latency_ms for tc in response.tool_calls),
+        ))
+        tool_rows.extend(
+            (run_id, turn.turn_id, seq, tc.name, json.dumps(tc.arguments),
+             json.dumps(tc.result), int(_tool_call_failed(tc.result)), tc.latency_ms)
+            for seq, tc in enumerate(response.tool_calls)
+        )
+        checkpoint_rows.extend((run_id, turn.turn_id, cp) for cp in turn.elapsed_checkpoints)
+    await db.executemany("INSERT INTO turns VALUES (?,?,?,?,?,?,?)", turn_rows)
+    await db.executemany("INSERT INTO tool_calls VALUES (?,?,?,?,?,?,?,?)", tool_rows)
+    await db.executemany("INSERT OR IGNORE INTO checkpoint_events VALUES (?,?,?)", checkpoint_rows)
+
+
+class Store(StorageBackend):
+    """Async SQLite store for runs and results.
+
+    ``compression`` selects how new turn and state payloads are written:
+    ``"none"``, ``"zlib"`` or ``"zstd"`` (which uses the project's trained
+    dictionary once ``compact`` has built one). Rows in any format are
+    decoded transparently on read.
+    """
+
+    def __init__(self, db_path: str, compression: str = "zlib") -> None:
+        if compression not in CODECS:
+            raise ValueError(f"Unknown compression: {compression}. Use one of {sorted(CODECS)}.")
         self.db_path = db_path
+        self.compression = compression
         self._db: aiosqlite.Connection | None = None
+        self._codecs: dict[tuple[int, int | None], PayloadCodec] = {}
+        self._project_dicts: dict[str, int | None] = {}
 
     async def init(self) -> None:
         self._db = await aiosqlite.connect(self.db_path)
-        await self._db.executescript("""
-            CREATE TABLE IF NOT EXISTS runs (
-                run_id TEXT PRIMARY KEY, project TEXT NOT NULL, scenario TEXT NOT NULL,
-                success INTEGER NOT NULL, total_tokens INTEGER DEFAULT 0,
-                total_cost REAL DEFAULT 0.0, total_latency_ms REAL DEFAULT 0.0,
-                checkpoints_reached TEXT DEFAULT '[]', turns_json TEXT DEFAULT '[]',
-                final_state_json TEXT DEFAULT '{}', created_at TEXT NOT NULL);
-            CREATE TABLE IF NOT EXISTS results (
-                result_id INTEGER PRIMARY KEY AUTOINCREMENT, project TEXT NOT NULL,
-                scenario TEXT NOT NULL, k INTEGER NOT NULL, pass_k REAL DEFAULT 0.0,
-                state_correctness REAL DEFAULT 0.0, checkpoint_completion REAL DEFAULT 0.0,
-                tool_accuracy REAL DEFAULT 0.0, forbidden_violations INTEGER DEFAULT 0,
-                avg_turns REAL DEFAULT 0.0, avg_tokens INTEGER DEFAULT 0,
-                avg_cost REAL DEFAULT 0.0, avg_latency_ms REAL DEFAULT 0.0,
-                created_at TEXT NOT NULL);
-        """)
-        await self._db.commit()
+        await self._db.execute("PRAGMA foreign_keys = ON")
+        # auto_vacuum only takes effect before the file is first written and lets
+        # gc() return free pages incrementally. WAL lets readers proceed during
+        # writes; busy_timeout makes concurrent writers wait instead of failing.
+        await self._db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        await self._db.execute("PRAGMA journal_mode = WAL")
+        await self._db.execute("PRAGMA busy_timeout = 5000")
+        await self._migrate()
+
+    async def _migrate(self) -> None:
+        """Apply any schema migrations newer than the database's user_version."""
+        cursor = await self._db.execute("PRAGMA user_version")
+        (version,) = await cursor.fetchone()
+        for target, migration in enumerate(_MIGRATIONS[version:], start=version + 1):
+            await migration(self._db)
+            await self._db.execute(f"PRAGMA user_version = {target}")
+            await self._db.commit()
 
     async def close(self) -> None:
         if self._db:
             await self._db.close()
 
+    async def _codec(self, fmt: int, dict_id: int | None = None) -> PayloadCodec:
+        """Return a cached codec for a payload format and dictionary."""
+        key = (fmt, dict_id)
+        if key not in self._codecs:
+            dictionary = None
+            if dict_id is not None:
+                cursor = await self._db.execute(
+                    "SELECT data FROM compression_dicts WHERE dict_id = ?", (dict_id,)
+                )
+                (dictionary,) = await cursor.fetchone()
+            self._codecs[key] = PayloadCodec(fmt, dictionary)
+        return self._codecs[key]
+
+    async def _write_codec(self, project: str) -> tuple[int | None, PayloadCodec]:
+        """Return the dictionary id and codec used for new payloads of a project."""
+        fmt = CODECS[self.compression]
+        if fmt != ZSTD:
+            return None, await self._codec(fmt)
+        if project not in self._project_dicts:
+            cursor = await self._db.execute(
+                "SELECT MAX(dict_id) FROM compression_dicts WHERE project = ?", (project,)
+            )
+            (self._project_dicts[project],) = await cursor.fetchone()
+        dict_id = self._project_dicts[project]
+        return dict_id, await self._codec(fmt, dict_id)
+
+    async def _load_payloads(self, record: dict) -> None:
+        """Replace payload columns with decoded objects, resolving state snapshots.
+
+        ``turns_json`` becomes a list of turn dicts and ``final_state_json`` a
+        dict; pruned payloads decode as empty. The codec and snapshot
+        bookkeeping columns are dropped from the record.
+        """
+        codec = await self._codec(record.pop("payload_format", PLAIN), record.pop("dict_id", None))
+        final_state_hash = record.pop("final_state_hash", None)
+        turns = None
+        refs = set()
+        if "turns_json" in record:
+            turns = json.loads(codec.decode(record["turns_json"]) or "[]")
+            refs.update(t["cumulative_state_ref"] for t in turns if "cumulative_state_ref" in t)
+        if "final_state_json" in record and final_state_hash:
+            refs.add(final_state_hash)
+        states = await self._load_snapshots(refs)
+        if turns is not None:
+            for turn in turns:
+                if "cumulative_state_ref" in turn:
+                    turn["cumulative_state"] = states[turn.pop("cumulative_state_ref")]
+            record["turns_json"] = turns
+        if "final_state_json" in record:
+            if final_state_hash:
+                record["final_state_json"] = states[final_state_hash]
+            else:
+                record["final_state_json"] = json.loads(codec.decode(record["final_state_json"]) or "{}")
+
+    async def _save_snapshots(self, states: list[dict[str, Any]]) -> list[str]:
+        """Store each distinct state once and return the content hash of every state.
+
+        A state not seen before is written as a delta from the preceding state
+        in ``states`` when that is smaller than the full state.
+        """
+        hashed = [_state_hash(state) for state in states]
+        unique = list(dict.fromkeys(h for h, _ in hashed))
+        existing = set()
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            cursor = await self._db.execute(
+                f"SELECT hash FROM snapshots WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+            )
+            existing.update(row[0] for row in await cursor.fetchall())
+
+        codec = await self._codec(CODECS[self.compression])
+        rows = []
+        prev: tuple[str, dict[str, Any]] | None = None
+        for state, (digest, text) in zip(states, hashed):
+            if digest not in existing:
+                base_hash, data = None, text
+                if prev is not None:
+                    delta = json.dumps(_state_delta(prev[1], state), separators=(",", ":"))
+                    if len(delta) < len(text):
+                        base_hash, data = prev[0], delta
+                rows.append((digest, base_hash, codec.fmt, codec.encode(data)))
+                existing.add(digest)
+            prev = (digest, state)
+        await self._db.executemany("INSERT OR IGNORE INTO snapshots VALUES (?,?,?,?)", rows)
+        return [h for h, _ in hashed]
+
+    async def _load_snapshots(self, hashes: set[str]) -> dict[str, dict[str, Any]]:
+        """Rebuild the states for ``hashes``, following delta chains to full snapshots."""
+        rows: dict[str, tuple[str | None, Any]] = {}
+        pending = set(hashes)
+        while pending:
+            batch = list(pending)[:500]
+            pending.difference_update(batch)
+            cursor = await self._db.execute(
+                f"SELECT hash, base_hash, fmt, data FROM snapshots "
+                f"WHERE hash IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for digest, base_hash, fmt, data in await cursor.fetchall():
+                codec = await self._codec(fmt)
+                rows[digest] = (base_hash, json.loads(codec.decode(data)))
+                if base_hash is not None and base_hash not in rows:
+                    pending.add(base_hash)
+
+        states: dict[str, dict[str, Any]] = {}
+        for digest in hashes:
+            chain = []
+            while digest not in states:
+                chain.append(digest)
+                base_hash = rows[digest][0]
+                if base_hash is None:
+                    break
+                digest = base_hash
+            for digest in reversed(chain):
+                base_hash, data = rows[digest]
+                states[digest] = data if base_hash is None else _apply_delta(states[base_hash], data)
+        return states
+
     async def _query(
         self,
         table: str,
@@ -63,40 +429,620 @@ class Store:
         columns = [desc[0] for desc in cursor.description]
         return columns, rows
 
-    async def save_run(self, run: Run, project: str) -> None:
+    async def _iter_rows(
+        self,
+        table: str,
+        key: tuple[str, ...],
+        columns: list[str],
+        where: list[str],
+        params: list[Any],
+        after: tuple[Any, ...] | None,
+        page_size: int,
+        descending: bool,
+    ) -> AsyncIterator[dict]:
+        """Yield rows page by page using keyset pagination on the ``key`` columns."""
+        select = ", ".join(dict.fromkeys([*key, *columns]))
+        op, direction = ("<", "DESC") if descending else (">", "ASC")
+        order = ", ".join(f"{k} {direction}" for k in key)
+        while True:
+            clauses = list(where)
+            page_params = list(params)
+            if after is not None:
+                placeholders = ", ".join("?" for _ in key)
+                clauses.append(f"({', '.join(key)}) {op} ({placeholders})")
+                page_params.extend(after)
+            cursor = await self._db.execute(
+                f"SELECT {select} FROM {table} WHERE {' AND '.join(clauses)} "
+                f"ORDER BY {order} LIMIT ?",
+                [*page_params, page_size],
+            )
+            names = [desc[0] for desc in cursor.description]
+            rows = await cursor.fetchall()
+            for row in rows:
+                yield dict(zip(names, row))
+            if len(rows) < page_size:
+                return
+            last = dict(zip(names, rows[-1]))
+            after = tuple(last[k] for k in key)
+
+    async def save_run(
+        self,
+        run: Run,
+        project: str,
+        tags: list[str] | None = None,
+        created_at: str | None = None,
+    ) -> None:
+        # Deleting first cascades to the normalized child rows of a previous save.
+        dict_id, codec = await self._write_codec(project)
+        await self._db.execute("DELETE FROM runs WHERE run_id = ?", (run.run_id,))
+        # Turn and final states are stored by reference into the snapshots table.
+        *turn_hashes, final_state_hash = await self._save_snapshots(
+            [t.cumulative_state for t in run.turns] + [run.final_state]
+        )
+        turns = [t.model_dump(exclude={"cumulative_state"}) for t in run.turns]
+        for turn, digest in zip(turns, turn_hashes):
+            turn["cumulative_state_ref"] = digest
         await self._db.execute(
-            "INSERT OR REPLACE INTO runs VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+            "INSERT INTO runs (run_id,project,scenario,success,total_tokens,total_cost,"
+            "total_latency_ms,checkpoints_reached,created_at,payload_format,dict_id,"
+            "turns_json,final_state_json,final_state_hash) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,NULL,?)",
             (run.run_id, project, run.scenario, int(run.success),
              run.total_tokens, run.total_cost, run.total_latency_ms,
-             json.dumps(run.checkpoints_reached),
-             json.dumps([t.model_dump() for t in run.turns]),
-             json.dumps(run.final_state), _utc_now_iso()),
+             json.dumps(run.checkpoints_reached), created_at or _utc_now_iso(), codec.fmt, dict_id,
+             codec.encode(json.dumps(turns)), final_state_hash),
+        )
+        await self._db.executemany(
+            "INSERT OR IGNORE INTO run_snapshots VALUES (?,?)",
+            [(run.run_id, h) for h in dict.fromkeys([*turn_hashes, final_state_hash])],
+        )
+        await _insert_run_children(self._db, run.run_id, run.turns)
+        await self._db.executemany(
+            "INSERT OR IGNORE INTO run_tags VALUES (?,?)",
+            [(run.run_id, tag) for tag in tags or []],
         )
         await self._db.commit()
 
+    async def has_run(self, run_id: str) -> bool:
+        cursor = await self._db.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,))
+        return await cursor.fetchone() is not None
+
     async def load_runs(self, project: str, scenario: str | None = None) -> list[dict]:
         columns, rows = await self._query("runs", project, scenario)
         results = []
         for row in rows:
             record = dict(zip(columns, row))
+            await self._load_payloads(record)
+            record["turns_json"] = json.dumps(record["turns_json"])
+            record["final_state_json"] = json.dumps(record["final_state_json"])
             record["success"] = bool(record["success"])
             record["checkpoints_reached"] = json.loads(record["checkpoints_reached"])
             results.append(record)
         return results
 
-    async def save_result(self, result: EvalResult) -> None:
-        await self._db.execute(
+    async def iter_runs(
+        self,
+        project: str,
+        scenario: str | None = None,
+        *,
+        columns: list[str] | None = None,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+        success: bool | None = None,
+        tag: str | None = None,
+        result_id: int | None = None,
+        after: tuple[str, str] | None = None,
+        page_size: int = 500,
+        descending: bool = False,
+    ) -> AsyncIterator[dict]:
+        """Stream runs ordered by (created_at, run_id) without materializing the table.
+
+        Only the summary columns are read unless ``columns`` asks for more; the
+        turn payload is left in the database until ``load_turns`` is called.
+        ``created_at`` and ``run_id`` are always included so the last record
+        can be passed back as ``after`` to resume.
+        """
+        columns = list(columns or RUN_SUMMARY_COLUMNS)
+        unknown = set(columns) - set(RUN_SUMMARY_COLUMNS) - set(RUN_PAYLOAD_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown run columns: {sorted(unknown)}")
+        where = ["project = ?"]
+        params: list[Any] = [project]
+        if scenario:
+            where.append("scenario = ?")
+            params.append(scenario)
+        if since is not None:
+            where.append("created_at >= ?")
+            params.append(_iso(since))
+        if until is not None:
+            where.append("created_at < ?")
+            params.append(_iso(until))
+        if success is not None:
+            where.append("success = ?")
+            params.append(int(success))
+        if tag is not None:
+            where.append("run_id IN (SELECT run_id FROM run_tags WHERE tag = ?)")
+            params.append(tag)
+        if result_id is not None:
+            where.append("result_id = ?")
+            params.append(result_id)
+        if set(columns) & set(RUN_PAYLOAD_COLUMNS):
+            columns += _PAYLOAD_CODEC_COLUMNS
+        rows = self._iter_rows(
+            "runs", ("created_at", "run_id"), columns, where, params, after, page_size, descending,
+        )
+        async for record in rows:
+            await self._load_payloads(record)
+            if "success" in record:
+                record["success"] = bool(record["success"])
+            if "checkpoints_reached" in record:
+                record["checkpoints_reached"] = json.loads(record["checkpoints_reached"])
+            if "turns_json" in record:
+                record["turns"] = [Turn.model_validate(t) for t in record.pop("turns_json")]
+            if "final_state_json" in record:
+                record["final_state"] = record.pop("final_state_json")
+            yield record
+
+    async def load_turns(self, run_id: str) -> list[Turn]:
+        """Decode the full turn history of a single run.
+
+        Runs whose payload was pruned by ``gc`` have an empty history.
+        """
+        cursor = await self._db.execute(
+            "SELECT turns_json, payload_format, dict_id FROM runs WHERE run_id = ?", (run_id,)
+        )
+        row = await cursor.fetchone()
+        if row is None:
+            raise KeyError(run_id)
+        record = dict(zip(("turns_json", "payload_format", "dict_id"), row))
+        await self._load_payloads(record)
+        return [Turn.model_validate(t) for t in record["turns_json"]]
+
+    async def compact(
+        self,
+        project: str | None = None,
+        batch_size: int = 500,
+        dictionary_samples: int = 1000,
+        vacuum: bool = True,
+    ) -> int:
+        """Rewrite stored payloads in the store's compression format.
+
+        With zstd a fresh dictionary is trained per project from a sample of its
+        payloads first. Rows are rewritten in batches, each committed on its own,
+        and the file is vacuumed afterwards to return the freed pages. Returns
+        the number of rows rewritten.
+        """
+        fmt = CODECS[self.compression]
+        if project:
+            projects = [project]
+        else:
+            cursor = await self._db.execute("SELECT DISTINCT project FROM runs")
+            projects = [row[0] for row in await cursor.fetchall()]
+
+        rewritten = 0
+        for proj in projects:
+            dict_id = None
+            if fmt == ZSTD:
+                dict_id = await self._train_project_dictionary(proj, dictionary_samples)
+            codec = await self._codec(fmt, dict_id)
+            last_id = ""
+            while True:
+                cursor = await self._db.execute(
+                    "SELECT run_id, turns_json, final_state_json, payload_format, dict_id "
+                    "FROM runs WHERE project = ? AND run_id > ? "
+                    "AND NOT (payload_format = ? AND dict_id IS ?) ORDER BY run_id LIMIT ?",
+                    (proj, last_id, fmt, dict_id, batch_size),
+                )
+                rows = await cursor.fetchall()
+                if not rows:
+                    break
+                updates = []
+                for run_id, turns_json, final_state_json, old_fmt, old_dict_id in rows:
+                    old = await self._codec(old_fmt, old_dict_id)
+                    updates.append((
+                        codec.encode(old.decode(turns_json)),
+                        codec.encode(old.decode(final_state_json)),
+                        fmt, dict_id, run_id,
+                    ))
+                await self._db.executemany(
+                    "UPDATE runs SET turns_json = ?, final_state_json = ?, payload_format = ?, "
+                    "dict_id = ? WHERE run_id = ?",
+                    updates,
+                )
+                await self._db.commit()
+                rewritten += len(rows)
+                last_id = rows[-1][0]
+        if vacuum:
+            await self._db.execute("VACUUM")
+        return rewritten
+
+    async def _train_project_dictionary(self, project: str, samples: int) -> int | None:
+        """Train and store a zstd dictionary from a sample of a project's payloads."""
+        cursor = await self._db.execute(
+            "SELECT turns_json, final_state_json, payload_format, dict_id FROM runs "
+            "WHERE project = ? ORDER BY created_at DESC LIMIT ?",
+            (project, samples),
+        )
+        payloads: list[bytes] = []
+        for turns_json, final_state_json, fmt, dict_id in await cursor.fetchall():
+            codec = await self._codec(fmt, dict_id)
+            payloads.extend(
+                codec.decode(v).encode() for v in (turns_json, final_state_json) if v is not None
+            )
+        dictionary = train_dictionary(payloads)
+        if dictionary is None:
+            return None
+        cursor = await self._db.execute(
+            "INSERT INTO compression_dicts (project, data, created_at) VALUES (?,?,?)",
+            (project, dictionary, _utc_now_iso()),
+        )
+        await self._db.commit()
+        self._project_dicts[project] = cursor.lastrowid
+        return cursor.lastrowid
+
+    async def gc(
+        self,
+        payload_days: int | None = None,
+        run_days: int | None = None,
+        project: str | None = None,
+        batch_size: int = 500,
+        vacuum_pages: int = 1000,
+        full_vacuum: bool = False,
+    ) -> dict[str, int]:
+        """Drop payloads older than ``payload_days`` and runs older than ``run_days``, in batches.
+
+        Results are always kept. Space is reclaimed by incremental vacuum, or by a
+        full rewrite with ``full_vacuum``.
+        """
+        now = datetime.now(timezone.utc)
+        scope = " AND project = ?" if project else ""
+        scope_params = [project] if project else []
+        stats = {
+            "pruned_payloads": 0, "deleted_runs": 0, "deleted_snapshots": 0,
+            "vacuumed_pages": 0, "vacuum_steps": 0,
+        }
+
+        if run_days is not None:
+            cutoff = _iso(now - timedelta(days=run_days))
+            stats["deleted_runs"] = await self._in_batches(
+                f"SELECT run_id FROM runs WHERE created_at < ?{scope} LIMIT ?",
+                [cutoff, *scope_params, batch_size],
+                ["DELETE FROM runs WHERE run_id = ?"],
+            )
+        if payload_days is not None:
+            cutoff = _iso(now - timedelta(days=payload_days))
+            stats["pruned_payloads"] = await self._in_batches(
+                f"SELECT run_id FROM runs WHERE created_at < ? AND turns_json IS NOT NULL{scope} LIMIT ?",
+                [cutoff, *scope_params, batch_size],
+                [
+                    "UPDATE runs SET turns_json = NULL, final_state_json = NULL, "
+                    "final_state_hash = NULL WHERE run_id = ?",
+                    "DELETE FROM run_snapshots WHERE run_id = ?",
+                    "DELETE FROM turns WHERE run_id = ?",
+                    "DELETE FROM tool_calls WHERE run_id = ?",
+                    "DELETE FROM checkpoint_events WHERE run_id = ?",
+                ],
+            )
+        stats["deleted_snapshots"] = await self._sweep_snapshots(batch_size)
+
+        if full_vacuum:
+            await self._db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            await self._db.execute("VACUUM")
+            return stats
+        while True:
+            cursor = await self._db.execute("PRAGMA freelist_count")
+            (free_before,) = await cursor.fetchone()
+            if not free_before:
+                break
+            # The pragma frees one page per VM step, and sqlite3 cursors step a
+            # statement that returns no rows only once; executescript runs it to completion.
+            await self._db.executescript(f"PRAGMA incremental_vacuum({int(vacuum_pages)});")
+            await self._db.commit()
+            cursor = await self._db.execute("PRAGMA freelist_count")
+            (free_after,) = await cursor.fetchone()
+            if free_after >= free_before:
+                break  # auto_vacuum is off for this file; only full_vacuum can shrink it
+            stats["vacuumed_pages"] += free_before - free_after
+            stats["vacuum_steps"] += 1
+        return stats
+
+    async def _sweep_snapshots(self, batch_size: int) -> int:
+        """Delete snapshots that no run references, directly or as a delta base."""
+        total = 0
+        while True:
+            cursor = await self._db.execute(
+                "DELETE FROM snapshots WHERE hash IN (SELECT s.hash FROM snapshots s "
+                "WHERE NOT EXISTS (SELECT 1 FROM run_snapshots r WHERE r.hash = s.hash) "
+                "AND NOT EXISTS (SELECT 1 FROM snapshots c WHERE c.base_hash = s.hash) LIMIT ?)",
+                (batch_size,),
+            )
+            await self._db.commit()
+            if cursor.rowcount <= 0:
+                return total
+            total += cursor.rowcount
+
+    async def _in_batches(self, select: str, params: list[Any], statements: list[str]) -> int:
+        """Run ``statements`` for each selected run_id, committing once per batch.
+
+        ``select`` must stop matching a run once the statements have been applied to it.
+        """
+        total = 0
+        while True:
+            cursor = await self._db.execute(select, params)
+            batch = await cursor.fetchall()
+            if not batch:
+                return total
+            for statement in statements:
+                await self._db.executemany(statement, batch)
+            await self._db.commit()
+            total += len(batch)
+
+    def iter_turns(
+        self,
+        project: str,
+        scenario: str | None = None,
+        *,
+        after: tuple[str, int] | None = None,
+        page_size: int = 5000,
+    ) -> AsyncIterator[dict]:
+        """Stream normalized turn rows ordered by (run_id, turn_id)."""
+        where, params = self._child_scope(project, scenario)
+        return self._iter_rows(
+            "turns", ("run_id", "turn_id"), list(TURN_COLUMNS), where, params, after, page_size, False,
+        )
+
+    def iter_tool_calls(
+        self,
+        project: str,
+        scenario: str | None = None,
+        *,
+        after: tuple[str, int, int] | None = None,
+        page_size: int = 5000,
+    ) -> AsyncIterator[dict]:
+        """Stream tool call rows as stored, with the JSON columns left encoded."""
+        where, params = self._child_scope(project, scenario)
+        return self._iter_rows(
+            "tool_calls", ("run_id", "turn_id", "seq"), list(TOOL_CALL_COLUMNS),
+            where, params, after, page_size, False,
+        )
+
+    @staticmethod
+    def _child_scope(project: str, scenario: str | None) -> tuple[list[str], list[Any]]:
+        """Build the WHERE clause restricting a child table to one project's runs."""
+        if scenario:
+            return (
+                ["run_id IN (SELECT run_id FROM runs WHERE project = ? AND scenario = ?)"],
+                [project, scenario],
+            )
+        return ["run_id IN (SELECT run_id FROM runs WHERE project = ?)"], [project]
+
+    async def load_tool_calls(
+        self,
+        project: str,
+        scenario: str | None = None,
+        name: str | None = None,
+        failed: bool | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Load tool calls joined with their runs, newest runs first."""
+        query = (
+            "SELECT r.run_id, r.scenario, r.created_at, tc.turn_id, tc.seq, tc.name, "
+            "tc.arguments_json, tc.result_json, tc.failed, tc.latency_ms "
+            "FROM tool_calls tc JOIN runs r ON r.run_id = tc.run_id WHERE r.project = ?"
+        )
+        params: list[Any] = [project]
+        if scenario:
+            query += " AND r.scenario = ?"
+            params.append(scenario)
+        if name:
+            query += " AND tc.name = ?"
+            params.append(name)
+        if failed is not None:
+            query += " AND tc.failed = ?"
+            params.append(int(failed))
+        query += " ORDER BY r.created_at DESC, tc.turn_id, tc.seq"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        cursor = await self._db.execute(query, params)
+        columns = [desc[0] for desc in cursor.description]
+        records = []
+        for row in await cursor.fetchall():
+            record = dict(zip(columns, row))
+            record["arguments"] = json.loads(record.pop("arguments_json"))
+            record["result"] = json.loads(record.pop("result_json"))
+            record["failed"] = bool(record["failed"])
+            records.append(record)
+        return records
+
+    async def save_result(self, result: EvalResult, created_at: str | None = None) -> int:
+        """Insert an aggregated result, link its stored runs to it and return its id."""
+        cursor = await self._db.execute(
             "INSERT INTO results (project,scenario,k,pass_k,state_correctness,"
             "checkpoint_completion,tool_accuracy,forbidden_violations,avg_turns,"
-            "avg_tokens,avg_cost,avg_latency_ms,created_at) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)",
+            "avg_tokens,avg_cost,avg_latency_ms,created_at,fingerprint,details_json,duration_ms,"
+            "agent_version) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
             (result.project, result.scenario, result.k, result.pass_k,
              result.state_correctness, result.checkpoint_completion,
              result.tool_accuracy, result.forbidden_tool_violations,
              result.avg_turns, result.avg_tokens, result.avg_cost,
-             result.avg_latency_ms, _utc_now_iso()),
+             result.avg_latency_ms, created_at or _utc_now_iso(), result.fingerprint,
+             result.model_dump_json(exclude={"runs"}), result.duration_ms,
+             result.agent_version),
+        )
+        result_id = cursor.lastrowid
+        await self.link_runs(result_id, [run.run_id for run in result.runs])
+        return result_id
+
+    async def link_runs(self, result_id: int, run_ids: list[str]) -> None:
+        """Point the stored runs among ``run_ids`` at the result they were aggregated into."""
+        await self._db.executemany(
+            "UPDATE runs SET result_id = ? WHERE run_id = ?", [(result_id, run_id) for run_id in run_ids],
         )
         await self._db.commit()
 
+    async def find_result_id(self, project: str, scenario: str, created_at: str) -> int | None:
+        """Id of the result of ``scenario`` saved with exactly this timestamp, if any."""
+        cursor = await self._db.execute(
+            "SELECT result_id FROM results WHERE project = ? AND scenario = ? AND created_at = ? LIMIT 1",
+            (project, scenario, created_at),
+        )
+        row = await cursor.fetchone()
+        return row[0] if row else None
+
     async def load_results(self, project: str, scenario: str | None = None) -> list[dict]:
         columns, rows = await self._query("results", project, scenario, order_by="created_at DESC")
-        return [dict(zip(columns, row)) for row in rows]
+        return [
+            {c: v for c, v in zip(columns, row) if c != "details_json"}
+            for row in rows
+        ]
+
+    async def latest_results(self, project: str, agent_version: str) -> list[dict]:
+        """The newest result of each scenario evaluated with ``agent_version``, by scenario."""
+        columns = ",".join(RESULT_COLUMNS)
+        return await self._fetch_dicts(
+            f"SELECT {columns} FROM ("
+            f"SELECT {columns}, ROW_NUMBER() OVER ("
+            f"PARTITION BY scenario ORDER BY created_at DESC, result_id DESC) AS rn "
+            f"FROM results WHERE project = ? AND agent_version = ?"
+            f") WHERE rn = 1 ORDER BY scenario",
+            [project, agent_version],
+        )
+
+    async def scenario_durations(
+        self, project: str, last: int = 5, until: str | datetime | None = None,
+    ) -> dict[str, float]:
+        """Mean wall-clock milliseconds per run of each scenario over its last ``last`` timed results.
+
+        ``until`` only counts results created before it.
+        """
+        where = ["project = ?", "duration_ms > 0", "k > 0"]
+        params: list[Any] = [project]
+        if until is not None:
+            where.append("created_at < ?")
+            params.append(_iso(until))
+        rows = await self._fetch_dicts(
+            "SELECT scenario, AVG(duration_ms / k) AS per_run FROM ("
+            "SELECT scenario, duration_ms, k, ROW_NUMBER() OVER ("
+            "PARTITION BY scenario ORDER BY created_at DESC, result_id DESC) AS n "
+            f"FROM results WHERE {' AND '.join(where)}"
+            ") WHERE n <= ? GROUP BY scenario",
+            params + [last],
+        )
+        return {row["scenario"]: row["per_run"] for row in rows}
+
+    async def find_result(self, project: str, scenario: str, fingerprint: str) -> EvalResult | None:
+        """Return the latest result of a scenario with this input fingerprint, without its runs."""
+        cursor = await self._db.execute(
+            "SELECT details_json FROM results WHERE project = ? AND scenario = ? "
+            "AND fingerprint = ? AND details_json IS NOT NULL "
+            "ORDER BY created_at DESC, result_id DESC LIMIT 1",
+            (project, scenario, fingerprint),
+        )
+        row = await cursor.fetchone()
+        return EvalResult.model_validate_json(row[0]) if row else None
+
+    async def _fetch_dicts(self, query: str, params: list[Any]) -> list[dict]:
+        cursor = await self._db.execute(query, params)
+        columns = [desc[0] for desc in cursor.description]
+        return [dict(zip(columns, row)) for row in await cursor.fetchall()]
+
+    async def trend(
+        self,
+        project: str,
+        scenario: str,
+        metric: str = "pass_k",
+        last: int = 30,
+        window: int = 5,
+    ) -> list[dict]:
+        """Return a metric over the last ``last`` results of a scenario, oldest first.
+
+        Each point carries the value and its moving average over ``window`` results.
+        """
+        metric = _trend_metric(metric)
+        return await self._fetch_dicts(
+            f"SELECT result_id, created_at, value, AVG(value) OVER ("
+            f"ORDER BY created_at, result_id ROWS BETWEEN {max(int(window), 1) - 1} PRECEDING "
+            f"AND CURRENT ROW) AS moving_avg FROM ("
+            f"SELECT result_id, created_at, {metric} AS value FROM results "
+            f"WHERE project = ? AND scenario = ? ORDER BY created_at DESC, result_id DESC LIMIT ?"
+            f") ORDER BY created_at, result_id",
+            [project, scenario, last],
+        )
+
+    async def trend_summary(self, project: str, metric: str = "pass_k", last: int = 30) -> list[dict]:
+        """Summarize a metric per scenario over each scenario's last ``last`` results."""
+        metric = _trend_metric(metric)
+        return await self._fetch_dicts(
+            f"SELECT scenario, COUNT(*) AS n, "
+            f"MAX(CASE WHEN rn = 1 THEN value END) AS latest, AVG(value) AS mean, "
+            f"MIN(value) AS min, MAX(value) AS max FROM ("
+            f"SELECT scenario, {metric} AS value, ROW_NUMBER() OVER ("
+            f"PARTITION BY scenario ORDER BY created_at DESC, result_id DESC) AS rn "
+            f"FROM results WHERE project = ?) WHERE rn <= ? GROUP BY scenario ORDER BY scenario",
+            [project, last],
+        )
+
+    async def regressions(
+        self,
+        project: str,
+        metric: str = "pass_k",
+        baseline: int = 5,
+        threshold: float = 0.0,
+    ) -> list[dict]:
+        """Find scenarios whose latest result is worse than their recent baseline.
+
+        The baseline is the mean of the ``baseline`` results before the latest
+        one. A scenario regresses when it moved in the bad direction for the
+        metric by more than ``threshold``. Worst regressions come first.
+        """
+        metric = _trend_metric(metric)
+        higher_is_better = TREND_METRICS[metric]
+        frame = (
+            "PARTITION BY scenario ORDER BY created_at DESC, result_id DESC "
+            f"ROWS BETWEEN 1 FOLLOWING AND {max(int(baseline), 1)} FOLLOWING"
+        )
+        worse, order = ("< -?", "ASC") if higher_is_better else ("> ?", "DESC")
+        return await self._fetch_dicts(
+            f"SELECT scenario, result_id, created_at, value, baseline, baseline_n, "
+            f"value - baseline AS delta FROM ("
+            f"SELECT scenario, result_id, created_at, {metric} AS value, "
+            f"ROW_NUMBER() OVER (PARTITION BY scenario ORDER BY created_at DESC, result_id DESC) AS rn, "
+            f"AVG({metric}) OVER ({frame}) AS baseline, COUNT(*) OVER ({frame}) AS baseline_n "
+            f"FROM results WHERE project = ?) "
+            f"WHERE rn = 1 AND baseline_n > 0 AND value - baseline {worse} ORDER BY delta {order}",
+            [project, threshold],
+        )
+
+    async def iter_results(
+        self,
+        project: str,
+        scenario: str | None = None,
+        *,
+        columns: list[str] | None = None,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+        after: tuple[str, int] | None = None,
+        page_size: int = 500,
+        descending: bool = False,
+    ) -> AsyncIterator[dict]:
+        """Stream aggregated results ordered by (created_at, result_id)."""
+        columns = list(columns or RESULT_COLUMNS)
+        unknown = set(columns) - set(RESULT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown result columns: {sorted(unknown)}")
+        where = ["project = ?"]
+        params: list[Any] = [project]
+        if scenario:
+            where.append("scenario = ?")
+            params.append(scenario)
+        if since is not None:
+            where.append("created_at >= ?")
+            params.append(_iso(since))
+        if until is not None:
+            where.append("created_at < ?")
+            params.append(_iso(until))
+        rows = self._iter_rows(
+            "results", ("created_at", "result_id"), columns, where, params, after, page_size, descending,
+        )
+        async for record in rows:
+            yield record
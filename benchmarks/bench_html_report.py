@@ -0,0 +1,55 @@
+"""Benchmark writing the streamed HTML report for a large number of runs.
+
+Usage: python benchmarks/bench_html_report.py [--scenarios 1000] [--k 50]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from agenteval.models import AgentResponse, EvalResult, Run, ToolCall, Turn
+from agenteval.report import write_html_report
+
+
+def _results(scenarios: int, k: int) -> list[EvalResult]:
+    results = []
+    for s in range(scenarios):
+        turns = [
+            Turn(turn_id=t, user_message=f"Refund order o{s}, step {t}",
+                 agent_response=AgentResponse(
+                     message=f"Looking up order o{s} and processing step {t}.",
+                     tool_calls=[ToolCall(name="lookup_order", arguments={"order_id": f"o{s}"},
+                                          result={"status": "delivered"})],
+                 ))
+            for t in range(3)
+        ]
+        runs = [
+            Run(run_id=f"refund_{s}-{i}", scenario=f"refund_{s}", turns=turns, success=i % 3 != 0,
+                total_tokens=1200 + i, total_cost=0.01, total_latency_ms=2500.0 + i,
+                final_state={"orders": [{"id": f"o{s}", "status": "refunded"}]})
+            for i in range(k)
+        ]
+        results.append(EvalResult(project="bench", scenario=f"refund_{s}", k=k, runs=runs))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=50)
+    args = parser.parse_args()
+
+    results = _results(args.scenarios, args.k)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "report.html"
+        start = time.perf_counter()
+        write_html_report(results, path)
+        elapsed = time.perf_counter() - start
+        size = path.stat().st_size
+    print(f"{args.scenarios * args.k} runs: {elapsed:.2f} s, {size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark cold and warm scenario loading for a large generated suite.
+
+Usage: python benchmarks/bench_scenario_load.py [--files 2000] [--workers N]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from agenteval.scenario import _SafeLoader, load_scenarios_from_dir
+
+
+def _write_suite(directory: Path, count: int) -> None:
+    for i in range(count):
+        data = {
+            "name": f"refund_{i}",
+            "initial_state": {"orders": [{"id": f"o{i}", "status": "delivered", "amount": 10 + i % 90}]},
+            "conversation_script": [f"I want a refund for order o{i}", "Yes, please process it", "Thanks"],
+            "checkpoints": [
+                {"id": "order_found", "require": {"tool_called": "lookup_order"}},
+                {"id": "verified", "depends_on": ["order_found"], "require": {"tool_called": "verify_customer"}},
+                {"id": "refunded", "depends_on": ["verified"],
+                 "require": {"tool_called": "process_refund", "tool_args": {"order_id": f"o{i}"}}},
+            ],
+            "success": "refunded",
+            "expected_final_state": {"orders": [{"id": f"o{i}", "status": "refunded"}]},
+            "expected_tools": {"required": ["lookup_order", "process_refund"], "forbidden": ["delete_account"]},
+            "tags": ["refund", f"bucket-{i % 10}"],
+        }
+        (directory / f"scenario_{i:05d}.yaml").write_text(yaml.safe_dump(data))
+
+
+def _time(label: str, fn) -> float:
+    start = time.perf_counter()
+    scenarios = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms  ({len(scenarios)} scenarios)")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"YAML loader: {_SafeLoader.__name__}")
+    with tempfile.TemporaryDirectory() as tmp:
+        suite = Path(tmp) / "scenarios"
+        suite.mkdir()
+        _write_suite(suite, args.files)
+        cache = Path(tmp) / "scenarios.cache"
+        _time("cold, serial", lambda: load_scenarios_from_dir(str(suite), workers=1))
+        _time("cold, parallel", lambda: load_scenarios_from_dir(str(suite), workers=args.workers))
+        _time("cold, filling cache", lambda: load_scenarios_from_dir(str(suite), cache=cache, workers=args.workers))
+        _time("warm cache", lambda: load_scenarios_from_dir(str(suite), cache=cache))
+
+
+if __name__ == "__main__":
+    main()
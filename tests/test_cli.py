@@ -20,3 +20,328 @@ def test_version(runner):
     from agenteval.cli import app
     result = runner.invoke(app, ["--version"])
     assert "0.1.0" in result.stdout
+
+
+def test_store_compact(runner, tmp_path):
+    import asyncio
+    from agenteval.cli import app
+    from agenteval.models import Run
+    from agenteval.store import Store
+
+    db = str(tmp_path / "runs.db")
+
+    async def _seed():
+        store = Store(db, compression="none")
+        await store.init()
+        await store.save_run(Run(run_id="r1", scenario="s"), project="p")
+        await store.close()
+
+    asyncio.run(_seed())
+    result = runner.invoke(app, ["store", "compact", "--db", db])
+    assert result.exit_code == 0
+    assert "Compacted 1 runs" in result.stdout
+
+
+class EchoAdapter:
+    """Minimal agent used by the CLI tests via --agent tests.test_cli:EchoAdapter."""
+
+    async def send_message(self, message, context):
+        from agenteval.models import AgentResponse, ToolCall
+        return AgentResponse(message=message, tool_calls=[ToolCall(name="greet")],
+                             state_changes={"greeted": True})
+
+    async def reset(self):
+        pass
+
+
+def test_run_persists_to_db(runner, tmp_path):
+    import asyncio
+    from agenteval.cli import app
+    from agenteval.store import Store
+
+    runner.invoke(app, ["init", str(tmp_path / "proj")])
+    db = str(tmp_path / "runs.db")
+    result = runner.invoke(app, [
+        "run", str(tmp_path / "proj" / "scenarios"), "--agent", "tests.test_cli:EchoAdapter",
+        "--k", "2", "--project", "proj", "--db", db,
+    ])
+    assert result.exit_code == 0, result.stdout
+
+    async def _load():
+        store = Store(db)
+        await store.init()
+        try:
+            (stored,) = await store.load_results("proj")
+            runs = [r async for r in store.iter_runs("proj", result_id=stored["result_id"])]
+            return stored, runs
+        finally:
+            await store.close()
+
+    stored, runs = asyncio.run(_load())
+    assert stored["pass_k"] == 1.0
+    assert len(runs) == 2
+    assert all(r["success"] for r in runs)
+
+
+def test_store_gc_uses_config_retention(runner, tmp_path):
+    import asyncio
+    import yaml
+    from agenteval.cli import app
+    from agenteval.models import Run
+    from agenteval.store import Store
+
+    db = str(tmp_path / "runs.db")
+    cfg = tmp_path / "agenteval.yaml"
+    cfg.write_text(yaml.dump({"retention": {"payload_days": 7}}))
+
+    async def _seed():
+        store = Store(db)
+        await store.init()
+        await store.save_run(Run(run_id="r1", scenario="s"), project="p")
+        await store._db.execute("UPDATE runs SET created_at = '2000-01-01'")
+        await store._db.commit()
+        await store.close()
+
+    asyncio.run(_seed())
+    result = runner.invoke(app, ["store", "gc", "--db", db, "--config", str(cfg)])
+    assert result.exit_code == 0
+    assert "Pruned 1 payloads" in result.stdout
+
+
+def test_export_csv(runner, tmp_path):
+    import asyncio
+    from agenteval.cli import app
+    from agenteval.models import Run
+    from agenteval.store import Store
+
+    db = str(tmp_path / "runs.db")
+
+    async def _seed():
+        store = Store(db)
+        await store.init()
+        await store.save_run(Run(run_id="r1", scenario="s"), project="p")
+        await store.close()
+
+    asyncio.run(_seed())
+    out = tmp_path / "out"
+    result = runner.invoke(app, ["export", "--db", db, "--project", "p", "--format", "csv", "--output", str(out)])
+    assert result.exit_code == 0
+    assert (out / "runs.csv").read_text().count("\n") == 2
+
+
+def test_history_regressions(runner, tmp_path):
+    import asyncio
+    from agenteval.cli import app
+    from agenteval.models import EvalResult
+    from agenteval.store import Store
+
+    db = str(tmp_path / "runs.db")
+
+    async def _seed():
+        store = Store(db)
+        await store.init()
+        for pass_k in (1.0, 1.0, 0.3):
+            await store.save_result(EvalResult(project="p", scenario="refund", k=3, pass_k=pass_k))
+        await store.close()
+
+    asyncio.run(_seed())
+    result = runner.invoke(app, ["history", "--db", db, "--project", "p", "--scenario", "refund"])
+    assert result.exit_code == 0
+    assert "moving_avg" in result.stdout
+    result = runner.invoke(app, ["history", "--db", db, "--project", "p", "--regressions", "--ci"])
+    assert result.exit_code == 1
+    assert "refund" in result.stdout
+
+
+def test_run_to_log_then_import(runner, tmp_path):
+    import asyncio
+    from agenteval.cli import app
+    from agenteval.store import Store
+
+    runner.invoke(app, ["init", str(tmp_path / "proj")])
+    log_dir = str(tmp_path / "log")
+    result = runner.invoke(app, [
+        "run", str(tmp_path / "proj" / "scenarios"), "--agent", "tests.test_cli:EchoAdapter",
+        "--k", "2", "--project", "proj", "--log-dir", log_dir,
+    ])
+    assert result.exit_code == 0, result.stdout
+    db = str(tmp_path / "runs.db")
+    result = runner.invoke(app, ["store", "import-log", log_dir, "--db", db])
+    assert result.exit_code == 0
+    assert "Imported 2 runs and 1 results" in result.stdout
+
+    async def _load():
+        store = Store(db)
+        await store.init()
+        try:
+            return await store.load_results("proj")
+        finally:
+            await store.close()
+
+    assert asyncio.run(_load())[0]["pass_k"] == 1.0
+
+
+def test_run_incremental_reuses_unchanged_scenarios(runner, tmp_path):
+    import yaml
+    from agenteval.cli import app
+
+    runner.invoke(app, ["init", str(tmp_path / "proj")])
+    scenarios = tmp_path / "proj" / "scenarios"
+    db = str(tmp_path / "runs.db")
+    args = ["run", str(scenarios), "--agent", "tests.test_cli:EchoAdapter", "--k", "2",
+            "--project", "proj", "--db", db, "--incremental", "--agent-version", "v1"]
+
+    first = runner.invoke(app, args)
+    assert first.exit_code == 0, first.output
+    assert "Running" in first.output
+
+    second = runner.invoke(app, args)
+    assert "Reusing" in second.output and "Running" not in second.output
+
+    data = yaml.safe_load((scenarios / "example.yaml").read_text())
+    data["conversation_script"].append("bye")
+    (scenarios / "example.yaml").write_text(yaml.dump(data))
+    edited = runner.invoke(app, args)
+    assert "Running" in edited.output
+
+    new_agent = runner.invoke(app, args[:-1] + ["v2"])
+    assert "Running" in new_agent.output
+
+
+def test_run_incremental_requires_storage(runner, tmp_path):
+    from agenteval.cli import app
+    runner.invoke(app, ["init", str(tmp_path / "proj")])
+    result = runner.invoke(app, [
+        "run", str(tmp_path / "proj" / "scenarios"), "--agent", "tests.test_cli:EchoAdapter",
+        "--incremental",
+    ])
+    assert result.exit_code == 1
+
+
+def test_run_selects_by_tags_and_shard(runner, tmp_path):
+    import yaml
+    from agenteval.cli import app
+
+    runner.invoke(app, ["init", str(tmp_path / "proj")])
+    scenarios = tmp_path / "proj" / "scenarios"
+    example = yaml.safe_load((scenarios / "example.yaml").read_text())
+    for i, tags in enumerate([["smoke"], ["smoke"], ["slow"]]):
+        (scenarios / f"s{i}.yaml").write_text(yaml.dump({**example, "name": f"s{i}", "tags": tags}))
+    base = ["run", str(scenarios), "--agent", "tests.test_cli:EchoAdapter", "--k", "1",
+            "--db", str(tmp_path / "runs.db")]
+
+    tagged = runner.invoke(app, base + ["--tags", "smoke,slow", "--exclude-tags", "slow"])
+    assert tagged.exit_code == 0, tagged.output
+    assert tagged.output.count("Running") == 2 and "s2" not in tagged.output
+
+    ran = []
+    for i in (1, 2):
+        shard = runner.invoke(app, base + ["--shard", f"{i}/2", "--order", "longest"])
+        assert shard.exit_code == 0, shard.output
+        ran.append(shard.output.count("Running"))
+    assert sorted(ran) == [2, 2]
+
+    assert runner.invoke(app, base + ["--shard", "3/2"]).exit_code == 1
+    assert runner.invoke(app, base + ["--order", "random"]).exit_code == 1
+
+
+def test_run_shards_stay_disjoint_while_jobs_save_results(runner, tmp_path):
+    import asyncio
+    import re
+    import yaml
+    from agenteval.cli import app
+    from agenteval.models import EvalResult
+    from agenteval.store import Store
+
+    runner.invoke(app, ["init", str(tmp_path / "proj")])
+    scenarios = tmp_path / "proj" / "scenarios"
+    example = yaml.safe_load((scenarios / "example.yaml").read_text())
+    (scenarios / "example.yaml").unlink()
+    names = [f"s{i}" for i in range(6)]
+    for name in names:
+        (scenarios / f"{name}.yaml").write_text(yaml.dump({**example, "name": name}))
+    db = str(tmp_path / "runs.db")
+
+    async def _seed():
+        store = Store(db)
+        await store.init()
+        for i, name in enumerate(names):
+            await store.save_result(EvalResult(project="default", scenario=name, k=1, duration_ms=100.0 * (i + 1)),
+                                    created_at="2024-01-01T00:00:00+00:00")
+        await store.close()
+
+    asyncio.run(_seed())
+    for pin in ([], ["--plan-as-of", "2024-06-01T00:00:00+00:00"]):
+        shards = []
+        for i in (1, 2):
+            # Shard 1 stores its results before shard 2 plans.
+            result = runner.invoke(app, ["run", str(scenarios), "--agent", "tests.test_cli:EchoAdapter",
+                                         "--k", "1", "--db", db, "--shard", f"{i}/2", *pin])
+            assert result.exit_code == 0, result.output
+            shards.append(set(re.findall(r"Running (\S+) \(k=", result.output)))
+        assert not shards[0] & shards[1]
+        assert shards[0] | shards[1] == set(names)
+
+    assert runner.invoke(app, ["run", str(scenarios), "--agent", "tests.test_cli:EchoAdapter",
+                               "--shard", "1/2", "--plan-as-of", "yesterday"]).exit_code == 1
+
+
+def test_run_shard_builds_only_its_matrix_variants(runner, tmp_path, monkeypatch):
+    import yaml
+    import agenteval.scenario as scenario_mod
+    from agenteval.cli import app
+
+    runner.invoke(app, ["init", str(tmp_path / "proj")])
+    scenarios = tmp_path / "proj" / "scenarios"
+    example = yaml.safe_load((scenarios / "example.yaml").read_text())
+    (scenarios / "example.yaml").write_text(yaml.dump({**example, "matrix": {"n": list(range(8))}}))
+    built = []
+    original = scenario_mod._build_scenario
+    monkeypatch.setattr(scenario_mod, "_build_scenario", lambda d: built.append(d["name"]) or original(d))
+
+    result = runner.invoke(app, ["run", str(scenarios), "--agent", "tests.test_cli:EchoAdapter", "--k", "1",
+                                 "--shard", "2/4", "--no-live"])
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Running") == 2
+    assert len(built) == 2
+
+
+def test_compare_reports_and_gates_on_regressions(runner, tmp_path):
+    from agenteval.cli import app
+    from agenteval.models import EvalResult, Run
+    from agenteval.report import generate_json_report
+
+    def _report(name, successes):
+        runs = [Run(run_id=str(i), scenario="refund", success=i < successes, total_cost=0.01) for i in range(10)]
+        path = tmp_path / name
+        path.write_text(generate_json_report([
+            EvalResult(project="p", scenario="refund", k=10, runs=runs, pass_k=successes / 10),
+        ]))
+        return str(path)
+
+    base, same, worse = _report("base.json", 10), _report("same.json", 9), _report("worse.json", 2)
+    ok = runner.invoke(app, ["compare", base, same, "--ci"])
+    assert ok.exit_code == 0, ok.stdout
+    assert "0 significant regressions" in ok.stdout
+
+    bad = runner.invoke(app, ["compare", base, worse, "--ci"])
+    assert bad.exit_code == 1
+    assert "regression" in bad.stdout and "pass_rate" in bad.stdout
+
+
+def test_run_json_output_pipes_into_compare(runner, tmp_path):
+    from agenteval.cli import app
+
+    runner.invoke(app, ["init", str(tmp_path / "proj")])
+    scenarios = str(tmp_path / "proj" / "scenarios")
+    reports = []
+    for name in ("before.json", "after.json"):
+        result = runner.invoke(app, ["run", scenarios, "--agent", "tests.test_cli:EchoAdapter", "--k", "2",
+                                     "--output", "json", "--live"])
+        assert result.exit_code == 0, result.output
+        assert "Running" not in result.stdout
+        (tmp_path / name).write_text(result.stdout)
+        reports.append(str(tmp_path / name))
+    compared = runner.invoke(app, ["compare", *reports, "--ci"])
+    assert compared.exit_code == 0, compared.output
+    assert "0 significant regressions" in compared.stdout
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from agenteval.models import EvalResult, Run
+
+
+def test_fisher_exact_matches_reference_values():
+    from agenteval.compare import fisher_exact
+    assert fisher_exact(8, 2, 1, 5) == pytest.approx(0.034965, abs=1e-6)
+    assert fisher_exact(3, 1, 1, 3) == pytest.approx(0.485714, abs=1e-6)
+    assert fisher_exact(5, 0, 0, 5) == pytest.approx(2 / 252)
+    assert fisher_exact(3, 0, 3, 0) == 1.0
+
+
+def test_mann_whitney_exact_and_approximate():
+    from agenteval.compare import mann_whitney_u
+    assert mann_whitney_u([1, 2, 3], [4, 5, 6]) == (0.0, pytest.approx(0.1))
+    # Ties fall back to the normal approximation with tie and continuity corrections.
+    u, p = mann_whitney_u([1, 2, 3, 4, 5], [3, 6, 7, 8, 9])
+    assert u == 2.5 and p == pytest.approx(0.046533, abs=1e-6)
+    assert mann_whitney_u([1, 1], [1, 1]) == (2.0, 1.0)
+    assert mann_whitney_u([], [1.0]) == (0.0, 1.0)
+
+
+def test_holm_adjust():
+    from agenteval.compare import holm_adjust
+    assert holm_adjust([0.01, 0.04, 0.03]) == pytest.approx([0.03, 0.06, 0.06])
+
+
+def _samples(name, passes, runs, cost, latency):
+    return {"scenario": name, "runs": runs, "passes": passes, "cost": cost, "latency_ms": latency}
+
+
+def test_compare_ranks_significant_regressions_first():
+    from agenteval.compare import compare
+    slow = [100.0 + i for i in range(10)]
+    baseline = {
+        "refund": _samples("refund", 10, 10, [0.01] * 10, slow),
+        "lookup": _samples("lookup", 5, 10, [0.02 + i / 1000 for i in range(10)], slow),
+        "only_base": _samples("only_base", 1, 1, [], []),
+    }
+    candidate = {
+        "refund": _samples("refund", 2, 10, [0.01] * 10, slow),
+        "lookup": _samples("lookup", 6, 10, [0.01 + i / 1000 for i in range(10)], [s + 500 for s in slow]),
+    }
+    rows = compare(baseline, candidate)
+    assert {r["scenario"] for r in rows} == {"refund", "lookup"}
+    verdicts = [(r["scenario"], r["metric"], r["verdict"]) for r in rows if r["verdict"]]
+    assert verdicts[:2] == [("lookup", "latency_ms", "regression"), ("refund", "pass_rate", "regression")]
+    assert verdicts[2] == ("lookup", "cost", "improvement")
+    refund = next(r for r in rows if r["scenario"] == "refund" and r["metric"] == "pass_rate")
+    assert refund["delta"] == pytest.approx(-0.8)
+    lookup_pass = next(r for r in rows if r["scenario"] == "lookup" and r["metric"] == "pass_rate")
+    assert not lookup_pass["significant"] and lookup_pass["verdict"] == ""
+
+    strict = compare(baseline, candidate, alpha=0.05, adjust="holm")
+    assert all(r["p_value"] >= p["p_value"] for r, p in zip(
+        sorted(strict, key=lambda r: (r["scenario"], r["metric"])),
+        sorted(rows, key=lambda r: (r["scenario"], r["metric"])),
+    ))
+    with pytest.raises(ValueError):
+        compare(baseline, candidate, adjust="bonferroni")
+
+
+def _result(scenario, successes, k, cost, agent_version=None):
+    runs = [Run(run_id=f"{scenario}-{agent_version}-{i}", scenario=scenario, success=i < successes,
+                total_cost=cost, total_latency_ms=100.0) for i in range(k)]
+    return EvalResult(project="proj", scenario=scenario, k=k, runs=runs, pass_k=successes / k,
+                      avg_cost=cost, agent_version=agent_version)
+
+
+def test_load_report_reads_run_metrics(tmp_path):
+    from agenteval.compare import load_report
+    from agenteval.report import generate_json_report
+    path = tmp_path / "report.json"
+    path.write_text(generate_json_report([_result("refund", 3, 4, 0.5)]))
+    samples = load_report(path)["refund"]
+    assert (samples["runs"], samples["passes"]) == (4, 3)
+    assert samples["cost"] == [0.5] * 4 and samples["latency_ms"] == [100.0] * 4
+
+
+@pytest.mark.asyncio
+async def test_load_stored_uses_latest_result_per_version(tmp_path):
+    from agenteval.compare import load_stored
+    from agenteval.store import Store
+    store = Store(str(tmp_path / "runs.db"))
+    await store.init()
+    try:
+        for day, (version, successes, cost) in enumerate([("v1", 1, 0.1), ("v1", 2, 0.2), ("v2", 4, 0.3)], start=1):
+            result = _result("refund", successes, 4, cost, version)
+            result.runs = [r.model_copy(update={"run_id": f"{r.run_id}-{day}"}) for r in result.runs]
+            for run in result.runs:
+                await store.save_run(run, project="proj")
+            await store.save_result(result, created_at=f"2024-01-0{day}T00:00:00+00:00")
+        v1 = await load_stored(store, "proj", "v1")
+        assert v1["refund"]["passes"] == 2 and v1["refund"]["cost"] == [0.2] * 4
+        assert (await load_stored(store, "proj", "v2"))["refund"]["passes"] == 4
+        assert await load_stored(store, "proj", "v3") == {}
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_load_stored_from_segment_log(tmp_path):
+    from agenteval.compare import load_stored
+    from agenteval.storage.log import SegmentLogBackend
+    log = SegmentLogBackend(tmp_path / "log")
+    await log.init()
+    result = _result("refund", 3, 4, 0.1, "v1")
+    for run in result.runs:
+        await log.save_run(run, project="proj")
+    await log.save_result(result)
+    samples = await load_stored(log, "proj", "v1")
+    assert samples["refund"]["passes"] == 3 and samples["refund"]["cost"] == [0.1] * 4
+    await log.close()
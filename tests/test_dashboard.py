@@ -0,0 +1,74 @@
+from rich.console import Console
+
+from agenteval.models import Checkpoint, Run, Scenario
+from agenteval.runner import RunEvent
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _scenario(name):
+    return Scenario(name=name, conversation_script=["hi"], checkpoints=[Checkpoint(id="d")], success="d")
+
+
+def _finish(dash, scenario, run_id, success, duration_ms):
+    dash.events.put(RunEvent("run_started", scenario, run_id))
+    dash.events.put(RunEvent("turn", scenario, run_id, tokens=100, cost=0.01))
+    dash.events.put(RunEvent("run_finished", scenario, run_id, run=Run(
+        run_id=run_id, scenario=scenario, success=success,
+        checkpoints_reached=["d"] if success else [], duration_ms=duration_ms,
+    )))
+
+
+def test_event_queue_drops_when_full():
+    from agenteval.dashboard import EventQueue
+    queue = EventQueue(maxsize=2)
+    for i in range(5):
+        queue.put(RunEvent("run_started", "s", str(i)))
+    assert [e.run_id for e in queue.drain()] == ["0", "1"]
+    assert queue.dropped == 3 and queue.drain() == []
+
+
+def test_dashboard_summarises_events():
+    from agenteval.dashboard import Dashboard
+    clock = FakeClock()
+    dash = Dashboard(total_scenarios=3, clock=clock)
+    dash.events.put(RunEvent("scenario_started", "a", k=2, definition=_scenario("a")))
+    _finish(dash, "a", "a-0", True, 1000.0)
+    _finish(dash, "a", "a-1", False, 3000.0)
+    dash.events.put(RunEvent("scenario_started", "b", k=2, definition=_scenario("b")))
+    dash.events.put(RunEvent("run_started", "b", "b-0"))
+    clock.now = 60.0
+    dash.update()
+
+    summary = dash.summary()
+    assert (summary["completed"], summary["failed"], summary["in_flight"]) == (2, 1, 1)
+    assert summary["runs_per_minute"] == 2.0
+    assert summary["tokens_per_second"] == 200 / 60
+    assert abs(summary["cost"] - 0.02) < 1e-12
+    assert summary["latency_ms"]["p50"] == 2000.0
+    # Two runs left in "b" and two in the unstarted third scenario, at 2 s each.
+    assert summary["eta_s"] == 8.0
+    assert dash.scenarios["a"].finished_at == 60.0
+    assert dash.scenarios["b"].eta(2000.0) == 4.0
+
+
+def test_dashboard_renders_live():
+    import asyncio
+    from agenteval.dashboard import Dashboard
+
+    async def _run():
+        console = Console(record=True, width=160, force_terminal=True)
+        async with Dashboard(total_scenarios=1, console=console, refresh_per_second=100) as dash:
+            dash.events.put(RunEvent("scenario_started", "refund", k=1, definition=_scenario("refund")))
+            _finish(dash, "refund", "r0", True, 1500.0)
+            await asyncio.sleep(0.05)
+        return console.export_text()
+
+    out = asyncio.run(_run())
+    assert "refund" in out and "1/1" in out and "runs 1 done" in out
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+from agenteval.models import Run, Scenario, Checkpoint, Turn, AgentResponse, ToolCall
+
+
+@pytest.fixture
+def scenario():
+    return Scenario(
+        name="refund", initial_state={}, conversation_script=["go"],
+        checkpoints=[
+            Checkpoint(id="lookup", require={"tool_called": "lookup"}),
+            Checkpoint(id="done", depends_on=["lookup"], require={"tool_called": "refund"}),
+        ],
+        success="done", expected_final_state={"status": {"exact": "refunded"}},
+        expected_tools={"required": ["lookup", "refund"], "forbidden": ["delete"]},
+        constraints={"max_turns": 2},
+    )
+
+
+def _random_runs(n, seed=1):
+    rng = random.Random(seed)
+    runs = []
+    for i in range(n):
+        tools = [t for t in ("lookup", "refund", "delete") if rng.random() < 0.6]
+        turns = [
+            Turn(turn_id=t, user_message="go",
+                 agent_response=AgentResponse(message="ok", tool_calls=[ToolCall(name=n) for n in tools]))
+            for t in range(rng.randint(1, 4))
+        ]
+        runs.append(Run(
+            run_id=f"r{i}", scenario="refund", turns=turns, success=rng.random() < 0.7,
+            final_state={"status": rng.choice(["refunded", "pending"])},
+            checkpoints_reached=["lookup", "done"][:rng.randint(0, 2)],
+            total_tokens=rng.randint(10, 500), total_cost=rng.random(),
+            total_latency_ms=rng.random() * 1000,
+        ))
+    return runs
+
+
+def test_incremental_matches_batch_pipeline(scenario):
+    from agenteval.evaluators.incremental import IncrementalPipeline
+    from agenteval.evaluators.pipeline import EvaluationPipeline
+    runs = _random_runs(200)
+    live = IncrementalPipeline(scenario)
+    for i, run in enumerate(runs, 1):
+        live.update(run)
+        if i in (1, 17, 200):
+            batch = EvaluationPipeline().evaluate(runs[:i], scenario)
+            snap = live.snapshot()
+            for name in ("pass", "state", "dag"):
+                assert snap[name] == pytest.approx(batch[name])
+            assert snap["tools"]["required_tools_score"] == pytest.approx(batch["tools"]["required_tools_score"])
+            assert snap["tools"]["forbidden_violations"] == batch["tools"]["forbidden_violations"]
+            for key in ("avg_turns", "avg_cost", "avg_latency_ms", "constraint_violations"):
+                assert snap["efficiency"][key] == pytest.approx(batch["efficiency"][key])
+
+
+def test_standalone_updates_match_facts_updates(scenario):
+    from agenteval.evaluators.incremental import incremental_evaluators, IncrementalPipeline
+    runs = _random_runs(50, seed=7)
+    live = IncrementalPipeline(scenario)
+    standalone = incremental_evaluators(scenario)
+    for run in runs:
+        live.update(run)
+        for ev in standalone.values():
+            ev.update(run)
+    assert live.snapshot() == {name: ev.snapshot() for name, ev in standalone.items()}
+
+
+def test_empty_snapshot(scenario):
+    from agenteval.evaluators.incremental import IncrementalPipeline
+    snap = IncrementalPipeline(scenario).snapshot()
+    assert snap["pass"] == 0.0 and snap["dag"] == 0.0
+    assert snap["efficiency"]["avg_turns"] == 0.0
+
+
+def test_running_stats_welford_and_merge():
+    import statistics
+    from agenteval.evaluators.incremental import RunningStats
+    rng = random.Random(3)
+    values = [rng.gauss(100, 15) for _ in range(10)] + [1e9 + i for i in range(5)]
+    left, right, whole = RunningStats(), RunningStats(), RunningStats()
+    for i, v in enumerate(values):
+        whole.update(v)
+        (left if i < 6 else right).update(v)
+    left.merge(right)
+    for stats in (whole, left):
+        assert stats.count == len(values)
+        assert stats.mean == pytest.approx(statistics.fmean(values))
+        assert stats.variance == pytest.approx(statistics.variance(values))
+        assert stats.min == min(values) and stats.max == max(values)
@@ -0,0 +1,162 @@
+"""Tests for the LLM judge evaluator against a local mock provider."""
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+from agenteval.models import Run, Scenario, Checkpoint, Turn, AgentResponse
+
+
+class MockJudgeProvider:
+    """Anthropic-shaped client that scores replies containing 'refund' as 1.0."""
+
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = delay
+        self.messages = SimpleNamespace(create=self.create)
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        prompt = kwargs["messages"][0]["content"]
+        items = re.findall(r"### Item (\d+)\n.*?\nAgent: (.*?)\n", prompt, re.S)
+        verdicts = [
+            {"id": int(i), "score": 1.0 if "refund" in reply else 0.0, "reason": "checked"}
+            for i, reply in items
+        ]
+        text = SimpleNamespace(type="text", text="```json\n" + json.dumps(verdicts) + "\n```")
+        return SimpleNamespace(content=[text], usage=SimpleNamespace(input_tokens=1, output_tokens=1))
+
+
+def _judge(provider, **kwargs):
+    from agenteval.adapters.llm import LLMAdapter
+    from agenteval.evaluators.judge import JudgeEvaluator
+    adapter = LLMAdapter({"provider": "anthropic", "model": "judge-model"})
+    adapter._client = provider
+    return JudgeEvaluator(adapter, **kwargs)
+
+
+@pytest.fixture
+def scenario():
+    return Scenario(
+        name="refund", conversation_script=["hi"],
+        checkpoints=[Checkpoint(id="done")], success="done",
+        rubric="The agent confirms the refund.",
+    )
+
+
+def _runs(n, turns=3):
+    return [
+        Run(run_id=f"r{i}", scenario="refund", turns=[
+            Turn(turn_id=t, user_message=f"msg {t}",
+                 agent_response=AgentResponse(message=f"refund issued {i}-{t}" if t % 2 == 0 else f"sorry {i}-{t}"))
+            for t in range(turns)
+        ])
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_judge_batches_and_limits_concurrency(scenario):
+    provider = MockJudgeProvider(delay=0.01)
+    judge = _judge(provider, batch_size=5, concurrency=2)
+    result = await judge.ajudge(_runs(10), scenario)
+    assert provider.calls == 6  # 30 turns / 5 per call
+    assert provider.max_in_flight == 2
+    assert result["judged"] == 30
+    assert result["score"] == pytest.approx(20 / 30)
+    assert result["cached"] == 0
+
+
+@pytest.mark.asyncio
+async def test_judge_cache_skips_unchanged_turns(scenario):
+    provider = MockJudgeProvider()
+    cache = {}
+    judge = _judge(provider, batch_size=10, cache=cache)
+    runs = _runs(2)
+    await judge.ajudge(runs, scenario)
+    assert provider.calls == 1
+    again = await _judge(provider, cache=cache).ajudge(runs, scenario)
+    assert provider.calls == 1
+    assert again["cached"] == 6
+
+    runs[0].turns[0].agent_response.message = "changed reply"
+    changed = await judge.ajudge(runs, scenario)
+    assert provider.calls == 2
+    assert changed["cached"] == 5
+
+
+@pytest.mark.asyncio
+async def test_judge_in_pipeline_and_without_rubric(scenario):
+    from agenteval.evaluators.pipeline import EvaluationPipeline
+    provider = MockJudgeProvider()
+    pipeline = EvaluationPipeline(plugins={"judge": _judge(provider)})
+    scores = await pipeline.aevaluate(_runs(1, turns=2), scenario)
+    assert scores["judge"]["score"] == 0.5
+    no_rubric = scenario.model_copy(update={"rubric": ""})
+    assert (await _judge(provider).ajudge(_runs(1), no_rubric))["score"] is None
+
+
+def test_parse_verdicts_skips_malformed():
+    from agenteval.evaluators.judge import _parse_verdicts
+    text = 'Here: [{"id": 0, "score": 1.5}, {"id": 1}, {"id": 9, "score": 0}, {"id": "2", "score": 0.25}]'
+    assert _parse_verdicts(text, 3) == {0: {"score": 1.0, "reason": ""}, 2: {"score": 0.25, "reason": ""}}
+    assert _parse_verdicts("no json", 3) == {}
+
+
+@pytest.mark.asyncio
+async def test_judge_uses_its_own_prompt_and_no_tools(scenario):
+    from agenteval.adapters.llm import LLMAdapter
+    from agenteval.evaluators.judge import JudgeEvaluator, _SYSTEM_PROMPT
+    provider = MockJudgeProvider()
+    seen = []
+    create = provider.create
+
+    async def record(**kwargs):
+        seen.append(kwargs)
+        return await create(**kwargs)
+    provider.messages.create = record
+    handled = []
+    adapter = LLMAdapter({"provider": "anthropic", "model": "judge-model", "system_prompt": "be an agent",
+                          "tools": [{"name": "refund", "parameters": {"order_id": "string"}}]},
+                         tool_handler=lambda name, args: handled.append(name))
+    adapter._client = provider
+    result = await JudgeEvaluator(adapter).ajudge(_runs(1), scenario)
+    assert result["judged"] == 3
+    assert seen[0]["system"] == _SYSTEM_PROMPT and "tools" not in seen[0]
+    assert handled == []
+
+
+def test_judge_cache_key_covers_prompt_template(monkeypatch):
+    from agenteval.evaluators import judge
+    key = judge._item_key("m", "rubric", "hi", "hello")
+    monkeypatch.setattr(judge, "_PROMPT_HEADER", judge._PROMPT_HEADER + "Be strict.\n")
+    assert judge._item_key("m", "rubric", "hi", "hello") != key
+    monkeypatch.setattr(judge, "_SYSTEM_PROMPT", "Grade leniently.")
+    assert judge._item_key("m", "rubric", "hi", "hello") != key
+
+
+@pytest.mark.asyncio
+async def test_judge_batch_failure_leaves_items_unscored(scenario):
+    provider = MockJudgeProvider()
+    create = provider.create
+    calls = []
+
+    async def flaky(**kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("overloaded")
+        return await create(**kwargs)
+    provider.messages.create = flaky
+    cache = {}
+    judge = _judge(provider, batch_size=3, concurrency=1, cache=cache)
+    first = await judge.ajudge(_runs(2), scenario)
+    assert first["judged"] == 3 and len(calls) == 2
+    retry = await judge.ajudge(_runs(2), scenario)
+    assert retry["judged"] == 6 and retry["cached"] == 3
@@ -0,0 +1,78 @@
+import pytest
+from agenteval.models import Run, Scenario, Checkpoint, Turn, AgentResponse, ToolCall
+from agenteval.evaluators.base import BaseEvaluator
+
+
+@pytest.fixture
+def scenario():
+    return Scenario(
+        name="refund", initial_state={}, conversation_script=["go"],
+        checkpoints=[Checkpoint(id="done", require={"tool_called": "refund"})],
+        success="done", expected_final_state={"status": {"exact": "refunded"}},
+        expected_tools={"required": ["refund"], "forbidden": ["delete"]},
+    )
+
+
+def _run(run_id, success, status, tools):
+    turn = Turn(
+        turn_id=1, user_message="go",
+        agent_response=AgentResponse(message="ok", tool_calls=[ToolCall(name=t) for t in tools]),
+    )
+    return Run(
+        run_id=run_id, scenario="refund", turns=[turn], success=success,
+        final_state={"status": status}, total_tokens=10,
+    )
+
+
+def test_pipeline_matches_individual_evaluators(scenario):
+    from agenteval.evaluators.pipeline import EvaluationPipeline, default_evaluators
+    runs = [
+        _run("r1", True, "refunded", ["refund"]),
+        _run("r2", True, "pending", ["refund", "delete"]),
+        _run("r3", False, "refunded", []),
+    ]
+    scores = EvaluationPipeline().evaluate(runs, scenario)
+    for name, evaluator in default_evaluators().items():
+        assert scores[name] == evaluator.evaluate(runs, scenario)
+    assert scores["pass"] == pytest.approx(1 / 3)
+    assert scores["state"] == pytest.approx(2 / 3)
+
+
+def test_pipeline_compiles_state_once_and_compares_once_per_run(scenario, monkeypatch):
+    from agenteval.evaluators import pipeline
+    from agenteval.evaluators.state import StateMatcher
+    compiled, compared = [], []
+    original_compile, original_compare = pipeline.compile_state, StateMatcher.compare
+
+    def counting_compile(expected):
+        compiled.append(expected)
+        return original_compile(expected)
+
+    def counting_compare(self, actual):
+        compared.append(actual)
+        return original_compare(self, actual)
+
+    monkeypatch.setattr(pipeline, "compile_state", counting_compile)
+    monkeypatch.setattr(StateMatcher, "compare", counting_compare)
+    runs = [_run(f"r{i}", True, "refunded", ["refund"]) for i in range(4)]
+    pipeline.EvaluationPipeline().evaluate(runs, scenario)
+    assert len(compiled) == 1
+    assert len(compared) == 4
+
+
+class TurnCountEvaluator(BaseEvaluator):
+    def evaluate(self, runs, scenario):
+        return sum(len(r.turns) for r in runs)
+
+
+def test_pipeline_runs_plugins(scenario):
+    from agenteval.evaluators.pipeline import EvaluationPipeline
+    runs = [_run("r1", True, "refunded", ["refund"])]
+    scores = EvaluationPipeline(plugins={"turns": TurnCountEvaluator()}).evaluate(runs, scenario)
+    assert scores["turns"] == 1
+
+
+def test_pipeline_rejects_clashing_plugin_names():
+    from agenteval.evaluators.pipeline import EvaluationPipeline
+    with pytest.raises(ValueError):
+        EvaluationPipeline(plugins={"state": TurnCountEvaluator()})
@@ -0,0 +1,58 @@
+import pytest
+from agenteval.models import Run, Scenario, Checkpoint, Turn, AgentResponse, ToolCall
+
+
+@pytest.fixture
+def scenario():
+    return Scenario(
+        name="refund", conversation_script=["a", "b", "c", "d"],
+        checkpoints=[
+            Checkpoint(id="lookup"),
+            Checkpoint(id="verify", depends_on=["lookup"]),
+            Checkpoint(id="refund", depends_on=["verify"]),
+        ],
+        success="refund",
+    )
+
+
+def _run(run_id, reached_per_turn):
+    turns = [
+        Turn(turn_id=i, user_message="m", elapsed_checkpoints=cps,
+             agent_response=AgentResponse(message="ok", metadata={"tokens": 100},
+                                          tool_calls=[ToolCall(name="t", latency_ms=50)]))
+        for i, cps in enumerate(reached_per_turn)
+    ]
+    reached = [cp for cps in reached_per_turn for cp in cps]
+    return Run(run_id=run_id, scenario="refund", turns=turns, checkpoints_reached=reached,
+               success="refund" in reached)
+
+
+def test_checkpoint_timings_accumulate():
+    from agenteval.evaluators.progress import checkpoint_timings
+    timings = checkpoint_timings(_run("r1", [["lookup"], [], ["verify", "refund"]]))
+    assert timings["lookup"] == {"turns": 1, "tokens": 100, "latency_ms": 50}
+    assert timings["refund"] == {"turns": 3, "tokens": 300, "latency_ms": 150}
+
+
+def test_timing_distributions_and_stalls(scenario):
+    from agenteval.evaluators.progress import CheckpointTimingEvaluator
+    runs = [
+        _run("fast", [["lookup"], ["verify"], ["refund"]]),
+        _run("slow", [["lookup"], [], [], ["verify"], ["refund"]]),
+        _run("stuck", [["lookup"], [], []]),
+    ]
+    result = CheckpointTimingEvaluator().evaluate(runs, scenario)
+    lookup = result["checkpoints"]["lookup"]
+    assert lookup["reach_rate"] == 1.0
+    assert lookup["turns"]["p50"] == 1.0
+    assert result["success"]["reach_rate"] == pytest.approx(2 / 3)
+    assert result["success"]["turns"]["mean"] == 4.0
+    assert result["success"]["latency_ms"]["p99"] == pytest.approx(249.0)
+    assert result["stalls"]["verify"] == {"stalled_turns": 4, "stuck": 1, "blocked": 0}
+    assert result["stalls"]["refund"] == {"stalled_turns": 0, "stuck": 0, "blocked": 1}
+
+
+def test_no_runs(scenario):
+    from agenteval.evaluators.progress import CheckpointTimingEvaluator
+    result = CheckpointTimingEvaluator().evaluate([], scenario)
+    assert result["checkpoints"]["refund"] == {"reach_rate": 0.0, "turns": {}, "tokens": {}, "latency_ms": {}}
@@ -71,3 +71,71 @@ def test_state_evaluator():
         Run(run_id="r2", scenario="test", final_state={"status": "delivered"}, success=False),
     ]
     assert StateEvaluator().evaluate(runs, scenario) == 0.5
+
+
+def test_range_match():
+    from agenteval.evaluators.state import compare_field
+    assert compare_field({"range": [10, 20]}, 15) is True
+    assert compare_field({"range": [10, 20]}, 20.0) is True
+    assert compare_field({"range": [10, None]}, 1000) is True
+    assert compare_field({"range": [10, 20]}, 21) is False
+    assert compare_field({"range": [0, 1]}, True) is False
+    assert compare_field({"range": [0, 1]}, "1") is False
+
+
+def test_in_match():
+    from agenteval.evaluators.state import compare_field
+    assert compare_field({"in": ["refunded", "closed"]}, "closed") is True
+    assert compare_field({"in": ["refunded", "closed"]}, "open") is False
+    assert compare_field({"in": [["a"], "b"]}, ["a"]) is True
+    assert compare_field({"in": ["a"]}, {"unhashable": True}) is False
+
+
+def test_any_order_match():
+    from agenteval.evaluators.state import compare_field
+    assert compare_field({"any_order": ["b", "a", "a"]}, ["a", "b", "a"]) is True
+    assert compare_field({"any_order": ["a", "b"]}, ["a", "a"]) is False
+    assert compare_field({"any_order": ["a", "b"]}, ["a", "b", "c"]) is False
+    spec = {"any_order": [{"id": "o1"}, {"id": {"regex": "^o"}}]}
+    assert compare_field(spec, [{"id": "o2"}, {"id": "o1"}]) is True
+    assert compare_field(spec, [{"id": "o2"}, {"id": "x"}]) is False
+
+
+def test_includes_match():
+    from agenteval.evaluators.state import compare_field
+    assert compare_field({"includes": ["a"]}, ["b", "a"]) is True
+    assert compare_field({"includes": ["a", "a"]}, ["a", "b"]) is False
+    assert compare_field({"includes": [{"range": [1, 2]}]}, [0, 1.5]) is True
+    assert compare_field({"includes": ["a"]}, "a") is False
+
+
+def test_field_named_like_operator_matches_field_by_field():
+    from agenteval.evaluators.state import compare_field, compare_state
+    # Keys added as operators later stay usable as nested field names.
+    assert compare_field({"in": 1}, {"in": 1}) is True
+    assert compare_field({"in": 1}, {"in": 2}) is False
+    assert compare_field({"range": 5}, {"range": 5}) is True
+    assert compare_field({"includes": "tax"}, {"includes": "tax"}) is True
+    assert compare_field({"any_order": True}, {"any_order": True}) is True
+    assert compare_field({"range": [1, 2], "unit": "kg"}, {"range": [1, 2], "unit": "kg"}) is True
+    assert compare_field({"in": ["a"], "out": ["b"]}, {"in": ["a"], "out": ["b"]}) is True
+    assert compare_field({"range": ["low", "high"]}, {"range": ["low", "high"]}) is True
+    assert compare_state({"amount": {"range": 5}}, {"amount": {"range": 5}}).match is True
+
+
+def test_operator_needs_single_key_with_operator_shape():
+    from agenteval.evaluators.state import compare_field, is_operator_spec
+    assert is_operator_spec({"range": [1, None]}) and is_operator_spec({"in": []})
+    assert not is_operator_spec({"range": 5}) and not is_operator_spec({"in": 1, "x": 2})
+    assert is_operator_spec({"regex": "x", "other": 1})  # original operators keep their precedence
+    assert compare_field({"range": [1, 2]}, 1.5) is True
+
+
+def test_compiled_state_reused_across_runs():
+    from agenteval.evaluators.state import compile_state
+    matcher = compile_state({"code": {"regex": r"^R-\d+$"}, "total": {"range": [0, 100]}})
+    assert matcher.compare({"code": "R-12", "total": 50}).match is True
+    result = matcher.compare({"code": "X-12", "total": 50})
+    assert result.match is False
+    assert result.field_results == {"code": False, "total": True}
+    assert result.correctness == 0.5
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+from agenteval.models import Run, Scenario, Checkpoint, Turn, AgentResponse, ToolCall
+
+
+def _run(calls, run_id="r1"):
+    return Run(run_id=run_id, scenario="refund", turns=[
+        Turn(turn_id=0, user_message="go", agent_response=AgentResponse(
+            message="ok", tool_calls=[ToolCall(name=n, arguments=a) for n, a in calls]))
+    ])
+
+
+@pytest.fixture
+def scenario():
+    return Scenario(
+        name="refund", conversation_script=["go"], checkpoints=[Checkpoint(id="done")], success="done",
+        expected_tools={"sequence": ["lookup_order", "verify_customer", "process_refund"]},
+    )
+
+
+def _lcs_reference(a, b):
+    table = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            table[i + 1][j + 1] = table[i][j] + 1 if x == y else max(table[i][j + 1], table[i + 1][j])
+    return table[-1][-1]
+
+
+def test_lcs_matches_reference_dp():
+    import random
+    from agenteval.evaluators.trajectory import lcs_length
+    rng = random.Random(0)
+    for _ in range(200):
+        a = [rng.choice("abcde") for _ in range(rng.randint(0, 12))]
+        b = [rng.choice("abcdef") for _ in range(rng.randint(0, 12))]
+        assert lcs_length(a, b) == _lcs_reference(a, b)
+
+
+def test_correct_order_scores_full(scenario):
+    from agenteval.evaluators.trajectory import TrajectoryEvaluator
+    run = _run([("lookup_order", {}), ("verify_customer", {}), ("process_refund", {})])
+    result = TrajectoryEvaluator().evaluate([run], scenario)
+    assert result["sequence_score"] == 1.0
+    assert result["alignment_distance"] == 0
+    assert result["order_violations"] == 0
+
+
+def test_wrong_order_redundant_and_loops(scenario):
+    from agenteval.evaluators.trajectory import TrajectoryEvaluator
+    run = _run([
+        ("lookup_order", {"id": 1}), ("process_refund", {}), ("verify_customer", {}),
+        ("lookup_order", {"id": 1}), ("lookup_order", {"id": 2}),
+    ])
+    (per_run,) = TrajectoryEvaluator().evaluate([run], scenario)["runs"]
+    assert per_run["sequence_score"] == pytest.approx(2 / 3)
+    assert per_run["alignment_distance"] == 3 + 5 - 2 * 2
+    assert per_run["order_violations"] == 1
+    assert per_run["redundant_calls"] == 1
+    assert per_run["loops"] == 1
+
+
+def test_count_loops_periods():
+    from agenteval.evaluators.trajectory import count_loops
+    assert count_loops(list("ababab")) == 2
+    assert count_loops(list("aaaa")) == 3
+    assert count_loops(list("abcabc")) == 1
+    assert count_loops(list("abcd")) == 0
+
+
+def test_falls_back_to_required_tools():
+    from agenteval.evaluators.trajectory import TrajectoryEvaluator
+    scenario = Scenario(name="s", expected_tools={"required": ["a", "b"]})
+    result = TrajectoryEvaluator().evaluate([_run([("b", {}), ("a", {})])], scenario)
+    assert result["order_violations"] == 1
+
+
+def test_scales_to_long_trajectories(scenario):
+    from agenteval.evaluators.trajectory import TrajectoryEvaluator
+    names = ["lookup_order", "verify_customer", "process_refund", "search"]
+    long_scenario = scenario.model_copy(update={"expected_tools": {"sequence": names * 100}})
+    runs = [_run([(names[(i * 7 + j) % 4], {"i": j}) for j in range(500)], run_id=f"r{i}") for i in range(20)]
+    start = time.perf_counter()
+    TrajectoryEvaluator().evaluate(runs, long_scenario)
+    assert time.perf_counter() - start < 2
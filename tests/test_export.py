@@ -0,0 +1,59 @@
+import csv
+import json
+
+import pytest
+
+from agenteval.models import AgentResponse, Run, ToolCall, Turn
+
+
+@pytest.fixture
+async def store(tmp_path):
+    from agenteval.store import Store
+    store = Store(str(tmp_path / "runs.db"))
+    await store.init()
+    for i in range(3):
+        run = Run(run_id=f"r{i}", scenario="refund", success=i != 1,
+                  checkpoints_reached=["lookup"], total_cost=0.01 * i, turns=[
+                      Turn(turn_id=0, user_message="hi", agent_response=AgentResponse(
+                          message="ok", metadata={"tokens": 7},
+                          tool_calls=[ToolCall(name="lookup", arguments={"id": i}),
+                                      ToolCall(name="refund", result={"error": "denied"})])),
+                  ])
+        await store.save_run(run, project="proj")
+    yield store
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_export_csv(store, tmp_path):
+    from agenteval.export import export_store
+    counts = await export_store(store, "proj", tmp_path / "out", fmt="csv", chunk_size=2)
+    assert counts == {"runs": 3, "turns": 3, "tool_calls": 6}
+    with open(tmp_path / "out" / "runs.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["run_id"] for r in rows] == ["r0", "r1", "r2"]
+    assert json.loads(rows[0]["checkpoints_reached"]) == ["lookup"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+async def test_export_columnar(store, tmp_path, fmt):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+    from agenteval.export import TOOL_CALL_SCHEMA, export_store
+    await export_store(store, "proj", tmp_path / "out", fmt=fmt, chunk_size=2)
+    path = tmp_path / "out" / f"tool_calls.{fmt}"
+    table = pa.parquet.read_table(path) if fmt == "parquet" else pa.ipc.open_file(path).read_all()
+    assert table.column_names == list(TOOL_CALL_SCHEMA)
+    assert table.column("failed").to_pylist() == [False, True] * 3
+    runs = pa.parquet.read_table(tmp_path / "out" / "runs.parquet") if fmt == "parquet" else None
+    if runs is not None:
+        assert runs.schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_unknown_format(store, tmp_path):
+    from agenteval.export import export_store
+    with pytest.raises(ValueError):
+        await export_store(store, "proj", tmp_path, fmt="xlsx")
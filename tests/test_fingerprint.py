@@ -0,0 +1,32 @@
+from agenteval.models import Scenario, Checkpoint
+
+
+def _scenario(**kwargs):
+    base = dict(name="s", conversation_script=["hi"], checkpoints=[Checkpoint(id="d")], success="d")
+    return Scenario(**{**base, **kwargs})
+
+
+def test_scenario_fingerprint_tracks_content():
+    from agenteval.fingerprint import scenario_fingerprint
+    assert scenario_fingerprint(_scenario()) == scenario_fingerprint(_scenario())
+    assert scenario_fingerprint(_scenario()) != scenario_fingerprint(_scenario(conversation_script=["hello"]))
+
+
+def test_evaluation_fingerprint_needs_agent_version():
+    from agenteval.fingerprint import evaluation_fingerprint
+    sc = _scenario()
+    assert evaluation_fingerprint(sc, None, 3) is None
+    assert evaluation_fingerprint(sc, "v1", 3) == evaluation_fingerprint(sc, "v1", 3)
+    assert evaluation_fingerprint(sc, "v1", 3) != evaluation_fingerprint(sc, "v2", 3)
+    assert evaluation_fingerprint(sc, "v1", 3) != evaluation_fingerprint(sc, "v1", 5)
+
+
+def test_llm_adapter_version_tracks_configuration():
+    from agenteval.adapters.llm import LLMAdapter
+    settings = {"provider": "anthropic", "model": "m", "system_prompt": "be nice",
+                "tools": [{"name": "refund", "parameters": {"order_id": "string"}}]}
+    version = LLMAdapter(settings).version()
+    assert version == LLMAdapter(dict(settings)).version()
+    assert version != LLMAdapter({**settings, "system_prompt": "be terse"}).version()
+    assert version != LLMAdapter({**settings, "tools": []}).version()
+    assert version != LLMAdapter({**settings, "model": "m2"}).version()
@@ -0,0 +1,88 @@
+import time
+
+import numpy as np
+import pytest
+from agenteval.models import Run, Turn, AgentResponse
+
+
+def _runs(n):
+    return [
+        Run(
+            run_id=f"r{i}", scenario="s",
+            turns=[Turn(turn_id=t, user_message="m", agent_response=AgentResponse(message="a")) for t in range(i % 3 + 1)],
+            total_tokens=100 + i, total_cost=0.01 * i, total_latency_ms=float(i),
+        )
+        for i in range(n)
+    ]
+
+
+def test_percentiles_per_measure():
+    from agenteval.metrics import percentiles
+    result = percentiles(_runs(101))
+    assert set(result) == {"turns", "tokens", "cost", "latency_ms"}
+    assert result["latency_ms"] == {"p50": 50.0, "p90": 90.0, "p99": 99.0}
+    assert result["tokens"]["p50"] == 150.0
+    assert result["turns"]["p99"] == 3.0
+
+
+def test_percentiles_empty():
+    from agenteval.metrics import percentiles
+    assert percentiles([]) == {}
+
+
+def test_proportion_ci_brackets_estimate():
+    from agenteval.metrics import proportion_ci
+    low, high = proportion_ci(70, 100)
+    assert low < 0.7 < high
+    assert 0.55 < low and high < 0.85
+    assert proportion_ci(70, 100) == (low, high)
+    assert proportion_ci(0, 0) == (0.0, 0.0)
+
+
+def test_bootstrap_ci_matches_proportion_ci_for_binary_data():
+    from agenteval.metrics import bootstrap_ci, proportion_ci
+    values = np.array([1.0] * 60 + [0.0] * 40)
+    low, high = bootstrap_ci(values, n_resamples=5000)
+    plow, phigh = proportion_ci(60, 100)
+    assert low == pytest.approx(plow, abs=0.03)
+    assert high == pytest.approx(phigh, abs=0.03)
+
+
+def test_bootstrap_ci_median_and_bad_confidence():
+    from agenteval.metrics import bootstrap_ci
+    values = np.arange(1000, dtype=float)
+    low, high = bootstrap_ci(values, statistic=np.median)
+    assert low < 499.5 < high
+    with pytest.raises(ValueError):
+        bootstrap_ci(values, confidence=1.5)
+
+
+def test_metrics_fast_at_10k_runs():
+    from agenteval.metrics import bootstrap_ci, percentiles, proportion_ci, run_arrays
+    runs = _runs(10_000)
+    start = time.perf_counter()
+    percentiles(runs)
+    proportion_ci(6_000, 10_000)
+    bootstrap_ci(run_arrays(runs)[3], n_resamples=1000)
+    assert time.perf_counter() - start < 5
+
+
+def test_pass_hat_k_curve_matches_combinatorial_estimator():
+    from math import comb
+    from agenteval.metrics import pass_hat_k_curve
+    curve = pass_hat_k_curve(7, 10)
+    assert len(curve) == 10
+    for k, value in enumerate(curve, 1):
+        assert value == pytest.approx(comb(7, k) / comb(10, k))
+    assert curve[0] == pytest.approx(0.7)
+    assert curve[7:] == [0.0, 0.0, 0.0]
+
+
+def test_pass_hat_k_curve_edge_cases_and_large_n():
+    from agenteval.metrics import pass_hat_k_curve
+    assert pass_hat_k_curve(0, 0) == []
+    assert pass_hat_k_curve(5, 5) == [1.0] * 5
+    curve = pass_hat_k_curve(9_000, 10_000)
+    assert curve[0] == pytest.approx(0.9)
+    assert all(0.0 <= v <= 1.0 for v in curve)
+    assert curve[1] == pytest.approx(9_000 * 8_999 / (10_000 * 9_999))
@@ -28,3 +28,56 @@ def test_html(sample):
     out = generate_html_report([sample])
     assert "<html" in out.lower()
     assert "refund" in out
+
+
+def test_reports_show_intervals_and_percentiles(sample):
+    from agenteval.report import generate_html_report, generate_json_report, generate_table_report
+    sample.pass_k_ci = (0.4, 0.9)
+    sample.percentiles = {"latency_ms": {"p50": 1000.0, "p90": 3000.0, "p99": 5000.0}}
+    assert "[40.0-90.0]" in generate_table_report([sample])
+    html = generate_html_report([sample])
+    assert "3000ms" in html and "[40.0-90.0]" in html
+    data = json.loads(generate_json_report([sample]))
+    assert data[0]["pass_k_ci"] == [0.4, 0.9]
+    assert data[0]["percentiles"]["latency_ms"]["p90"] == 3000.0
+
+
+def test_reports_show_pass_k_curve(sample):
+    from agenteval.report import generate_html_report, generate_table_report
+    sample.pass_k_curve = [0.8, 0.6, 0.4, 0.2]
+    assert "1:80% 3:40% 4:20%" in generate_html_report([sample])
+    assert "1:80%" in generate_table_report([sample])
+
+
+def _unpack(html, kind):
+    import base64, gzip, re
+    chunks = re.findall(rf'data-kind="{kind}" data-start="(\d+)" data-count="(\d+)">([^<]*)<', html)
+    return [(int(start), int(count), json.loads(gzip.decompress(base64.b64decode(data))))
+            for start, count, data in chunks]
+
+
+def test_write_html_report_embeds_runs_in_chunks(sample, tmp_path):
+    from agenteval.models import AgentResponse, Run, ToolCall, Turn
+    from agenteval.report import write_html_report
+    turn = Turn(turn_id=0, user_message="refund o1", elapsed_checkpoints=["done"],
+                agent_response=AgentResponse(message="<b>done</b>",
+                                             tool_calls=[ToolCall(name="refund", arguments={"id": "o1"})]))
+    sample.runs = [Run(run_id=f"r{i}", scenario="refund", success=i % 2 == 0, turns=[turn],
+                       final_state={"status": "refunded"}) for i in range(5)]
+    other = EvalResult(project="my_agent", scenario="<script>", k=1, runs=[Run(run_id="x", scenario="<script>")])
+    path = tmp_path / "report.html"
+    write_html_report([sample, other], path, chunk_size=2)
+    html = path.read_text()
+
+    assert "&lt;script&gt;" in html and "<td>refund</td>" in html
+    index = _unpack(html, "index")
+    assert [(start, count) for start, count, _ in index] == [(0, 2), (2, 2), (4, 2)]
+    rows = [row for _, _, rows in index for row in rows]
+    assert [row[:3] for row in rows[:2]] == [[0, "r0", True], [0, "r1", False]]
+    assert rows[-1][:2] == [1, "x"]
+    transcripts = [t for _, _, chunk in _unpack(html, "transcripts") for t in chunk]
+    assert len(transcripts) == 6
+    assert transcripts[0]["turns"][0] == {"user": "refund o1", "agent": "<b>done</b>",
+                                          "tools": [{"name": "refund", "arguments": {"id": "o1"}, "result": None}],
+                                          "checkpoints": ["done"]}
+    assert transcripts[0]["final_state"] == {"status": "refunded"}
@@ -0,0 +1,88 @@
+import pytest
+from agenteval.models import AgentResponse, ToolCall
+
+
+def _turn(calls=(), message="", state=None):
+    from agenteval.requirements import TurnView
+    response = AgentResponse(message=message, tool_calls=[ToolCall(name=n, arguments=a) for n, a in calls])
+    return TurnView(response, state or {})
+
+
+def test_legacy_tool_called_and_exact_args():
+    from agenteval.requirements import compile_requirement
+    req = compile_requirement({"tool_called": "refund", "tool_args": {"order_id": "o1", "meta": {"a": 1}}})
+    assert req(_turn([("refund", {"order_id": "o1", "meta": {"a": 1}})])) is True
+    assert req(_turn([("refund", {"order_id": "o1", "meta": {"a": 1, "b": 2}})])) is False
+    assert req(_turn([("refund", {"order_id": "o2", "meta": {"a": 1}})])) is False
+    assert req(_turn([("lookup", {"order_id": "o1"})])) is False
+    assert compile_requirement({})(_turn()) is True
+
+
+def test_argument_predicates():
+    from agenteval.requirements import compile_requirement
+    req = compile_requirement({"tool_called": "refund", "tool_args": {
+        "order_id": {"regex": "^o\\d+$"}, "amount": {"range": [0, 100]}, "reason": {"exists": True},
+    }})
+    assert req(_turn([("refund", {"order_id": "o7", "amount": 50, "reason": "late"})])) is True
+    assert req(_turn([("refund", {"order_id": "o7", "amount": 500, "reason": "late"})])) is False
+    assert req(_turn([("refund", {"order_id": "o7", "amount": 50})])) is False
+
+
+def test_boolean_composition():
+    from agenteval.requirements import compile_requirement
+    req = compile_requirement({
+        "any_of": [{"tool_called": "refund"}, {"tool_called": "store_credit"}],
+        "not": {"tool_called": "escalate"},
+    })
+    assert req(_turn([("store_credit", {})])) is True
+    assert req(_turn([("refund", {}), ("escalate", {})])) is False
+    assert req(_turn([("lookup", {})])) is False
+    both = compile_requirement({"all_of": [{"tool_called": "a"}, {"tool_called": "b"}]})
+    assert both(_turn([("a", {}), ("b", {})])) is True
+    assert both(_turn([("a", {})])) is False
+
+
+def test_response_and_state_predicates():
+    from agenteval.requirements import compile_requirement
+    req = compile_requirement({"response": {"contains": "refunded"}, "state": {"status": {"in": ["refunded", "closed"]}}})
+    assert req(_turn(message="Your order was refunded", state={"status": "closed"})) is True
+    assert req(_turn(message="Your order was refunded", state={"status": "open"})) is False
+    assert req(_turn(message="Sorry", state={"status": "closed"})) is False
+
+
+def test_unknown_keys_rejected():
+    from agenteval.requirements import compile_requirement
+    with pytest.raises(ValueError, match="tool_caled"):
+        compile_requirement({"tool_caled": "x"})
+    with pytest.raises(ValueError):
+        compile_requirement({"any_of": [{"bogus": 1}]})
+
+
+def test_validate_dag_reports_bad_requirement():
+    from agenteval.models import Checkpoint, Scenario
+    from agenteval.scenario import validate_dag
+    scenario = Scenario(name="s", checkpoints=[Checkpoint(id="done", require={"tool": "x"})], success="done")
+    with pytest.raises(ValueError, match="done"):
+        validate_dag(scenario)
+
+
+@pytest.mark.asyncio
+async def test_runner_uses_compiled_requirements():
+    from agenteval.models import Checkpoint, Scenario
+    from agenteval.runner import execute_run
+    from tests.test_runner import MockAdapter
+    scenario = Scenario(
+        name="s", conversation_script=["a", "b"],
+        checkpoints=[
+            Checkpoint(id="resolved", require={"any_of": [{"tool_called": "refund"}, {"tool_called": "credit"}]}),
+            Checkpoint(id="done", depends_on=["resolved"], require={"state": {"closed": True}}),
+        ],
+        success="done",
+    )
+    adapter = MockAdapter([
+        AgentResponse(message="ok", tool_calls=[ToolCall(name="credit")]),
+        AgentResponse(message="bye", state_changes={"closed": True}),
+    ])
+    run = await execute_run(adapter, scenario)
+    assert run.success is True
+    assert [t.elapsed_checkpoints for t in run.turns] == [["resolved"], ["done"]]
@@ -67,3 +67,66 @@ async def test_run_k(scenario_2step):
     result = await run_scenarios(adapter, scenario_2step, k=1)
     assert result.k == 1
     assert result.pass_k == 1.0
+
+
+@pytest.mark.asyncio
+async def test_run_k_streams_runs(scenario_2step):
+    from agenteval.runner import run_scenarios
+    adapter = MockAdapter([AgentResponse(message="noop")])
+    seen = []
+
+    async def on_run(run):
+        seen.append(run.run_id)
+
+    result = await run_scenarios(adapter, scenario_2step, k=2, on_run=on_run, run_id_prefix="abc")
+    assert seen == ["abc-0", "abc-1"]
+    assert [r.run_id for r in result.runs] == seen
+
+
+@pytest.mark.asyncio
+async def test_run_k_reports_plugin_metrics(scenario_2step):
+    from agenteval.runner import run_scenarios
+    from agenteval.evaluators.base import BaseEvaluator
+
+    class RunCount(BaseEvaluator):
+        def evaluate(self, runs, scenario):
+            return len(runs)
+
+    adapter = MockAdapter([
+        AgentResponse(message="did 1", tool_calls=[ToolCall(name="action1")], state_changes={"counter": 1}),
+        AgentResponse(message="did 2", tool_calls=[ToolCall(name="action2")], state_changes={"counter": 2}),
+    ])
+    result = await run_scenarios(adapter, scenario_2step, k=2, evaluators={"run_count": RunCount()})
+    assert result.metrics == {"run_count": 2}
+    assert result.pass_k == 1.0
+
+
+@pytest.mark.asyncio
+async def test_run_k_reports_intervals_and_percentiles(scenario_2step):
+    from agenteval.runner import run_scenarios
+    adapter = MockAdapter([
+        AgentResponse(message="did 1", tool_calls=[ToolCall(name="action1", latency_ms=10)], state_changes={"counter": 1}),
+        AgentResponse(message="did 2", tool_calls=[ToolCall(name="action2", latency_ms=10)], state_changes={"counter": 2}),
+    ])
+    result = await run_scenarios(adapter, scenario_2step, k=3)
+    assert result.pass_k_ci == (1.0, 1.0)
+    assert result.percentiles["latency_ms"]["p90"] == 20.0
+    assert result.pass_k_curve == [1.0, 1.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_run_k_reports_events(scenario_2step):
+    from agenteval.runner import run_scenarios
+    adapter = MockAdapter([
+        AgentResponse(message="did 1", tool_calls=[ToolCall(name="action1")], metadata={"tokens": 7, "cost": 0.5}),
+        AgentResponse(message="did 2", tool_calls=[ToolCall(name="action2")], state_changes={"counter": 2}),
+    ])
+    events = []
+    result = await run_scenarios(adapter, scenario_2step, k=2, on_event=events.append, run_id_prefix="p")
+    assert [e.kind for e in events] == [
+        "scenario_started", "run_started", "turn", "turn", "run_finished",
+        "run_started", "turn", "turn", "run_finished",
+    ]
+    assert events[0].k == 2 and events[0].definition is scenario_2step
+    assert (events[2].run_id, events[2].tokens, events[2].cost) == ("p-0", 7, 0.5)
+    assert events[4].run is result.runs[0]
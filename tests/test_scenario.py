@@ -88,3 +88,150 @@ def test_load_scenario_dir(tmp_path):
     scenarios = load_scenarios_from_dir(str(tmp_path))
     assert len(scenarios) == 2
     assert {s.name for s in scenarios} == {"a", "b"}
+
+
+def _write_suite(directory, count):
+    directory.mkdir(exist_ok=True)
+    for i in range(count):
+        data = {"name": f"s{i}", "conversation_script": [f"hi {i}"],
+                "checkpoints": [{"id": "done"}], "success": "done"}
+        (directory / f"s{i:03d}.yaml").write_text(yaml.dump(data))
+
+
+def test_scenario_cache_serves_unchanged_files(tmp_path, monkeypatch):
+    import os
+    from agenteval import scenario as scenario_mod
+    suite = tmp_path / "suite"
+    _write_suite(suite, 3)
+    cache_path = tmp_path / "cache" / "scenarios.cache"
+    first = scenario_mod.load_scenarios_from_dir(str(suite), cache=cache_path)
+    assert cache_path.exists()
+
+    parsed = []
+    original = scenario_mod._parse_scenario
+    monkeypatch.setattr(scenario_mod, "_parse_scenario", lambda c: parsed.append(c) or original(c))
+    warm = scenario_mod.load_scenarios_from_dir(str(suite), cache=cache_path)
+    assert [s.name for s in warm] == [s.name for s in first] == ["s0", "s1", "s2"]
+    assert parsed == []
+
+    # Touched but identical content is still a hit; edited content is re-parsed.
+    os.utime(suite / "s000.yaml", ns=(1, 1))
+    (suite / "s001.yaml").write_text(yaml.dump({"name": "edited", "checkpoints": [{"id": "d"}], "success": "d"}))
+    (suite / "s002.yaml").unlink()
+    again = scenario_mod.load_scenarios_from_dir(str(suite), cache=cache_path)
+    assert [s.name for s in again] == ["s0", "edited"]
+    assert len(parsed) == 1
+    cache = scenario_mod.ScenarioCache(cache_path)
+    assert len(cache.entries) == 2
+
+
+def test_scenario_cache_ignores_other_versions_and_corruption(tmp_path, monkeypatch):
+    from agenteval import scenario as scenario_mod
+    suite = tmp_path / "suite"
+    _write_suite(suite, 1)
+    cache_path = tmp_path / "scenarios.cache"
+    cache_path.write_bytes(b"not a pickle")
+    assert scenario_mod.load_scenarios_from_dir(str(suite), cache=cache_path)[0].name == "s0"
+    assert scenario_mod.ScenarioCache(cache_path).entries
+    monkeypatch.setattr(scenario_mod, "__version__", "0.0.0-other")
+    assert scenario_mod.ScenarioCache(cache_path).entries == {}
+
+
+def test_scenario_cache_ignores_entries_from_another_model_schema(tmp_path, monkeypatch):
+    from agenteval import scenario as scenario_mod
+    suite = tmp_path / "suite"
+    _write_suite(suite, 1)
+    cache_path = tmp_path / "scenarios.cache"
+    scenario_mod.load_scenarios_from_dir(str(suite), cache=cache_path)
+    assert scenario_mod.ScenarioCache(cache_path).entries
+    # As if the cache had been written before a field such as Scenario.rubric existed.
+    monkeypatch.setattr(scenario_mod, "_schema_digest", lambda: "older-schema")
+    assert scenario_mod.ScenarioCache(cache_path).entries == {}
+
+
+def test_parallel_parse_matches_serial(tmp_path, monkeypatch):
+    from agenteval import scenario as scenario_mod
+    suite = tmp_path / "suite"
+    _write_suite(suite, 12)
+    monkeypatch.setattr(scenario_mod, "PARALLEL_MIN_FILES", 1)
+    parallel = scenario_mod.load_scenarios_from_dir(str(suite), workers=2)
+    serial = scenario_mod.load_scenarios_from_dir(str(suite), workers=1)
+    assert parallel == serial
+
+
+MATRIX_YAML = """
+name: "refund_{{ order_id }}"
+matrix:
+  order_id: [o1, o2, o3]
+  amount: [10, 250]
+conversation_script:
+  - "Refund order {{ order_id }}, it was ${{ amount }}"
+  - "{% if amount > 100 %}I need a manager{% else %}Thanks{% endif %}"
+initial_state:
+  orders: [{id: "{{ order_id }}", amount: "{{ amount }}"}]
+checkpoints:
+  - id: refunded
+    require: {tool_called: process_refund, tool_args: {order_id: "{{ order_id }}"}}
+success: refunded
+expected_final_state:
+  orders: [{id: "{{ order_id }}", status: refunded}]
+"""
+
+
+def test_matrix_expands_templates(tmp_path):
+    from agenteval.scenario import ScenarioTemplate, load_scenario_file
+    path = tmp_path / "refund.yaml"
+    path.write_text(MATRIX_YAML)
+    template = load_scenario_file(str(path))
+    assert isinstance(template, ScenarioTemplate)
+    assert len(template) == 6
+    variant = template[3]
+    assert variant.params == {"order_id": "o2", "amount": 250}
+    assert variant.name == "refund_o2"
+    assert variant.conversation_script == ["Refund order o2, it was $250", "I need a manager"]
+    assert variant.initial_state == {"orders": [{"id": "o2", "amount": 250}]}
+    assert variant.checkpoints[0].require["tool_args"] == {"order_id": "o2"}
+    assert variant.expected_final_state["orders"][0]["id"] == "o2"
+    assert [s.params for s in template][:2] == [{"order_id": "o1", "amount": 10}, {"order_id": "o1", "amount": 250}]
+
+
+def test_matrix_expansion_is_lazy(tmp_path, monkeypatch):
+    from agenteval import scenario as scenario_mod
+    data = yaml.safe_load(MATRIX_YAML)
+    data["matrix"] = {"order_id": [f"o{i}" for i in range(100)], "amount": list(range(100))}
+    built = []
+    original = scenario_mod._build_scenario
+    monkeypatch.setattr(scenario_mod, "_build_scenario", lambda d: built.append(1) or original(d))
+    template = scenario_mod.ScenarioTemplate(data)
+    assert len(template) == 10_000
+    shard = [template[i] for i in range(7, len(template), 2500)]
+    assert [s.params["amount"] for s in shard] == [7, 7, 7, 7]
+    assert len(built) == 4
+    assert template[-1].name == "refund_o99"
+    assert template.name(len(template) - 1) == "refund_o99"
+
+
+def test_matrix_dir_and_untemplated_names(tmp_path):
+    from agenteval.scenario import iter_scenario_refs, iter_scenarios, load_scenario, load_scenarios_from_dir
+    (tmp_path / "a.yaml").write_text(yaml.dump({
+        "name": "greet", "matrix": {"who": ["ann", "bob"]},
+        "conversation_script": ["hi {{ who }}"], "checkpoints": [{"id": "d"}], "success": "d",
+    }))
+    (tmp_path / "b.yaml").write_text(yaml.dump({"name": "plain", "checkpoints": [{"id": "d"}], "success": "d"}))
+    names = [s.name for s in load_scenarios_from_dir(str(tmp_path), cache=tmp_path / "cache")]
+    assert names == ["greet[who=ann]", "greet[who=bob]", "plain"]
+    assert [s.name for s in iter_scenarios(str(tmp_path), cache=tmp_path / "cache")] == names
+    refs = list(iter_scenario_refs(str(tmp_path), cache=tmp_path / "cache"))
+    assert [r.name for r in refs] == names
+    assert [r.build().name for r in refs] == names
+    with pytest.raises(ValueError, match="matrix"):
+        load_scenario(str(tmp_path / "a.yaml"))
+
+
+def test_matrix_undefined_variable_and_bad_axis():
+    from agenteval.scenario import ScenarioTemplate
+    template = ScenarioTemplate({"name": "x", "matrix": {"a": [1]}, "conversation_script": ["{{ b }}"]})
+    with pytest.raises(Exception, match="b"):
+        template[0]
+    with pytest.raises(ValueError):
+        ScenarioTemplate({"name": "x", "matrix": {"a": []}})
@@ -0,0 +1,62 @@
+import pytest
+
+from agenteval.models import Checkpoint, Scenario
+
+
+def _scenario(name, tags=()):
+    return Scenario(name=name, conversation_script=["hi"], checkpoints=[Checkpoint(id="d")],
+                    success="d", tags=list(tags))
+
+
+def test_filter_by_tags():
+    from agenteval.selection import filter_by_tags
+    suite = [_scenario("a", ["smoke"]), _scenario("b", ["slow"]), _scenario("c", ["smoke", "slow"]), _scenario("d")]
+    assert [s.name for s in filter_by_tags(suite)] == ["a", "b", "c", "d"]
+    assert [s.name for s in filter_by_tags(suite, tags=["smoke"])] == ["a", "c"]
+    assert [s.name for s in filter_by_tags(suite, exclude_tags=["slow"])] == ["a", "d"]
+    assert [s.name for s in filter_by_tags(suite, tags=["smoke"], exclude_tags=["slow"])] == ["a"]
+
+
+def test_parse_shard():
+    from agenteval.selection import parse_shard
+    assert parse_shard("2/4") == (2, 4)
+    for bad in ("0/4", "5/4", "4", "a/b", "1/0"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_shards_partition_suite_and_balance_durations():
+    from agenteval.selection import shard_scenarios
+    suite = [_scenario(f"s{i}") for i in range(10)]
+    durations = {f"s{i}": float(d) for i, d in enumerate([9, 1, 1, 1, 1, 1, 1, 1, 1, 1])}
+    shards = [shard_scenarios(suite, i, 2, durations) for i in (1, 2)]
+    assert sorted(s.name for shard in shards for s in shard) == sorted(s.name for s in suite)
+    loads = [sum(durations[s.name] for s in shard) for shard in shards]
+    assert loads == [9.0, 9.0]
+    # Deterministic, and each shard keeps file order.
+    assert shard_scenarios(suite, 2, 2, durations) == shards[1]
+    assert [s.name for s in shards[1]] == sorted((s.name for s in shards[1]), key=lambda n: int(n[1:]))
+
+
+def test_shards_without_history_split_evenly():
+    from agenteval.selection import shard_scenarios
+    suite = [_scenario(f"s{i}") for i in range(7)]
+    sizes = [len(shard_scenarios(suite, i, 3)) for i in (1, 2, 3)]
+    assert sorted(sizes) == [2, 2, 3]
+
+
+def test_unknown_durations_default_to_median():
+    from agenteval.selection import estimate_durations
+    suite = [_scenario("a"), _scenario("b"), _scenario("c"), _scenario("new")]
+    assert estimate_durations(suite, {"a": 1.0, "b": 5.0, "c": 9.0}) == [1.0, 5.0, 9.0, 5.0]
+    assert estimate_durations(suite, {}) == [1.0] * 4
+
+
+def test_order_longest_first():
+    from agenteval.selection import order_scenarios
+    suite = [_scenario("a"), _scenario("b"), _scenario("c")]
+    durations = {"a": 1.0, "b": 30.0, "c": 5.0}
+    assert [s.name for s in order_scenarios(suite, "longest", durations)] == ["b", "c", "a"]
+    assert order_scenarios(suite, "file", durations) == suite
+    with pytest.raises(ValueError):
+        order_scenarios(suite, "random")
@@ -0,0 +1,249 @@
+import asyncio
+import multiprocessing
+
+import pytest
+
+from agenteval.models import AgentResponse, EvalResult, Run, Turn
+
+
+def _run(run_id, success=True):
+    return Run(run_id=run_id, scenario="refund", success=success, total_cost=0.01,
+               checkpoints_reached=["a"], final_state={"status": "refunded"},
+               turns=[Turn(turn_id=0, user_message="hi", agent_response=AgentResponse(message="ok"),
+                           cumulative_state={"status": "refunded"})])
+
+
+@pytest.mark.asyncio
+async def test_save_and_query(tmp_path):
+    from agenteval.storage.log import SegmentLogBackend
+    log = SegmentLogBackend(tmp_path / "log", sync_every=2)
+    await log.init()
+    await log.save_run(_run("r1"), project="proj", tags=["nightly"])
+    await log.save_run(_run("r2", success=False), project="proj")
+    await log.save_result(EvalResult(project="proj", scenario="refund", k=2, pass_k=0.5,
+                                     runs=[_run("r1"), _run("r2")]))
+
+    runs = await log.load_runs("proj", scenario="refund")
+    assert [r["run_id"] for r in runs] == ["r1", "r2"]
+    assert runs[0]["final_state_json"] == '{"status": "refunded"}'
+    assert [r["run_id"] async for r in log.iter_runs("proj", success=False)] == ["r2"]
+    assert [r["run_id"] async for r in log.iter_runs("proj", tag="nightly")] == ["r1"]
+    results = await log.load_results("proj")
+    assert results[0]["pass_k"] == 0.5
+    assert "forbidden_violations" in results[0]
+    await log.close()
+    assert len(list((tmp_path / "log").glob("*.idx"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_segments_rotate_and_compact_into_sqlite(tmp_path):
+    from agenteval.storage.log import SegmentLogBackend
+    from agenteval.store import Store
+    log = SegmentLogBackend(tmp_path / "log", segment_bytes=1000)
+    await log.init()
+    for i in range(10):
+        await log.save_run(_run(f"r{i}"), project="proj", created_at=f"2024-01-01T00:00:{i:02d}+00:00")
+    await log.save_result(EvalResult(project="proj", scenario="refund", k=10,
+                                     runs=[_run(f"r{i}") for i in range(10)]))
+    sealed = len(list((tmp_path / "log").glob("*.idx")))
+    assert sealed > 1
+
+    store = Store(str(tmp_path / "runs.db"))
+    await store.init()
+    first = await log.compact_into(store)
+    assert first["segments"] == sealed
+    await log.close()
+    counts = await log.compact_into(store)
+    assert first["runs"] + counts["runs"] == 10
+    assert first["results"] + counts["results"] == 1
+    assert list((tmp_path / "log").iterdir()) == []
+
+    (stored,) = await store.load_results("proj")
+    linked = [r async for r in store.iter_runs("proj", result_id=stored["result_id"])]
+    assert [r["run_id"] for r in linked] == [f"r{i}" for i in range(10)]
+    assert linked[0]["created_at"] == "2024-01-01T00:00:00+00:00"
+    assert (await store.load_turns("r3"))[0].cumulative_state == {"status": "refunded"}
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_compact_into_skips_already_imported_records(tmp_path):
+    from agenteval.storage.log import SegmentLogBackend
+    from agenteval.store import Store
+    log = SegmentLogBackend(tmp_path / "log")
+    await log.init()
+    for i in range(3):
+        await log.save_run(_run(f"r{i}"), project="proj")
+    await log.save_result(EvalResult(project="proj", scenario="refund", k=3,
+                                     runs=[_run(f"r{i}") for i in range(3)]))
+    await log.close()
+
+    store = Store(str(tmp_path / "runs.db"))
+    await store.init()
+    try:
+        first = await log.compact_into(store, delete=False)
+        again = await log.compact_into(store, delete=False)
+        assert (first["runs"], first["results"], first["skipped"]) == (3, 1, 0)
+        assert (again["runs"], again["results"], again["skipped"]) == (0, 0, 4)
+        (stored,) = await store.load_results("proj")
+        linked = [r["run_id"] async for r in store.iter_runs("proj", result_id=stored["result_id"])]
+        assert linked == ["r0", "r1", "r2"]
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_compact_into_links_runs_from_other_segments(tmp_path):
+    from agenteval.storage.log import SegmentLogBackend
+    from agenteval.store import Store
+    # The result's writer sorts first; its runs sit in another writer's segment.
+    results_writer = SegmentLogBackend(tmp_path / "log")
+    results_writer._writer_id = "a"
+    runs_writer = SegmentLogBackend(tmp_path / "log")
+    runs_writer._writer_id = "b"
+    await results_writer.init()
+    for i in range(3):
+        await runs_writer.save_run(_run(f"r{i}"), project="proj")
+    await results_writer.save_result(EvalResult(project="proj", scenario="refund", k=3,
+                                                runs=[_run(f"r{i}") for i in range(3)]))
+    await results_writer.close()
+
+    store = Store(str(tmp_path / "runs.db"))
+    await store.init()
+    try:
+        assert (await results_writer.compact_into(store, delete=False))["results"] == 1
+        (stored,) = await store.load_results("proj")
+        assert [r async for r in store.iter_runs("proj", result_id=stored["result_id"])] == []
+        # Once the runs' segment is sealed, compacting again links them to the already imported result.
+        await runs_writer.close()
+        counts = await results_writer.compact_into(store)
+        assert (counts["runs"], counts["results"]) == (3, 0)
+        linked = [r["run_id"] async for r in store.iter_runs("proj", result_id=stored["result_id"])]
+        assert linked == ["r0", "r1", "r2"]
+    finally:
+        await store.close()
+
+    log = SegmentLogBackend(tmp_path / "other")
+    log._writer_id = "b"
+    await log.init()
+    for i in range(2):
+        await log.save_run(_run(f"s{i}"), project="proj")
+    await log.close()
+    late = SegmentLogBackend(tmp_path / "other")
+    late._writer_id = "a"
+    await late.save_result(EvalResult(project="proj", scenario="refund", k=2, runs=[_run("s0"), _run("s1")]))
+    await late.close()
+    store = Store(str(tmp_path / "other.db"))
+    await store.init()
+    try:
+        await late.compact_into(store)
+        (stored,) = await store.load_results("proj")
+        linked = [r["run_id"] async for r in store.iter_runs("proj", result_id=stored["result_id"])]
+        assert linked == ["s0", "s1"]
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_log_iter_runs_of_a_result(tmp_path):
+    from agenteval.storage.log import SegmentLogBackend
+    log = SegmentLogBackend(tmp_path / "log")
+    await log.init()
+    for i in range(4):
+        await log.save_run(_run(f"r{i}"), project="proj")
+    await log.save_result(EvalResult(project="proj", scenario="refund", k=2, runs=[_run("r0"), _run("r1")]))
+    await log.save_result(EvalResult(project="proj", scenario="refund", k=2, runs=[_run("r2"), _run("r3")]))
+    latest, earlier = await log.load_results("proj")
+    assert [r["run_id"] async for r in log.iter_runs("proj", result_id=earlier["result_id"])] == ["r0", "r1"]
+    runs = [r async for r in log.iter_runs("proj", result_id=latest["result_id"])]
+    assert [r["run_id"] for r in runs] == ["r2", "r3"] and runs[0]["result_id"] == latest["result_id"]
+    assert [r async for r in log.iter_runs("proj", result_id="missing:0")] == []
+    await log.close()
+
+
+@pytest.mark.asyncio
+async def test_queries_reuse_parsed_indexes_and_scan_only_new_tails(tmp_path, monkeypatch):
+    import json
+    import agenteval.storage.log as log_mod
+    from agenteval.storage.log import SegmentLogBackend
+    writer = SegmentLogBackend(tmp_path / "log")
+    await writer.init()
+    await writer.save_result(EvalResult(project="proj", scenario="refund", k=1, fingerprint="a"))
+    await writer.close()
+    other = tmp_path / "log" / "crashed-000001.jsonl"  # a writer that never sealed its segment
+    record = {"type": "result", "project": "proj", "created_at": "2024-01-01T00:00:00+00:00",
+              "result": EvalResult(project="proj", scenario="greet", k=1, fingerprint="b").model_dump(mode="json"),
+              "run_ids": []}
+    other.write_text(json.dumps(record) + "\n")
+
+    reader = SegmentLogBackend(tmp_path / "log")
+    index_reads, scans = [], []
+    original_read_text, original_read_entries = log_mod.Path.read_text, log_mod._read_entries
+    monkeypatch.setattr(log_mod.Path, "read_text", lambda p: index_reads.append(p) or original_read_text(p))
+    monkeypatch.setattr(log_mod, "_read_entries",
+                        lambda p, offset=0: scans.append(offset) or original_read_entries(p, offset))
+    for _ in range(3):
+        assert (await reader.find_result("proj", "refund", "a")).scenario == "refund"
+        assert (await reader.find_result("proj", "greet", "b")).scenario == "greet"
+    assert len(index_reads) == 1
+    assert scans[0] == 0 and set(scans[1:]) == {other.stat().st_size}
+
+    with open(other, "a") as f:
+        f.write(json.dumps({**record, "result": {**record["result"], "scenario": "late"}}) + "\n")
+    assert await reader.find_result("proj", "late", "b") is not None
+    assert len(index_reads) == 1
+
+
+def _ingest(directory, worker):
+    from agenteval.storage.log import SegmentLogBackend
+
+    async def _write():
+        log = SegmentLogBackend(directory, segment_bytes=2000)
+        await log.init()
+        for i in range(20):
+            await log.save_run(_run(f"w{worker}-{i}"), project="proj")
+        await log.close()
+
+    asyncio.run(_write())
+
+
+def test_concurrent_writers(tmp_path):
+    from agenteval.storage.log import SegmentLogBackend
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=_ingest, args=(str(tmp_path), w)) for w in range(3)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=60)
+    assert all(p.exitcode == 0 for p in procs)
+
+    async def _count():
+        return await SegmentLogBackend(tmp_path).load_runs("proj")
+
+    runs = asyncio.run(_count())
+    assert len(runs) == 60
+    assert len({r["run_id"] for r in runs}) == 60
+
+
+@pytest.mark.asyncio
+async def test_log_find_result_by_fingerprint(tmp_path):
+    from agenteval.storage.log import SegmentLogBackend
+    log = SegmentLogBackend(tmp_path / "log")
+    await log.init()
+    await log.save_result(EvalResult(project="proj", scenario="refund", k=2, pass_k=0.5, fingerprint="abc"))
+    assert (await log.find_result("proj", "refund", "abc")).pass_k == 0.5
+    await log.close()
+    assert (await log.find_result("proj", "refund", "abc")).pass_k == 0.5
+    assert await log.find_result("proj", "refund", "zzz") is None
+
+
+@pytest.mark.asyncio
+async def test_log_scenario_durations(tmp_path):
+    from agenteval.storage.log import SegmentLogBackend
+    log = SegmentLogBackend(tmp_path / "log")
+    await log.init()
+    for total in (100.0, 300.0, 600.0):
+        await log.save_result(EvalResult(project="proj", scenario="slow", k=2, duration_ms=total))
+    await log.save_result(EvalResult(project="proj", scenario="untimed", k=1))
+    assert await log.scenario_durations("proj", last=2) == {"slow": 225.0}
+    await log.close()
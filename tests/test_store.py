@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from agenteval.models import Run, EvalResult
 
@@ -31,6 +33,27 @@ async def test_save_and_load_run(db_path):
     await store.close()
 
 
+@pytest.mark.asyncio
+async def test_save_run_writes_the_run_row_once(db_path):
+    from agenteval.models import AgentResponse, Turn
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    try:
+        statements = []
+        await store._db.set_trace_callback(statements.append)
+        await store.save_run(Run(run_id="r1", scenario="refund", success=True, final_state={"done": True},
+                                 turns=[Turn(turn_id=0, user_message="hi", agent_response=AgentResponse(message="ok"),
+                                             cumulative_state={"done": True})]), project="proj")
+        await store._db.set_trace_callback(None)
+        writes = [s for s in statements if s.startswith(("INSERT INTO runs", "UPDATE runs"))]
+        assert len(writes) == 1 and writes[0].startswith("INSERT")
+        (turn,) = await store.load_turns("r1")
+        assert turn.cumulative_state == {"done": True}
+    finally:
+        await store.close()
+
+
 @pytest.mark.asyncio
 async def test_save_and_load_result(db_path):
     from agenteval.store import Store
@@ -46,3 +69,367 @@ async def test_save_and_load_result(db_path):
     assert len(results) == 1
     assert results[0]["pass_k"] == 0.67
     await store.close()
+
+
+def _run_with_tools(run_id="r1"):
+    from agenteval.models import AgentResponse, ToolCall, Turn
+    return Run(run_id=run_id, scenario="refund", success=False, turns=[
+        Turn(turn_id=0, user_message="hi", elapsed_checkpoints=["lookup"],
+             agent_response=AgentResponse(
+                 message="looking", metadata={"tokens": 10},
+                 tool_calls=[ToolCall(name="lookup_order", arguments={"order_id": "o1"},
+                                      result={"found": True}, latency_ms=5.0)])),
+        Turn(turn_id=1, user_message="refund", agent_response=AgentResponse(
+            message="failed", tool_calls=[ToolCall(name="process_refund",
+                                                   result={"success": False, "error": "nope"})])),
+    ])
+
+
+@pytest.mark.asyncio
+async def test_save_run_normalizes_tool_calls(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    await store.save_run(_run_with_tools(), project="proj")
+    await store.save_run(_run_with_tools(), project="proj")
+    calls = await store.load_tool_calls(project="proj")
+    assert [c["name"] for c in calls] == ["lookup_order", "process_refund"]
+    failed = await store.load_tool_calls(project="proj", failed=True)
+    assert len(failed) == 1
+    assert failed[0]["result"] == {"success": False, "error": "nope"}
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_migrates_legacy_schema(db_path):
+    import json
+    import sqlite3
+    from agenteval.store import SCHEMA_VERSION, Store
+    legacy = sqlite3.connect(db_path)
+    legacy.executescript("""
+        CREATE TABLE runs (
+            run_id TEXT PRIMARY KEY, project TEXT NOT NULL, scenario TEXT NOT NULL,
+            success INTEGER NOT NULL, total_tokens INTEGER DEFAULT 0,
+            total_cost REAL DEFAULT 0.0, total_latency_ms REAL DEFAULT 0.0,
+            checkpoints_reached TEXT DEFAULT '[]', turns_json TEXT DEFAULT '[]',
+            final_state_json TEXT DEFAULT '{}', created_at TEXT NOT NULL);
+    """)
+    turns = json.dumps([t.model_dump() for t in _run_with_tools().turns])
+    legacy.execute("INSERT INTO runs VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+                   ("r1", "proj", "refund", 0, 0, 0.0, 0.0, "[]", turns, "{}", "2024-01-01"))
+    legacy.commit()
+    legacy.close()
+
+    store = Store(db_path)
+    await store.init()
+    calls = await store.load_tool_calls(project="proj", name="process_refund")
+    assert calls[0]["failed"] is True
+    cursor = await store._db.execute("PRAGMA user_version")
+    assert (await cursor.fetchone())[0] == SCHEMA_VERSION
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_runs_paginates_and_filters(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    for i in range(7):
+        run = Run(run_id=f"r{i}", scenario="refund", success=i % 2 == 0)
+        await store.save_run(run, project="proj", tags=["nightly"] if i < 3 else [])
+
+    ids = [r["run_id"] async for r in store.iter_runs("proj", page_size=2)]
+    assert ids == [f"r{i}" for i in range(7)]
+    passed = [r async for r in store.iter_runs("proj", success=True, page_size=2)]
+    assert [r["run_id"] for r in passed] == ["r0", "r2", "r4", "r6"]
+    assert all(r["success"] is True for r in passed)
+    tagged = [r["run_id"] async for r in store.iter_runs("proj", tag="nightly")]
+    assert tagged == ["r0", "r1", "r2"]
+
+    first = [r async for r in store.iter_runs("proj", columns=["total_cost"], page_size=3)][2]
+    assert set(first) == {"created_at", "run_id", "total_cost"}
+    resumed = [r["run_id"] async for r in store.iter_runs(
+        "proj", after=(first["created_at"], first["run_id"]))]
+    assert resumed == ["r3", "r4", "r5", "r6"]
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_load_turns_lazily(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    await store.save_run(_run_with_tools(), project="proj")
+    record = [r async for r in store.iter_runs("proj")][0]
+    assert "turns" not in record and "turns_json" not in record
+    turns = await store.load_turns(record["run_id"])
+    assert turns[1].agent_response.tool_calls[0].name == "process_refund"
+    with pytest.raises(ValueError):
+        [r async for r in store.iter_runs("proj", columns=["nope"])]
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_results_descending(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    for pass_k in (0.1, 0.2, 0.3):
+        await store.save_result(EvalResult(project="proj", scenario="refund", k=3, pass_k=pass_k))
+    rows = [r async for r in store.iter_results("proj", columns=["pass_k"], descending=True, page_size=2)]
+    assert [r["pass_k"] for r in rows] == [0.3, 0.2, 0.1]
+    await store.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compression", ["none", "zlib"])
+async def test_payload_round_trip(db_path, compression):
+    from agenteval.store import Store
+    store = Store(db_path, compression=compression)
+    await store.init()
+    run = _run_with_tools()
+    run.final_state = {"orders": [{"id": "o1", "status": "refunded"}]}
+    await store.save_run(run, project="proj")
+    record = [r async for r in store.iter_runs("proj", columns=["final_state_json"])][0]
+    assert record["final_state"] == run.final_state
+    assert "payload_format" not in record
+    assert await store.load_turns("r1") == run.turns
+    legacy = (await store.load_runs("proj"))[0]
+    assert legacy["turns_json"].startswith("[")
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_compact_rewrites_legacy_rows(db_path):
+    from agenteval.store import Store
+    plain = Store(db_path, compression="none")
+    await plain.init()
+    await plain.save_run(_run_with_tools(), project="proj")
+    await plain.close()
+
+    store = Store(db_path, compression="zlib")
+    await store.init()
+    assert await store.compact() == 1
+    assert await store.compact() == 0
+    cursor = await store._db.execute("SELECT payload_format, typeof(turns_json) FROM runs")
+    assert await cursor.fetchone() == (1, "blob")
+    assert (await store.load_turns("r1"))[0].user_message == "hi"
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_compact_zstd_trains_project_dictionary(db_path):
+    pytest.importorskip("zstandard")
+    from agenteval.store import Store
+    store = Store(db_path, compression="zstd")
+    await store.init()
+    for i in range(200):
+        run = _run_with_tools(run_id=f"r{i}")
+        run.final_state = {"orders": [{"id": f"o{i}", "status": "refunded", "amount": i}]}
+        await store.save_run(run, project="proj")
+    assert await store.compact(project="proj") == 200
+    cursor = await store._db.execute("SELECT COUNT(*) FROM runs WHERE dict_id IS NOT NULL")
+    assert (await cursor.fetchone())[0] == 200
+    record = [r async for r in store.iter_runs("proj", columns=["final_state_json"])][5]
+    assert record["final_state"]["orders"][0]["amount"] == 5
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_gc_prunes_payloads_and_old_runs(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    for i in range(5):
+        await store.save_run(_run_with_tools(run_id=f"r{i}"), project="proj")
+    await store.save_result(EvalResult(project="proj", scenario="refund", k=5))
+    await store._db.execute("UPDATE runs SET created_at = '2000-01-01' WHERE run_id IN ('r0','r1')")
+    await store._db.execute("UPDATE runs SET created_at = '1990-01-01' WHERE run_id = 'r2'")
+    await store._db.commit()
+
+    from datetime import datetime
+    stats = await store.gc(payload_days=30, run_days=(datetime.now() - datetime(1995, 1, 1)).days,
+                           batch_size=1)
+    assert stats["deleted_runs"] == 1
+    assert stats["pruned_payloads"] == 2
+    records = {r["run_id"]: r async for r in store.iter_runs("proj", columns=["success", "turns_json"])}
+    assert set(records) == {"r0", "r1", "r3", "r4"}
+    assert records["r0"]["turns"] == [] and len(records["r3"]["turns"]) == 2
+    assert await store.load_turns("r0") == []
+    assert {c["run_id"] for c in await store.load_tool_calls("proj")} == {"r3", "r4"}
+    assert len(await store.load_results("proj")) == 1
+    assert (await store.gc(payload_days=30))["pruned_payloads"] == 0
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_gc_incremental_vacuum_shrinks_file(db_path):
+    import os
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    for i in range(50):
+        run = _run_with_tools(run_id=f"r{i}")
+        run.final_state = {"blob": os.urandom(4096).hex()}
+        await store.save_run(run, project="proj")
+    await store._db.execute("UPDATE runs SET created_at = '2000-01-01'")
+    await store._db.commit()
+    cursor = await store._db.execute("PRAGMA freelist_count")
+    free_before = (await cursor.fetchone())[0]
+    stats = await store.gc(payload_days=1, vacuum_pages=10)
+    assert stats["pruned_payloads"] == 50
+    assert stats["vacuumed_pages"] > 0
+    # Each step frees a full batch of pages, not one page per pragma call.
+    assert stats["vacuum_steps"] == -(-stats["vacuumed_pages"] // 10)
+    assert stats["vacuumed_pages"] >= free_before
+    cursor = await store._db.execute("PRAGMA freelist_count")
+    assert (await cursor.fetchone())[0] == 0
+    await store.close()
+
+
+def _stateful_run(run_id, catalog):
+    from agenteval.models import AgentResponse, Turn
+    turns = []
+    state = {"catalog": catalog, "status": "new"}
+    for i, status in enumerate(["looked_up", "verified", "refunded"]):
+        state = {**state, "status": status, f"step{i}": True}
+        turns.append(Turn(turn_id=i, user_message="m", agent_response=AgentResponse(message="r"),
+                          cumulative_state=state))
+    return Run(run_id=run_id, scenario="refund", turns=turns, final_state=state)
+
+
+@pytest.mark.asyncio
+async def test_states_are_deduplicated_snapshots(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    catalog = [{"sku": f"item-{i}", "price": i} for i in range(200)]
+    for i in range(5):
+        await store.save_run(_stateful_run(f"r{i}", catalog), project="proj")
+
+    cursor = await store._db.execute("SELECT COUNT(*), COUNT(base_hash) FROM snapshots")
+    assert await cursor.fetchone() == (3, 2)
+    original = _stateful_run("r3", catalog)
+    assert await store.load_turns("r3") == original.turns
+    records = [r async for r in store.iter_runs("proj", columns=["turns_json", "final_state_json"])]
+    assert records[3]["final_state"] == original.final_state
+    assert records[3]["turns"][0].cumulative_state["status"] == "looked_up"
+    legacy = await store.load_runs("proj")
+    assert json.loads(legacy[0]["final_state_json"]) == original.final_state
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_gc_sweeps_unreferenced_snapshots(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    await store.save_run(_stateful_run("old", [1]), project="proj")
+    await store.save_run(_stateful_run("new", [2]), project="proj")
+    await store._db.execute("UPDATE runs SET created_at = '2000-01-01' WHERE run_id = 'old'")
+    await store._db.commit()
+    stats = await store.gc(payload_days=1)
+    assert stats["deleted_snapshots"] == 3
+    assert (await store.load_turns("new"))[2].cumulative_state["catalog"] == [2]
+    await store.close()
+
+
+async def _seed_results(store, scenario, values, metric="pass_k"):
+    for value in values:
+        await store.save_result(EvalResult(project="proj", scenario=scenario, k=3, **{metric: value}))
+
+
+@pytest.mark.asyncio
+async def test_trend_moving_average(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    await _seed_results(store, "refund", [0.0, 0.2, 0.4, 0.6, 0.8])
+    points = await store.trend("proj", "refund", last=4, window=2)
+    assert [p["value"] for p in points] == [0.2, 0.4, 0.6, 0.8]
+    assert [round(p["moving_avg"], 2) for p in points] == [0.2, 0.3, 0.5, 0.7]
+    summary = await store.trend_summary("proj", last=3)
+    assert summary == [{"scenario": "refund", "n": 3, "latest": 0.8, "mean": pytest.approx(0.6),
+                        "min": 0.4, "max": 0.8}]
+    with pytest.raises(ValueError):
+        await store.trend("proj", "refund", metric="pass_k; DROP TABLE runs")
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_regressions_against_baseline(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    await _seed_results(store, "stable", [0.9, 0.9, 0.9], metric="tool_accuracy")
+    await _seed_results(store, "dropped", [1.0, 1.0, 0.5], metric="tool_accuracy")
+    await _seed_results(store, "new", [0.1], metric="tool_accuracy")
+    found = await store.regressions("proj", metric="tool_accuracy", baseline=2, threshold=0.1)
+    assert [(r["scenario"], r["delta"]) for r in found] == [("dropped", -0.5)]
+    await _seed_results(store, "pricey", [0.01, 0.05], metric="avg_cost")
+    found = await store.regressions("proj", metric="avg_cost", baseline=2)
+    assert [r["scenario"] for r in found] == ["pricey"]
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_find_result_by_fingerprint(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    try:
+        await store.save_result(EvalResult(project="proj", scenario="refund", k=3, pass_k=0.5,
+                                           pass_k_curve=[0.5, 0.2], fingerprint="abc"),
+                                created_at="2024-01-01T00:00:00+00:00")
+        await store.save_result(EvalResult(project="proj", scenario="refund", k=3, pass_k=0.9,
+                                           pass_k_curve=[0.9, 0.8], fingerprint="abc"),
+                                created_at="2024-01-02T00:00:00+00:00")
+        found = await store.find_result("proj", "refund", "abc")
+        assert found.pass_k == 0.9 and found.pass_k_curve == [0.9, 0.8]
+        assert await store.find_result("proj", "refund", "other") is None
+        assert await store.find_result("proj", "other", "abc") is None
+        (latest, _) = await store.load_results("proj")
+        assert latest["fingerprint"] == "abc" and "details_json" not in latest
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_scenario_durations_average_recent_results(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    try:
+        for day, total in enumerate([100.0, 300.0, 600.0], start=1):
+            await store.save_result(EvalResult(project="proj", scenario="slow", k=2, duration_ms=total),
+                                    created_at=f"2024-01-0{day}T00:00:00+00:00")
+        await store.save_result(EvalResult(project="proj", scenario="fast", k=1, duration_ms=10.0))
+        await store.save_result(EvalResult(project="proj", scenario="untimed", k=1))
+        assert await store.scenario_durations("proj", last=2) == {"slow": 225.0, "fast": 10.0}
+        assert await store.scenario_durations("proj", last=2, until="2024-01-03T00:00:00+00:00") == {"slow": 100.0}
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_latest_results_per_agent_version_use_index(db_path):
+    from agenteval.store import Store
+    store = Store(db_path)
+    await store.init()
+    try:
+        for day, (scenario, version, pass_k) in enumerate(
+            [("refund", "v1", 0.1), ("refund", "v1", 0.2), ("refund", "v2", 0.3), ("greet", "v1", 0.4)], start=1,
+        ):
+            await store.save_result(EvalResult(project="proj", scenario=scenario, k=1, pass_k=pass_k,
+                                               agent_version=version),
+                                    created_at=f"2024-01-0{day}T00:00:00+00:00")
+        latest = await store.latest_results("proj", "v1")
+        assert [(r["scenario"], r["pass_k"]) for r in latest] == [("greet", 0.4), ("refund", 0.2)]
+        assert await store.latest_results("proj", "v3") == []
+        cursor = await store._db.execute(
+            "EXPLAIN QUERY PLAN SELECT result_id FROM results WHERE project = ? AND agent_version = ?",
+            ("proj", "v1"),
+        )
+        assert "idx_results_agent_version" in " ".join(row[-1] for row in await cursor.fetchall())
+    finally:
+        await store.close()